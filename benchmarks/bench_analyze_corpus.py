@@ -0,0 +1,33 @@
+"""
+Benchmark analyze_corpus() throughput from 1 worker up to one per CPU.
+
+Run with ``python benchmarks/bench_analyze_corpus.py [tokens] [analysis]``.
+"""
+
+import os
+import sys
+import time
+from collections import deque
+
+from sanskrit_grammar.corpus import analyze_corpus
+
+WORDS = ["गच्छति", "प्रतिगच्छति", "भवन्ति", "रामस्य", "देवेन", "उपगच्छन्ति", "पठामि", "नयति",
+         "करोति", "फलम्", "अनुभवामि", "सीतायाः", "वनम्", "गमिष्यति", "लभते", "सेवते"]
+
+
+def main(count=200_000, analysis="morphology"):
+    tokens = [WORDS[index % len(WORDS)] for index in range(count)]
+    cores = os.cpu_count() or 1
+    print(f"tokens: {count:,}, analysis: {analysis}, CPUs: {cores}")
+    baseline = None
+    for workers in sorted({1, 2, cores} | set(range(2, cores + 1, 2))):
+        start = time.perf_counter()
+        deque(analyze_corpus(tokens, workers=workers, chunksize=512, analysis=analysis), maxlen=0)
+        rate = count / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f"workers {workers:>3}: {rate:>10,.0f} tokens/s ({rate / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+         sys.argv[2] if len(sys.argv) > 2 else "morphology")
@@ -0,0 +1,58 @@
+"""
+Benchmark vectorized ending classification (needs NumPy) against the
+per-token detectors.
+
+Run with ``python benchmarks/bench_classify_endings.py [tokens]``.
+"""
+
+import random
+import sys
+import time
+
+from sanskrit_grammar import detect_tense_and_pada_many
+from sanskrit_grammar.morphological_analyzer import identify_pratyaya, identify_pratyaya_many
+from sanskrit_grammar.vectorized import classify_pratyayas, classify_tenses
+
+CONSONANTS = "कगचजतदनपबमयरलवशसह"
+VOWEL_SIGNS = ["", "ा", "ि", "ु", "े", "ो"]
+ENDINGS = ["ति", "न्ति", "सि", "ते", "न्ते", "ष्यति", "तु", "न्तु", "ताम्", "म्", "ः", "स्य", "एण", "आय", ""]
+
+
+def make_tokens(count, seed=0):
+    """Mostly distinct tokens: two random syllables, a consonant and an ending."""
+    rng = random.Random(seed)
+    syllables = [consonant + sign for consonant in CONSONANTS for sign in VOWEL_SIGNS]
+    return [rng.choice(syllables) + rng.choice(syllables) + rng.choice(CONSONANTS) + rng.choice(ENDINGS)
+            for _ in range(count)]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(count=1_000_000):
+    tokens = make_tokens(count)
+
+    columns, per_token = timed(lambda: detect_tense_and_pada_many(tokens))
+    (lakara, pada), vectorized = timed(lambda: classify_tenses(tokens))
+    assert lakara.tolist() == columns.lakara.tolist() and pada.tolist() == columns.pada.tolist()
+
+    sample = tokens[: max(1, count // 10)]
+    _, pratyaya_loop = timed(lambda: [identify_pratyaya(token) for token in sample])
+    pratyaya_loop *= len(tokens) / len(sample)
+    _, pratyaya_batch = timed(lambda: identify_pratyaya_many(tokens))
+    _, pratyaya_vectorized = timed(lambda: classify_pratyayas(tokens))
+
+    print(f"tokens:                     {len(tokens):,}")
+    print(f"detect_tense_and_pada_many: {per_token:.2f} s")
+    print(f"classify_tenses:            {vectorized:.2f} s ({per_token / vectorized:.1f}x faster)")
+    print(f"identify_pratyaya loop:     {pratyaya_loop:.2f} s (estimated from {len(sample):,} tokens)")
+    print(f"identify_pratyaya_many:     {pratyaya_batch:.2f} s")
+    print(f"classify_pratyayas:         {pratyaya_vectorized:.2f} s "
+          f"({pratyaya_loop / pratyaya_vectorized:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
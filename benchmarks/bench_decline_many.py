@@ -0,0 +1,53 @@
+"""
+Benchmark bulk noun declension against one generate_noun_forms() call per
+stem.
+
+Run with ``python benchmarks/bench_decline_many.py [stems]``.
+"""
+
+import io
+import sys
+import time
+
+from sanskrit_grammar.morphology import decline_many, generate_noun_forms, write_declensions
+
+CONSONANTS = "कगचजतदनपबमयरलवशसह"
+VOWEL_SIGNS = ["", "ा", "ि", "ु", "े", "ो"]
+
+
+def make_stems(count):
+    """Distinct three-syllable a-stems."""
+    syllables = [consonant + sign for consonant in CONSONANTS for sign in VOWEL_SIGNS]
+    stems = [first + second + last
+             for first in syllables for second in syllables for last in CONSONANTS]
+    return stems[:count]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(count=100_000):
+    stems = make_stems(count)
+    sample = stems[: max(1, count // 10)]
+
+    table, bulk = timed(lambda: decline_many(stems, "m"))
+    _, single = timed(lambda: [generate_noun_forms(stem, "m") for stem in sample])
+    single *= len(stems) / len(sample)
+    buffer = io.StringIO()
+    _, streamed = timed(lambda: write_declensions(stems, "m", buffer))
+
+    for index in range(0, len(sample), max(1, len(sample) // 50)):
+        assert table.paradigm(index) == generate_noun_forms(stems[index], "m")
+
+    print(f"stems:               {len(stems):,} ({len(table.forms):,} forms)")
+    print(f"generate_noun_forms: {single:.2f} s (estimated from {len(sample):,} stems)")
+    print(f"decline_many:        {bulk:.2f} s ({single / bulk:.1f}x faster)")
+    print(f"write_declensions:   {streamed:.2f} s, "
+          f"{len(buffer.getvalue().encode('utf-8')) / 1_000_000:.1f} MB of TSV")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,46 @@
+"""
+Benchmark batched verb form generation against one generate_sanskrit_word()
+call per request.
+
+Run with ``python benchmarks/bench_generate_words.py [requests]``.
+"""
+
+import itertools
+import sys
+import time
+
+from sanskrit_grammar import generate_sanskrit_word, generate_sanskrit_words
+from sanskrit_grammar.conjugation import LAKARAS, PADAS, PURUSHAS, VACHANAS
+from sanskrit_grammar.dhatu_db import get_dhatu_database
+
+
+def make_requests(count):
+    """Every feature combination of the lexicon roots, repeated up to count."""
+    features = list(itertools.product(LAKARAS, PURUSHAS, VACHANAS, PADAS))
+    combinations = ((dhatu, *feature) for dhatu in get_dhatu_database().roots() for feature in features)
+    return list(itertools.islice(itertools.cycle(combinations), count))
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(count=1_000_000):
+    requests = make_requests(count)
+    sample = requests[: max(1, count // 10)]
+
+    words, batched = timed(lambda: list(generate_sanskrit_words(requests)))
+    expected, single = timed(lambda: [generate_sanskrit_word(*request) for request in sample])
+    single *= len(requests) / len(sample)
+    assert words[:len(sample)] == expected
+
+    print(f"requests:                {len(requests):,}")
+    print(f"generate_sanskrit_word:  {single:.2f} s (estimated from {len(sample):,} requests)")
+    print(f"generate_sanskrit_words: {batched:.2f} s ({single / batched:.1f}x faster, "
+          f"{len(requests) / batched / 1e6:.2f}M words/s)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
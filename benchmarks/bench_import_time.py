@@ -0,0 +1,27 @@
+"""
+Benchmark a cold ``import sanskrit_grammar`` in fresh interpreters.
+
+Run with ``python benchmarks/bench_import_time.py [runs]``.
+"""
+
+import subprocess
+import sys
+
+_PROBE = """
+import time
+start = time.perf_counter()
+import sanskrit_grammar
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def main(runs=10):
+    times = sorted(
+        float(subprocess.run([sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True).stdout)
+        for _ in range(runs)
+    )
+    print(f"import sanskrit_grammar over {runs} runs: best {times[0]:.1f} ms, median {times[len(times) // 2]:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,42 @@
+"""
+Benchmark batch sandhi joins against the per-call loop.
+
+Run with ``python benchmarks/bench_sandhi_many.py [n_pairs]``.
+"""
+
+import itertools
+import sys
+import time
+
+from sanskrit_grammar.sandhi import apply_sandhi_many, sandhi_handler
+
+STEMS = ["राम", "देव", "वन", "गुरु", "मति", "वाक्", "नदी", "साधु", "फल", "जगत्"]
+WORDS = ["इति", "अपि", "उपरि", "एव", "ओषधि", "गच्छति", "कार", "घट", "जन", "अत्र"]
+
+
+def make_pairs(count):
+    cycle = itertools.cycle(itertools.product(STEMS, WORDS))
+    return [next(cycle) for _ in range(count)]
+
+
+def best_of(func, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(count=1_000_000):
+    pairs = make_pairs(count)
+    loop = best_of(lambda: [sandhi_handler(a, b) for a, b in pairs])
+    batch = best_of(lambda: apply_sandhi_many(pairs))
+    assert apply_sandhi_many(pairs[:1000]) == [sandhi_handler(a, b) for a, b in pairs[:1000]]
+    print(f"pairs:           {count:,}")
+    print(f"per-call loop:   {count / loop:,.0f} pairs/s")
+    print(f"apply_sandhi_many: {count / batch:,.0f} pairs/s ({loop / batch:.2f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
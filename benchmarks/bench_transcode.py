@@ -0,0 +1,52 @@
+"""
+Benchmark round-trip transcoding between Devanagari and the internal SLP1
+encoding on a large corpus.
+
+Run with ``python benchmarks/bench_transcode.py [megabytes]``.
+"""
+
+import itertools
+import sys
+import time
+
+from sanskrit_grammar.encoding import decode, encode_text
+
+WORDS = [
+    "रामः", "वनं", "गच्छति", "वाग्देवी", "कृष्णस्य", "ज्ञानम्", "सूर्योदयः", "इति",
+    "महर्षिः", "प्रत्यग्निः", "नीलोत्पलम्", "सोऽहम्", "अग्नये", "भवानि", "हंसः",
+]
+
+
+def make_corpus(megabytes):
+    """Lines of space-separated words totalling roughly ``megabytes`` of UTF-8."""
+    line = " ".join(WORDS)
+    size = len(line.encode("utf-8")) + 1
+    return list(itertools.repeat(line, max(1, int(megabytes * 1_000_000 / size))))
+
+
+def best_of(func, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(megabytes=8.0):
+    lines = make_corpus(megabytes)
+    encoded = [encode_text(line) for line in lines]
+    assert [decode(line) for line in encoded] == lines
+
+    size = sum(len(line.encode("utf-8")) + 1 for line in lines) / 1_000_000
+    encoding = best_of(lambda: [encode_text(line) for line in lines])
+    decoding = best_of(lambda: [decode(line) for line in encoded])
+
+    print(f"corpus:          {size:.1f} MB in {len(lines):,} lines")
+    print(f"encode:          {size / encoding:,.1f} MB/s")
+    print(f"decode:          {size / decoding:,.1f} MB/s")
+    print(f"round trip:      {size / (encoding + decoding):,.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 8.0)
@@ -1,6 +1,4 @@
 import re
-import matplotlib.pyplot as plt
-import networkx as nx
 
 # Basic segments in a Navya Nyaya expression
 segments = ['धर्म', 'अर्थ', 'काम', 'मोक्ष', 'सिद्धान्त', 'विवेचन', 'किञ्च', 'न']
@@ -45,7 +43,12 @@ def render_graph(parsed_expression):
     """
     Render the graphical representation of the parsed expression.
     Uses NetworkX to create a directed graph and Matplotlib for visualization.
+    Both libraries are imported here so that segmenting and parsing
+    expressions does not require the plotting stack.
     """
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
     G = nx.DiGraph()
 
     G.add_node('Expression')
@@ -1,6 +1,15 @@
-import re
-import pytesseract
-from PIL import Image
+import importlib
+from array import array
+from typing import NamedTuple
+
+from .conjugation import (LAKARA_INDEX, PURUSHA_INDEX, THEMATIC_ENDINGS, VACHANA_INDEX, VACHANAS,
+                          LakaraConjugations, conjugation_table, get_endings, paradigm_offset)
+from .dhatu_db import UBHAYAPADA, get_dhatu_database
+from .morphology import apply_stem_sandhi, lakara_stems, modify_verb_stem
+from .sandhi import SandhiRuleTable
+from .transliteration import devanagari_to_iast, iast_to_devanagari
+from .trie import SuffixTrie
+from .viccheda import SandhiSplitter
 
 """
 Sanskrit grammar, or **Vyākaraṇa** (व्याकरण), is one of the six traditional Vedanga disciplines in Hinduism. It provides the rules for constructing words, sentences, and understanding their meanings. Here are some of the key concepts in Sanskrit grammar:
@@ -131,73 +140,169 @@ def get_pratyahara(start, end):
                 return pratyahara
     return None  # If not found
 
+# ✅ Basic Sandhi Rules (Vowel-based)
+BASIC_SANDHI_RULES = {
+    ("अ", "अ"): "आ",
+    ("अ", "इ"): "ए",
+    ("अ", "उ"): "ओ",
+    ("इ", "इ"): "ई",
+    ("उ", "उ"): "ऊ",
+    ("अ", "ए"): "ए",
+    ("अ", "ओ"): "ओ",
+    ("अ", "ऋ"): "अर",
+}
+_BASIC_SANDHI_JOINS = SandhiRuleTable(BASIC_SANDHI_RULES)
+
 def apply_sandhi(word1, word2):
 
     """
     Joins two words based on basic vowel Sandhi rules.
     
     """
-    # ✅ Basic Sandhi Rules (Vowel-based)
-    sandhi_rules = {
-        ("अ", "अ"): "आ",
-        ("अ", "इ"): "ए",
-        ("अ", "उ"): "ओ",
-        ("इ", "इ"): "ई",
-        ("उ", "उ"): "ऊ",
-        ("अ", "ए"): "ए",
-        ("अ", "ओ"): "ओ",
-        ("अ", "ऋ"): "अर",
-    }
+    return _BASIC_SANDHI_JOINS.join(word1, word2)
+
+def iter_apply_sandhi(pairs):
+    """
+    Lazily join ``(word1, word2)`` pairs with the basic vowel Sandhi rules.
+    """
+    return _BASIC_SANDHI_JOINS.iter_join(pairs)
 
-    if word1[-1] in "अइउ" and word2[0] in "अइउएओऋ":
-        pair = (word1[-1], word2[0])
-        if pair in sandhi_rules:
-            return word1[:-1] + sandhi_rules[pair] + word2[1:]
-    return word1 + word2
+def apply_sandhi_many(pairs):
+    """
+    Joins a batch of ``(word1, word2)`` pairs with the basic vowel Sandhi rules.
+
+    :param pairs: Iterable of ``(word1, word2)`` tuples
+    :return: List of joined words, in input order
+    """
+    return _BASIC_SANDHI_JOINS.join_many(pairs)
+
+_BASIC_SANDHI_SPLITTER = SandhiSplitter(_BASIC_SANDHI_JOINS)
+
+def iter_sandhi_viched(word):
+    """
+    Lazily yields every candidate split of a word by reversing basic Sandhi.
+
+    The word is scanned once against an index of all rule outputs.
+
+    :param word: Joined word
+    :return: Iterator of ``(left, right, (a, b, result))`` candidates
+    """
+    return _BASIC_SANDHI_SPLITTER.iter_splits(word)
 
 def sandhi_viched(word):
     """
     Attempts to split a given word into two words by reversing Sandhi.
+
+    Returns the first candidate of iter_sandhi_viched, or ``(word, "")``.
     """
-    # ✅ Basic Sandhi Rules (Vowel-based)
-    sandhi_rules = {
-        ("अ", "अ"): "आ",
-        ("अ", "इ"): "ए",
-        ("अ", "उ"): "ओ",
-        ("इ", "इ"): "ई",
-        ("उ", "उ"): "ऊ",
-        ("अ", "ए"): "ए",
-        ("अ", "ओ"): "ओ",
-        ("अ", "ऋ"): "अर",
-    }
-    for (a, b), result in sandhi_rules.items():
-        pattern = re.compile(f"({result})")
-        match = pattern.search(word)
-        if match:
-            idx = match.start()
-            return word[:idx] + a, b + word[idx + len(result):]
+    for left, right, _ in iter_sandhi_viched(word):
+        return left, right
     return word, ""
 
 # ✅ Basic Verb Conjugation for लट् लकार (Present Tense)
 
+# Labels of conjugate_dhatu, with the offset of each पुरुष's endings
+_DHATU_PERSONS = (("प्रथम पुरुष", 0), ("मध्यम पुरुष", 3), ("उत्तम पुरुष", 6))
+
 def conjugate_dhatu(dhatu):
     """
     Conjugates a given Sanskrit dhatu in present tense (लट् लकार).
     :param dhatu: Root verb (धातु)
     :return: Dictionary of conjugated forms
     """
-    # Dhatu Endings for Parasmaipada verbs in लट् लकार
-    parasmaipada_endings = {
-        "प्रथम पुरुष" : ["ति", "तः", "न्ति"],  # 3rd Person: Singular, Dual, Plural
-        "मध्यम पुरुष" : ["सि", "थः", "थ"],    # 2nd Person: Singular, Dual, Plural
-        "उत्तम पुरुष" : ["मि", "वः", "मः"]   # 1st Person: Singular, Dual, Plural
-    }
+    stem = modify_verb_stem(iast_to_devanagari(dhatu), "लट्")
 
+    endings = get_endings("लट्", "परस्मैपद", thematic=True)
     forms = {}
-    for person, endings in parasmaipada_endings.items():
-        forms[person] = [dhatu + ending for ending in endings]
+    for person, start in _DHATU_PERSONS:
+        forms[person] = [apply_stem_sandhi(stem, ending) for ending in endings[start:start + 3]]
     return forms
 
+# Endings of each लकारः and पद, used to detect the tense of a word
+TENSE_ENDINGS = {
+    "लट् (Present Tense)": {
+        "Parasmaipada": ["ति", "सि", "मि"],   # गच्छति, पठसि, करोमि
+        "Atmanepada": ["ते", "एते", "अन्ते"]  # गच्छते, गच्छेते, गच्छन्ते
+    },
+    "लङ् (Past Tense)": {
+        "Parasmaipada": ["त्", "ः", "म्"],    # अगच्छत्, अकरोत्, अपठम्
+        "Atmanepada": ["त", "एते", "अन्त"]   # अगच्छत, अगच्छेते, अगच्छन्त
+    },
+    "लृट् (Future Tense)": {
+        "Parasmaipada": ["ष्यति", "ष्यसि", "ष्यामि"],  # गमिष्यति, पठिष्यसि
+        "Atmanepada": ["ष्यते", "ष्येते", "ष्यन्ते"]  # गमिष्यते, गमिष्येते, गमिष्यन्ते
+    },
+    "लोट् (Imperative)": {
+        "Parasmaipada": ["तु", "ताम्", "न्तु"],  # पठतु, गच्छतु
+        "Atmanepada": ["ताम्", "एताम्", "अन्ताम्"]  # गच्छताम्, गच्छेताम्, गच्छन्ताम्
+    },
+    "विधिलिङ् (Potential/Optative)": {
+        "Parasmaipada": ["एत्", "याम", "युः"],  # पठेत्, गच्छेत्
+        "Atmanepada": ["एत", "एते", "येरन्"]   # गच्छेत, गच्छेते, गच्छेरन्
+    },
+    "आशीर्लिङ् (Benediction)": {
+        "Parasmaipada": ["यात्", "युः"],  # भूयात्, जीवेत्
+        "Atmanepada": ["याथ", "येयुः"]  # भूयाथ, जीवेयुः
+    },
+    "लुङ् (Aorist/Past Perfect)": {
+        "Parasmaipada": ["अम्", "अः", "अरम्"],  # अगच्छम्, अभूव
+        "Atmanepada": ["ए", "एते", "अन्त"]  # अगच्छे, अगच्छेते, अगच्छन्त
+    }
+}
+
+# Codes of the structured detectors: indexes into these tuples
+TENSE_NAMES = tuple(TENSE_ENDINGS)
+PADA_NAMES = ("Parasmaipada", "Atmanepada")
+NOT_IDENTIFIED = -1
+
+def _build_tense_trie():
+    """Index every ending of TENSE_ENDINGS, with its (tense, pada) codes in table order."""
+    candidates = {}
+    for tense, pada_data in enumerate(TENSE_ENDINGS.values()):
+        for pada, endings in pada_data.items():
+            for ending in endings:
+                candidates.setdefault(ending, []).append((tense, PADA_NAMES.index(pada)))
+    return SuffixTrie((ending, tuple(codes)) for ending, codes in candidates.items())
+
+_TENSE_TRIE = _build_tense_trie()
+
+def match_tense_endings(word):
+    """
+    Finds every known tense ending of a word in one backward pass.
+
+    :param word: Verb form in Devanagari
+    :return: List of ``(tense, pada, ending)`` candidates, longest ending
+        first; candidates with the same ending keep the order of TENSE_ENDINGS
+    """
+    matches = []
+    # The trie yields the shortest ending first
+    for start, codes in reversed(list(_TENSE_TRIE.iter_suffixes(word))):
+        ending = word[start:]
+        matches.extend((TENSE_NAMES[tense], PADA_NAMES[pada], ending) for tense, pada in codes)
+    return matches
+
+_UNIDENTIFIED = (NOT_IDENTIFIED, NOT_IDENTIFIED, False)
+
+def _classify_tense(word):
+    """
+    Codes of the longest matching ending of a Devanagari word.
+
+    :return: ``(tense, pada, ubhayapada)``, with NOT_IDENTIFIED codes if no
+        ending matches
+    """
+    match = _TENSE_TRIE.longest_suffix(word)
+    if match is None:
+        return _UNIDENTIFIED
+    tense, pada = match[1][0]
+    # Ubhayapada is a property of the root: look up the text before each
+    # matching ending among the lexicon's roots and present stems, since the
+    # longest ending may eat into the stem (मृष्य-ते, not मृ-ष्यते)
+    dhatus = get_dhatu_database()
+    ubhayapada = any(dhatu.pada == UBHAYAPADA
+                     for start, _ in _TENSE_TRIE.iter_suffixes(word)
+                     for dhatu in dhatus.find(word[:start]))
+    return tense, pada, ubhayapada
+
 def detect_tense(word):
     """
     Detects the tense (लकारः) of a Sanskrit verb based on its ending.
@@ -205,21 +310,12 @@ def detect_tense(word):
     :param word: Input verb form (e.g., पठति, अगच्छत्)
     :return: Tense name in Sanskrit
     """
-    # Extended Tense patterns
-    tense_patterns = {
-        "लट् (Present Tense)": ["ति", "सि", "मि"],  # पठति, गच्छसि, करोमि
-        "लङ् (Past Tense)": ["त्", "ः", "म्"],     # अगच्छत्, अपठः, अकरोत्
-        "लृट् (Future Tense)": ["ष्यति", "ष्यसि", "ष्यामि"],  # गमिष्यति, पठिष्यसि, करिष्यामि
-        "लोट् (Imperative)": ["तु", "ताम्", "न्तु"],  # पठतु, गच्छतु
-        "विधिलिङ् (Potential)": ["एत्", "याम", "युः"],  # पठेत्, गच्छेत्
-        "आशीर्लिङ् (Benediction)": ["यात्", "यु:"],  # भूयात्, जीवेत्
-        "लुङ् (Aorist/Past Perfect)": ["अम्", "अः", "अरम्"],  # अगच्छम्, अभूव
-    }
+    word = iast_to_devanagari(word)
+
+    tense = _classify_tense(word)[0]
+    if tense != NOT_IDENTIFIED:
+        return f"The word '{word}' is in {TENSE_NAMES[tense]}."
 
-    for tense, endings in tense_patterns.items():
-        if any(word.endswith(ending) for ending in endings):
-            return f"The word '{word}' is in {tense}."
-    
     return "Tense not identified."
 
 def detect_tense_and_pada_v0(word):
@@ -247,51 +343,23 @@ def detect_tense_and_pada_v0(word):
 
     Ubhayapada verbs (उभयपदी धातवः) can be conjugated in both Parasmaipada (परस्मैपद) and Atmanepada (आत्मनेपद), depending on context and meaning.
 
-    Examples of Ubhayapada Verbs
+    Examples of Ubhayapada Verbs (roots marked U in data/dhatupatha.tsv)
     Root (धातु)	Parasmaipada Usage	Atmanepada Usage
-    निन्द् (to blame)	निन्दति (He blames)	निन्दते (He blames himself)
     याच् (to beg)	याचति (He asks)	याचते (He asks for himself)
-    लभ् (to get)	लभति (He gets)	लभते (He receives for himself)
-    स्पर्ध् (to compete)	स्पर्धते (He competes)	स्पर्धते (Reflexive: He competes for himself)
-
-    """
-    # Define tense patterns
-    tense_patterns = {
-        "लट् (Present Tense)": {
-            "Parasmaipada": ["ति", "सि", "मि"],   # गच्छति, पठसि, करोमि
-            "Atmanepada": ["ते", "एते", "अन्ते"]  # गच्छते, गच्छेते, गच्छन्ते
-        },
-        "लङ् (Past Tense)": {
-            "Parasmaipada": ["त्", "ः", "म्"],    # अगच्छत्, अकरोत्, अपठम्
-            "Atmanepada": ["त", "एते", "अन्त"]   # अगच्छत, अगच्छेते, अगच्छन्त
-        },
-        "लृट् (Future Tense)": {
-            "Parasmaipada": ["ष्यति", "ष्यसि", "ष्यामि"],  # गमिष्यति, पठिष्यसि
-            "Atmanepada": ["ष्यते", "ष्येते", "ष्यन्ते"]  # गमिष्यते, गमिष्येते, गमिष्यन्ते
-        },
-        "लोट् (Imperative)": {
-            "Parasmaipada": ["तु", "ताम्", "न्तु"],  # पठतु, गच्छतु
-            "Atmanepada": ["ताम्", "एताम्", "अन्ताम्"]  # गच्छताम्, गच्छेताम्, गच्छन्ताम्
-        },
-        "विधिलिङ् (Potential/Optative)": {
-            "Parasmaipada": ["एत्", "याम", "युः"],  # पठेत्, गच्छेत्
-            "Atmanepada": ["एत", "एते", "येरन्"]   # गच्छेत, गच्छेते, गच्छेरन्
-        },
-        "आशीर्लिङ् (Benediction)": {
-            "Parasmaipada": ["यात्", "यु:"],  # भूयात्, जीवेत्
-            "Atmanepada": ["याथ", "येयुः"]  # भूयाथ, जीवेयुः
-        },
-        "लुङ् (Aorist/Past Perfect)": {
-            "Parasmaipada": ["अम्", "अः", "अरम्"],  # अगच्छम्, अभूव
-            "Atmanepada": ["ए", "एते", "अन्त"]  # अगच्छे, अगच्छेते, अगच्छन्त
-        }
-    }
+    नी (to lead)	नयति (He leads)	नयते (He leads for himself)
+    यज् (to sacrifice)	यजति (He sacrifices)	यजते (He sacrifices for himself)
+    मृष् (to endure)	मृष्यति (He endures)	मृष्यते (He endures for himself)
+
+    निन्द् (to blame) is Parasmaipada only, and लभ् (to get) and स्पर्ध् (to
+    compete) are Atmanepada only.
+
+    """
+    word = iast_to_devanagari(word)
+
+    tense, pada, _ = _classify_tense(word)
+    if tense != NOT_IDENTIFIED:
+        return f"The word '{word}' is in {TENSE_NAMES[tense]} and follows {PADA_NAMES[pada]} (पद)."
 
-    for tense, pada_data in tense_patterns.items():
-        for pada, endings in pada_data.items():
-            if any(word.endswith(ending) for ending in endings):
-                return f"The word '{word}' is in {tense} and follows {pada} (पद)."
-    
     return "Tense and Pada not identified."
 
 def detect_tense_and_pada(word):
@@ -303,61 +371,59 @@ def detect_tense_and_pada(word):
     :return: Tense name in Sanskrit and Pada type
     """
 
-    # List of known Ubhayapada roots
-    ubhayapada_roots = ["निन्द्", "याच्", "लभ्", "स्पर्ध्", "मृष्"]
-
-    # Define tense patterns
-    tense_patterns = {
-        "लट् (Present Tense)": {
-            "Parasmaipada": ["ति", "सि", "मि"],   
-            "Atmanepada": ["ते", "एते", "अन्ते"]  
-        },
-        "लङ् (Past Tense)": {
-            "Parasmaipada": ["त्", "ः", "म्"],    
-            "Atmanepada": ["त", "एते", "अन्त"]   
-        },
-        "लृट् (Future Tense)": {
-            "Parasmaipada": ["ष्यति", "ष्यसि", "ष्यामि"],  
-            "Atmanepada": ["ष्यते", "ष्येते", "ष्यन्ते"]  
-        },
-        "लोट् (Imperative)": {
-            "Parasmaipada": ["तु", "ताम्", "न्तु"],  
-            "Atmanepada": ["ताम्", "एताम्", "अन्ताम्"]  
-        },
-        "विधिलिङ् (Potential/Optative)": {
-            "Parasmaipada": ["एत्", "याम", "युः"],  
-            "Atmanepada": ["एत", "एते", "येरन्"]   
-        },
-        "आशीर्लिङ् (Benediction)": {
-            "Parasmaipada": ["यात्", "यु:"],  
-            "Atmanepada": ["याथ", "येयुः"]  
-        },
-        "लुङ् (Aorist/Past Perfect)": {
-            "Parasmaipada": ["अम्", "अः", "अरम्"],  
-            "Atmanepada": ["ए", "एते", "अन्त"]  
-        }
-    }
+    word = iast_to_devanagari(word)
 
-    pada_type = None
-    tense_detected = None
+    # Longest matching ending wins
+    tense, pada, ubhayapada = _classify_tense(word)
+    if tense == NOT_IDENTIFIED:
+        return "Tense and Pada not identified."
+    if ubhayapada:
+        return f"The word '{word}' is in {TENSE_NAMES[tense]} and follows Ubhayapada (उभयपद)."
+    return f"The word '{word}' is in {TENSE_NAMES[tense]} and follows {PADA_NAMES[pada]} (पद)."
 
-    for tense, pada_data in tense_patterns.items():
-        for pada, endings in pada_data.items():
-            if any(word.endswith(ending) for ending in endings):
-                tense_detected = tense
-                pada_type = pada
-                break
-
-    if tense_detected and pada_type:
-        # Check if the root of the word belongs to Ubhayapada roots
-        root = word[:3]  # Extract first 3 letters (approximate root)
-        if any(root in ubh_root for ubh_root in ubhayapada_roots):
-            return f"The word '{word}' is in {tense_detected} and follows Ubhayapada (उभयपद)."
-        return f"The word '{word}' is in {tense_detected} and follows {pada_type} (पद)."
-    
-    return "Tense and Pada not identified."
+class TenseColumns(NamedTuple):
+    """
+    Detected tense and pada of many words, as parallel columns of codes.
+
+    ``lakara`` indexes TENSE_NAMES and ``pada`` PADA_NAMES (NOT_IDENTIFIED
+    when no ending matches); ``ubhayapada`` is 1 for known Ubhayapada roots.
+    The columns are ``array('b')``, so they can be written out with
+    ``tofile`` or viewed as NumPy ``int8`` arrays without copying.
+    """
+    lakara: array
+    pada: array
+    ubhayapada: array
+
+# Entries kept by the memos of the batch functions (detect_tense_and_pada_many,
+# generate_sanskrit_words) before they are reset
+_BATCH_MEMO_SIZE = 65536
+
+def detect_tense_and_pada_many(words):
+    """
+    Detects tense and pada for a batch of words, as codes instead of sentences.
+
+    Uses the same rules as detect_tense_and_pada. Repeated words are
+    classified once, from a memo that is reset when it grows large.
+
+    :param words: Iterable of verb forms (Devanagari or IAST)
+    :return: TenseColumns with one entry per word, in input order
+    """
+    columns = TenseColumns(array("b"), array("b"), array("b"))
+    lakaras, padas, ubhayapadas = columns
+    seen = {}
+    for word in words:
+        codes = seen.get(word)
+        if codes is None:
+            if len(seen) >= _BATCH_MEMO_SIZE:
+                seen.clear()
+            codes = seen[word] = _classify_tense(iast_to_devanagari(word))
+        lakaras.append(codes[0])
+        padas.append(codes[1])
+        ubhayapadas.append(codes[2])
+    return columns
 
 # Sanskrit Verb Conjugation Generator
+
 def conjugate_verb(dhatu, lakara, pada):
     
     """
@@ -382,40 +448,13 @@ def conjugate_verb(dhatu, lakara, pada):
     :return: Conjugation table
     """
 
-    # Verb endings based on Tense and Pada
-    endings = {
-        "लट्": {  # Present Tense
-            "परस्मैपद": ["ति", "तः", "न्ति", "सि", "थः", "थ", "मि", "वः", "मः"],
-            "आत्मनेपद": ["ते", "एते", "अन्ते", "से", "एथे", "ध्वे", "ए", "वहे", "महे"]
-        },
-        "लङ्": {  # Past Tense (Aorist)
-            "परस्मैपद": ["त्", "तः", "न्", "ः", "थः", "त", "म्", "व", "म"],
-            "आत्मनेपद": ["त", "एते", "अन्त", "थाः", "एथे", "ध्वे", "ए", "वहे", "महे"]
-        },
-        "लृट्": {  # Future Tense
-            "परस्मैपद": ["ष्यति", "ष्यतः", "ष्यन्ति", "ष्यसि", "ष्यथः", "ष्यथ", "ष्यामि", "ष्यावः", "ष्यामः"],
-            "आत्मनेपद": ["ष्यते", "ष्येते", "ष्यन्ते", "ष्यसे", "ष्येथे", "ष्यध्वे", "ष्ये", "ष्यावहे", "ष्यामहे"]
-        },
-        "लोट्": {  # Imperative
-            "परस्मैपद": ["तु", "ताम्", "न्तु", "हि", "तम्", "त", "आनि", "आव", "आम"],
-            "आत्मनेपद": ["ताम्", "एताम्", "अन्ताम्", "थाम्", "एतम्", "ध्वम्", "ऐ", "आवहि", "आमहै"]
-        },
-    }
-
-    # Get correct endings
-    if lakara not in endings or pada not in endings[lakara]:
+    suffixes = get_endings(lakara, pada, thematic=True)
+    if suffixes is None:
         return "Invalid tense (लकारः) or pada (पदः)!"
 
-    suffixes = endings[lakara][pada]
-
-    # Form full conjugation table
-    conjugated_forms = {
-        "प्रथमपुरुषः (Third Person)": [dhatu + suffixes[0], dhatu + suffixes[1], dhatu + suffixes[2]],
-        "मध्यमपुरुषः (Second Person)": [dhatu + suffixes[3], dhatu + suffixes[4], dhatu + suffixes[5]],
-        "उत्तमपुरुषः (First Person)": [dhatu + suffixes[6], dhatu + suffixes[7], dhatu + suffixes[8]]
-    }
-
-    return conjugated_forms
+    # The stem of the लकार (गच्छ in the present system, गम् elsewhere)
+    stem = modify_verb_stem(iast_to_devanagari(dhatu), lakara)
+    return conjugation_table(stem, suffixes, apply_stem_sandhi)
 
 # Sanskrit Verb Conjugation Generator for 10 Lakāras
 
@@ -425,7 +464,8 @@ def conjugate_verb_all_lakaras(dhatu, pada):
 
     :param dhatu: Sanskrit root verb (e.g., 'गम्')
     :param pada: Pada type - 'परस्मैपद' or 'आत्मनेपद'
-    :return: Dictionary of conjugations for each लकारः
+    :return: Read-only mapping of each लकारः to its conjugation table; a
+        table is built when first accessed
 
     In Sanskrit, verbs (धातु) conjugate based on लकारः (tense/mood):
 
@@ -443,58 +483,35 @@ def conjugate_verb_all_lakaras(dhatu, pada):
 
     """
 
-    # Define endings for each लकारः (tense/mood)
-    lakara_endings = {
-        "लट्": {  # Present Tense
-            "परस्मैपद": ["ति", "तः", "न्ति", "सि", "थः", "थ", "मि", "वः", "मः"],
-            "आत्मनेपद": ["ते", "एते", "अन्ते", "से", "एथे", "ध्वे", "ए", "वहे", "महे"]
-        },
-        "लङ्": {  # Past (Imperfect)
-            "परस्मैपद": ["त्", "तः", "न्", "ः", "थः", "त", "म्", "व", "म"],
-            "आत्मनेपद": ["त", "एते", "अन्त", "थाः", "एथे", "ध्वे", "ए", "वहे", "महे"]
-        },
-        "लृट्": {  # Future Tense
-            "परस्मैपद": ["ष्यति", "ष्यतः", "ष्यन्ति", "ष्यसि", "ष्यथः", "ष्यथ", "ष्यामि", "ष्यावः", "ष्यामः"],
-            "आत्मनेपद": ["ष्यते", "ष्येते", "ष्यन्ते", "ष्यसे", "ष्येथे", "ष्यध्वे", "ष्ये", "ष्यावहे", "ष्यामहे"]
-        },
-        "लुट्": {  # Periphrastic Future
-            "परस्मैपद": ["तारः", "तारौ", "तारः", "तास्यसि", "तास्यथः", "तास्यथ", "तास्यामि", "तास्यावः", "तास्यामः"]
-        },
-        "लृङ्": {  # Conditional
-            "परस्मैपद": ["ष्यत्", "ष्यताम्", "ष्युः", "ष्याः", "ष्यथाम्", "ष्यत", "ष्याम्", "ष्याव", "ष्याम"]
-        },
-        "लोट्": {  # Imperative
-            "परस्मैपद": ["तु", "ताम्", "न्तु", "हि", "तम्", "त", "आनि", "आव", "आम"],
-            "आत्मनेपद": ["ताम्", "एताम्", "अन्ताम्", "थाम्", "एतम्", "ध्वम्", "ऐ", "आवहि", "आमहै"]
-        },
-        "विधिलिङ्": {  # Optative (Potential)
-            "परस्मैपद": ["यात्", "याताम्", "युः", "याः", "याथाम्", "यात", "याम्", "याव", "याम"]
-        },
-        "आशिर्लिङ्": {  # Benedictive
-            "परस्मैपद": ["एयात्", "एयाताम्", "एयुः", "एयाः", "एयाथाम्", "एयात", "एयाम्", "एयाव", "एयाम"]
-        },
-        "लुङ्": {  # Aorist (Simple Past)
-            "परस्मैपद": ["त्", "तः", "न्", "ः", "थः", "त", "म्", "व", "म"]
-        }
-    }
+    dhatu = iast_to_devanagari(dhatu)
 
-    # Store conjugations
-    all_conjugations = {}
+    return LakaraConjugations(dhatu, pada, lakara_stems(dhatu), apply_stem_sandhi)
 
-    # Iterate over each लकारः
-    for lakara, padas in lakara_endings.items():
-        if pada in padas:
-            suffixes = padas[pada]
-            conjugated_forms = {
-                "प्रथमपुरुषः (Third Person)": [dhatu + suffixes[0], dhatu + suffixes[1], dhatu + suffixes[2]],
-                "मध्यमपुरुषः (Second Person)": [dhatu + suffixes[3], dhatu + suffixes[4], dhatu + suffixes[5]],
-                "उत्तमपुरुषः (First Person)": [dhatu + suffixes[6], dhatu + suffixes[7], dhatu + suffixes[8]]
-            }
-            all_conjugations[lakara] = conjugated_forms
+# Verb conjugation generator with all 10 लकाराः
 
-    return all_conjugations
+# Messages of generate_sanskrit_word(s) for invalid features
+_INVALID_LAKARA_OR_PADA = "❌ Invalid input: Check लकार or पद type"
+_INVALID_PURUSHA = "❌ Invalid input: Check पुरुष"
+_INVALID_VACHANA = "❌ Invalid input: Check वचन"
+
+def _ending_index(lakara, purusha, vachana, pada):
+    """
+    Validates the features of a word through their integer codes.
+
+    :return: Index of the ending in THEMATIC_ENDINGS, or the error message
+        for the first invalid feature
+    """
+    start = paradigm_offset(lakara, pada)
+    if start is None:
+        return _INVALID_LAKARA_OR_PADA
+    purusha_index = PURUSHA_INDEX.get(purusha)
+    if purusha_index is None:
+        return _INVALID_PURUSHA
+    vachana_index = VACHANA_INDEX.get(vachana)
+    if vachana_index is None:
+        return _INVALID_VACHANA
+    return start + purusha_index * len(VACHANAS) + vachana_index
 
-# Verb conjugation generator with all 10 लकाराः
 def generate_sanskrit_word(dhatu, lakara, purusha, vachana, pada):
     """
     Generates a Sanskrit word using a root (धातु), tense/mood (लकार), person (पुरुष),
@@ -510,128 +527,68 @@ def generate_sanskrit_word(dhatu, lakara, purusha, vachana, pada):
     :param pada: Pada type ('परस्मैपद' or 'आत्मनेपद')
     :return: Generated Sanskrit word with sandhi applied
     """
-    
-    # Define suffixes for all 10 लकाराः (Tenses/Moods)
-    verb_suffixes = {
-        "लट्": {  # Present tense
-            "परस्मैपद": {
-                "प्रथम": ["ति", "तः", "न्ति"], 
-                "मध्यम": ["सि", "थः", "थ"], 
-                "उत्तम": ["मि", "वः", "मः"]
-            },
-            "आत्मनेपद": {
-                "प्रथम": ["ते", "एते", "अन्ते"], 
-                "मध्यम": ["से", "एथे", "ध्वे"], 
-                "उत्तम": ["ए", "वहे", "महे"]
-            }
-        },
-        "लङ्": {  # Past tense
-            "परस्मैपद": {
-                "प्रथम": ["त्", "तः", "न्"], 
-                "मध्यम": ["ः", "थः", "त"], 
-                "उत्तम": ["म्", "व", "म"]
-            },
-            "आत्मनेपद": {
-                "प्रथम": ["त", "एते", "अन्त"], 
-                "मध्यम": ["थाः", "एथे", "ध्वे"], 
-                "उत्तम": ["ए", "वहे", "महे"]
-            }
-        },
-        "लृट्": {  # Imperative tense
-            "परस्मैपद": {
-                "प्रथम": ["तु", "त", "न्ति"],
-                "मध्यम": ["हि", "थ", "तम"],
-                "उत्तम": ["तु", "व", "म"]
-            },
-            "आत्मनेपद": {
-                "प्रथम": ["ते", "त", "न्ते"],
-                "मध्यम": ["त", "थे", "व"],
-                "उत्तम": ["व", "वः", "व"]
-            }
-        },
-        # Add more tenses (e.g., Future, Conditional, Optative, etc.)
-        "लट्": {
-            "परस्मैपद": {
-                "प्रथम": ["ति", "तः", "न्ति"], 
-                "मध्यम": ["सि", "थः", "थ"], 
-                "उत्तम": ["मि", "वः", "मः"]
-            },
-            "आत्मनेपद": {
-                "प्रथम": ["ते", "एते", "अन्ते"], 
-                "मध्यम": ["से", "एथे", "ध्वे"], 
-                "उत्तम": ["ए", "वहे", "महे"]
-            }
-        }
-    }
 
-    # Ensure valid input
-    if lakara not in verb_suffixes or pada not in verb_suffixes[lakara]:
-        return "❌ Invalid input: Check लकार or पद type"
-
-    if purusha not in verb_suffixes[lakara][pada]:
-        return "❌ Invalid input: Check पुरुष"
-
-    if vachana not in ["एकवचन", "द्विवचन", "बहुवचन"]:
-        return "❌ Invalid input: Check वचन"
-
-    # Mapping वचन to index in suffix lists
-    vachana_index = {"एकवचन": 0, "द्विवचन": 1, "बहुवचन": 2}
-
-    # Generate word
-    suffix = verb_suffixes[lakara][pada][purusha][vachana_index[vachana]]
-    generated_word = dhatu + suffix
-    
-    # Apply Sandhi rules
-    generated_word_with_sandhi = apply_sandhi(generated_word)
+    index = _ending_index(lakara, purusha, vachana, pada)
+    if isinstance(index, str):
+        return index
 
-    return generated_word_with_sandhi
+    # Join the लकार's stem with sandhi; vowel-initial endings replace a thematic अ
+    stem = modify_verb_stem(iast_to_devanagari(dhatu), lakara)
+    return apply_stem_sandhi(stem, THEMATIC_ENDINGS[index])
 
-def ocr_text_reaction(image_path):
+def generate_sanskrit_words(requests):
     """
-    This function performs OCR on the image and returns the text extracted from it.
-    It can react to the extracted text based on specific conditions or triggers.
-    # You may need to specify the path to the tesseract executable if it's not in your PATH
-    # Example: 'C:/Program Files/Tesseract-OCR/tesseract.exe' for Windows
-    # pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+    Generates many words, as generate_sanskrit_word does for one.
 
-    Parameters:
-    image_path (str): Path to the image file from which text is to be extracted.
+    Feature combinations are validated once through their integer codes;
+    stems and joined forms are memoized within the batch, so repeated
+    roots and combinations cost a dict lookup.
 
-    Returns:
-    str: The extracted text from the image.
+    :param requests: Iterable of ``(dhatu, lakara, purusha, vachana, pada)``
+        tuples
+    :return: Iterator over the generated words in request order; invalid
+        requests yield the error message of generate_sanskrit_word
     """
-    try:
-        # Open the image using PIL
-        img = Image.open(image_path)
-
-        # Perform OCR using Tesseract
-        extracted_text = pytesseract.image_to_string(img)
-
-        # Reacting based on extracted text
-        print(f"Extracted Text: {extracted_text}")
-
-        # Example reaction: Check if certain keywords are found in the text
-        if "hello" in extracted_text.lower():
-            return "Hi! How can I assist you today?"
-        elif "thank you" in extracted_text.lower():
-            return "You're welcome!"
-        else:
-            return "Text extracted successfully!"
-
-    except Exception as e:
-        return f"Error processing the image: {str(e)}"
+    indexes = {}
+    stems = {}
+    forms = {}
+    for dhatu, lakara, purusha, vachana, pada in requests:
+        features = (lakara, purusha, vachana, pada)
+        index = indexes.get(features)
+        if index is None:
+            index = indexes[features] = _ending_index(*features)
+        if isinstance(index, str):
+            yield index
+            continue
+
+        root_stems = stems.get(dhatu)
+        if root_stems is None:
+            if len(stems) >= _BATCH_MEMO_SIZE:
+                stems.clear()
+            root_stems = stems[dhatu] = lakara_stems(iast_to_devanagari(dhatu))
+        stem = root_stems[LAKARA_INDEX[lakara]]
+
+        key = (stem, index)
+        form = forms.get(key)
+        if form is None:
+            if len(forms) >= _BATCH_MEMO_SIZE:
+                forms.clear()
+            form = forms[key] = apply_stem_sandhi(stem, THEMATIC_ENDINGS[index])
+        yield form
 
 def generate_samasa(word1, word2, samasa_type):
     """
     This function generates a samasa (compound word) based on the type of Samasa.
     
-    :param word1: The first word in the compound.
-    :param word2: The second word in the compound.
+    :param word1: The first word in the compound (Devanagari or IAST).
+    :param word2: The second word in the compound (Devanagari or IAST).
     :param samasa_type: The type of samasa (Dvandva, Tatpurusha, Karmadhāraya, Bahuvrīhi).
     
     :return: The compound word (samasa).
     """
     
+    word1 = iast_to_devanagari(word1)
+    word2 = iast_to_devanagari(word2)
     samasa = ""
     
     # Dvandva Samasa: The compound word represents a co-ordination between two elements.
@@ -684,3 +641,37 @@ def generate_word_with_upasarga_and_pratyaya(root, upasarga, pratyaya):
     word_with_upasarga = apply_upasarga(root, upasarga)
     final_word = apply_pratyaya(word_with_upasarga, pratyaya)
     return final_word
+
+# Optional, heavy helpers are resolved on first attribute access so that
+# `import sanskrit_grammar` does not pull in OCR, plotting, SQLite or NumPy code.
+_LAZY_ATTRIBUTES = {
+    "ocr_text_reaction": ("ocr", "ocr_text_reaction"),
+    "NNExpression": ("NNExpression", None),
+    "render_graph": ("NNExpression", "render_graph"),
+    "sanskrit_hindi_accessor": ("sanskrit_hindi_accessor", None),
+    "initialize_database": ("sanskrit_hindi_accessor", "initialize_database"),
+    "add_word_to_dictionary": ("sanskrit_hindi_accessor", "add_word_to_dictionary"),
+    "advanced_word_analysis": ("sanskrit_hindi_accessor", "advanced_word_analysis"),
+    "translate_sentence_advanced": ("sanskrit_hindi_accessor", "translate_sentence_advanced"),
+    "vectorized": ("vectorized", None),
+    "analyze_corpus": ("corpus", "analyze_corpus"),
+    "AnalysisCache": ("analysis_cache", "AnalysisCache"),
+}
+
+def __getattr__(name):
+    """
+    Lazily import optional helpers (PEP 562).
+
+    :param name: Attribute requested from the package
+    :return: The submodule or function registered in ``_LAZY_ATTRIBUTES``
+    """
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,238 @@
+"""
+Persistent analysis cache shared by processes and runs.
+
+Results of analyze_sanskrit_word, advanced_word_analysis and
+detect_tense_and_pada are stored in an SQLite file, keyed by the analysis,
+the normalized word and the rule version of that analysis. The rule version
+is a hash of the analyzer's module, every package module it imports
+(transitively) and the root lexicon, so editing a rule table or the lexicon
+makes old entries unreachable; prune() deletes them.
+
+The database runs in WAL mode: any number of processes read concurrently,
+and writers (one transaction per batch) wait for each other. Open one
+AnalysisCache per process; a cache that finds itself in a forked child
+reconnects.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import sqlite3
+import unicodedata
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Tuple
+
+from .corpus import ANALYZERS, get_analyzer
+from .dhatu_db import DATABASE_PATH
+from .transliteration import iast_to_devanagari
+
+# Bumped when the stored format changes
+CACHE_SCHEMA = 1
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Data files read by package modules, by module
+_DATA_SOURCES = {
+    "dhatu_db": (DATABASE_PATH,),
+}
+
+# Words per SELECT when looking up a batch
+_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    analysis TEXT NOT NULL,
+    version TEXT NOT NULL,
+    word TEXT NOT NULL,
+    result TEXT NOT NULL,
+    PRIMARY KEY (analysis, version, word)
+) WITHOUT ROWID
+"""
+
+
+def _module_path(module: str) -> str:
+    """Source file of a package module; "" is the package itself."""
+    return os.path.join(_PACKAGE_DIR, (module or "__init__").replace(".", os.sep) + ".py")
+
+
+def _imported_modules(module: str) -> Iterable[str]:
+    """Package modules a module imports with relative imports, anywhere in its source."""
+    with open(_module_path(module), "rb") as file:
+        tree = ast.parse(file.read())
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.level == 1:
+            if node.module:
+                yield node.module
+            else:
+                # from . import name: name may be a module
+                yield from (alias.name for alias in node.names
+                            if os.path.exists(_module_path(alias.name)))
+
+
+def rule_sources(analysis: str) -> Tuple[str, ...]:
+    """
+    Return the files the result of an analysis depends on: the analyzer's
+    module, the package modules it imports (transitively) and the data
+    files they read.
+
+    Raises:
+        KeyError: If the analysis is unknown
+    """
+    seen = {}
+    pending = [ANALYZERS[analysis][0]]
+    while pending:
+        module = pending.pop()
+        if module not in seen:
+            seen[module] = _module_path(module)
+            pending.extend(_imported_modules(module))
+    sources = [seen[module] for module in sorted(seen)]
+    sources.extend(path for module in sorted(seen) for path in _DATA_SOURCES.get(module, ()))
+    return tuple(sources)
+
+
+@lru_cache(maxsize=None)
+def rule_version(analysis: str) -> str:
+    """
+    Return the rule version of an analysis: a hash of the files it depends on.
+
+    Raises:
+        KeyError: If the analysis is unknown
+    """
+    digest = hashlib.sha256(f"{CACHE_SCHEMA}:{analysis}".encode("ascii"))
+    for source in rule_sources(analysis):
+        with open(source, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()[:16]
+
+
+def normalize_word(word: str) -> str:
+    """Normalize a word as the cache keys it: NFC Devanagari without surrounding space."""
+    return unicodedata.normalize("NFC", iast_to_devanagari(word.strip()))
+
+
+class AnalysisCache:
+    """
+    Persistent, process-safe cache of word analyses.
+
+    Use as a context manager, or call close() when done.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        """
+        Args:
+            path (str): SQLite file; created if missing
+            timeout (float): Seconds a writer waits for another one
+        """
+        self.path = path
+        self.timeout = timeout
+        self._connection = None
+        self._pid = None
+        self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections must not cross a fork
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=self.timeout)
+            self._pid = os.getpid()
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            with self._connection:
+                self._connection.execute(_SCHEMA)
+        return self._connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Close this process's connection."""
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+
+    def get(self, analysis: str, word: str) -> Optional[Any]:
+        """
+        Return the cached analysis of a word, or None if it is not cached.
+
+        Raises:
+            KeyError: If the analysis is unknown
+        """
+        row = self._connect().execute(
+            "SELECT result FROM analyses WHERE analysis = ? AND version = ? AND word = ?",
+            (analysis, rule_version(analysis), normalize_word(word)),
+        ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def analyze(self, analysis: str, word: str) -> Any:
+        """Return the analysis of one word, computing and storing it if needed."""
+        return self.analyze_many(analysis, [word])[0]
+
+    def analyze_many(self, analysis: str, words: Iterable[str]) -> List[Any]:
+        """
+        Return the analyses of many words, in order.
+
+        Cached results are read in batches; the others are computed once
+        per distinct word and stored in one transaction.
+
+        Args:
+            analysis (str): Name in corpus.ANALYZERS
+            words: Words in Devanagari or IAST
+
+        Returns:
+            List: The result of the analysis of each normalized word
+
+        Raises:
+            KeyError: If the analysis is unknown
+        """
+        if analysis not in ANALYZERS:
+            raise KeyError(analysis)
+        connection = self._connect()
+        version = rule_version(analysis)
+        words = [normalize_word(word) for word in words]
+        distinct = list(dict.fromkeys(words))
+
+        results = {}
+        for start in range(0, len(distinct), _BATCH):
+            batch = distinct[start:start + _BATCH]
+            rows = connection.execute(
+                f"SELECT word, result FROM analyses WHERE analysis = ? AND version = ? "
+                f"AND word IN ({','.join('?' * len(batch))})",
+                (analysis, version, *batch),
+            )
+            results.update((word, json.loads(result)) for word, result in rows)
+
+        missing = [word for word in distinct if word not in results]
+        if missing:
+            func = get_analyzer(analysis)
+            computed = [(word, func(word)) for word in missing]
+            results.update(computed)
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO analyses VALUES (?, ?, ?, ?)",
+                    [(analysis, version, word, json.dumps(result, ensure_ascii=False))
+                     for word, result in computed],
+                )
+        return [results[word] for word in words]
+
+    def prune(self) -> int:
+        """
+        Delete entries stored under rule versions other than the current ones.
+
+        Returns:
+            int: Number of entries deleted
+        """
+        connection = self._connect()
+        current = [(analysis, rule_version(analysis)) for analysis in ANALYZERS]
+        keep = " OR ".join("(analysis = ? AND version = ?)" for _ in current)
+        with connection:
+            cursor = connection.execute(
+                f"DELETE FROM analyses WHERE NOT ({keep})",
+                [value for pair in current for value in pair],
+            )
+        return cursor.rowcount
@@ -0,0 +1,67 @@
+"""
+Opt-in, bounded memoization for hot helper functions.
+
+A function wrapped in OptionalLRUCache runs uncached until the cache is
+enabled, so memory use is only paid for by callers that generate many
+paradigms. Statistics include evictions, which functools.lru_cache does not
+report directly: every miss inserts an entry, so the entries missing from
+the cache are the ones that were evicted.
+"""
+
+from functools import lru_cache
+from typing import Callable, NamedTuple, Optional
+
+
+class CacheStats(NamedTuple):
+    """Counters of an OptionalLRUCache since it was last enabled or cleared."""
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class OptionalLRUCache:
+    """
+    A function with an LRU cache that can be switched on, resized and off.
+
+    Call the wrapped function through ``call``, which is the plain function
+    while the cache is disabled.
+    """
+
+    def __init__(self, func: Callable):
+        self._func = func
+        self._cached = None
+        self.call = func
+
+    @property
+    def enabled(self) -> bool:
+        return self._cached is not None
+
+    def enable(self, maxsize: Optional[int] = 4096) -> None:
+        """
+        Enable (or resize) the cache, starting empty.
+
+        Args:
+            maxsize: Number of entries kept; None for an unbounded cache
+        """
+        self._cached = lru_cache(maxsize=maxsize)(self._func)
+        self.call = self._cached
+
+    def disable(self) -> None:
+        """Drop the cache and call the function directly again."""
+        self._cached = None
+        self.call = self._func
+
+    def clear(self) -> None:
+        """Empty the cache and reset its counters."""
+        if self._cached is not None:
+            self._cached.cache_clear()
+
+    def stats(self) -> CacheStats:
+        """Return hit, miss and eviction counts (all zero while disabled)."""
+        if self._cached is None:
+            return CacheStats(0, 0, 0, 0, 0)
+        info = self._cached.cache_info()
+        return CacheStats(info.hits, info.misses, info.misses - info.currsize,
+                          info.maxsize, info.currsize)
@@ -0,0 +1,255 @@
+"""
+Verb endings (तिङ् प्रत्यय) for every लकार, पद, पुरुष and वचन.
+
+All verb generators read their endings from one flat, immutable tuple that
+is built once at import. The ending of a (lakara, pada, purusha, vachana)
+combination sits at a fixed offset::
+
+    ((lakara * len(PADAS) + pada) * len(PURUSHAS) + purusha) * len(VACHANAS) + vachana
+
+so a lookup is a little arithmetic and one tuple index, and the nine endings
+of a paradigm are one contiguous slice. Combinations without endings hold
+None.
+
+LakaraConjugations is a lazy, read-only mapping from लकार to the
+conjugation table of one root: a table is built on first access and kept,
+and a single cell costs one join of a stem and an ending.
+
+Endings are written as they follow a root. THEMATIC_ENDINGS holds the same
+endings for a stem ending in the thematic अ (गच्छ, भव): an ending that
+starts with अ, ए, ऐ, ओ or औ replaces that अ (अतो गुणे; vṛddhi gives the same
+vowel for ऐ and औ), so those vowels are written as matras.
+"""
+
+import operator
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .segmentation import VOWEL_TO_MATRA
+
+# लकाराः, in the order the conjugation tables list them
+LAKARAS = ("लट्", "लङ्", "लृट्", "लुट्", "लृङ्", "लोट्", "विधिलिङ्", "आशिर्लिङ्", "लुङ्")
+
+PADAS = ("परस्मैपद", "आत्मनेपद")
+
+# प्रथम is the third person, उत्तम the first
+PURUSHAS = ("प्रथम", "मध्यम", "उत्तम")
+
+VACHANAS = ("एकवचन", "द्विवचन", "बहुवचन")
+
+LAKARA_INDEX = {lakara: index for index, lakara in enumerate(LAKARAS)}
+PADA_INDEX = {pada: index for index, pada in enumerate(PADAS)}
+PURUSHA_INDEX = {purusha: index for index, purusha in enumerate(PURUSHAS)}
+VACHANA_INDEX = {vachana: index for index, vachana in enumerate(VACHANAS)}
+
+# Endings of one paradigm: प्रथम, मध्यम, उत्तम × एकवचन, द्विवचन, बहुवचन
+PARADIGM_SIZE = len(PURUSHAS) * len(VACHANAS)
+
+_PARADIGMS = {
+    ("लट्", "परस्मैपद"): ("ति", "तः", "न्ति", "सि", "थः", "थ", "मि", "वः", "मः"),
+    ("लट्", "आत्मनेपद"): ("ते", "एते", "अन्ते", "से", "एथे", "ध्वे", "ए", "वहे", "महे"),
+    ("लङ्", "परस्मैपद"): ("त्", "तः", "न्", "ः", "थः", "त", "म्", "व", "म"),
+    ("लङ्", "आत्मनेपद"): ("त", "एते", "अन्त", "थाः", "एथे", "ध्वे", "ए", "वहे", "महे"),
+    ("लृट्", "परस्मैपद"): ("ष्यति", "ष्यतः", "ष्यन्ति", "ष्यसि", "ष्यथः", "ष्यथ", "ष्यामि", "ष्यावः", "ष्यामः"),
+    ("लृट्", "आत्मनेपद"): ("ष्यते", "ष्येते", "ष्यन्ते", "ष्यसे", "ष्येथे", "ष्यध्वे", "ष्ये", "ष्यावहे", "ष्यामहे"),
+    ("लुट्", "परस्मैपद"): ("तारः", "तारौ", "तारः", "तास्यसि", "तास्यथः", "तास्यथ", "तास्यामि", "तास्यावः", "तास्यामः"),
+    ("लृङ्", "परस्मैपद"): ("ष्यत्", "ष्यताम्", "ष्युः", "ष्याः", "ष्यथाम्", "ष्यत", "ष्याम्", "ष्याव", "ष्याम"),
+    ("लोट्", "परस्मैपद"): ("तु", "ताम्", "न्तु", "हि", "तम्", "त", "आनि", "आव", "आम"),
+    ("लोट्", "आत्मनेपद"): ("ताम्", "एताम्", "अन्ताम्", "स्व", "एथाम्", "ध्वम्", "ऐ", "आवहै", "आमहै"),
+    ("विधिलिङ्", "परस्मैपद"): ("यात्", "याताम्", "युः", "याः", "याथाम्", "यात", "याम्", "याव", "याम"),
+    ("आशिर्लिङ्", "परस्मैपद"): ("एयात्", "एयाताम्", "एयुः", "एयाः", "एयाथाम्", "एयात", "एयाम्", "एयाव", "एयाम"),
+    ("लुङ्", "परस्मैपद"): ("त्", "तः", "न्", "ः", "थः", "त", "म्", "व", "म"),
+}
+
+
+def _build_endings() -> Tuple[Optional[str], ...]:
+    endings = [None] * (len(LAKARAS) * len(PADAS) * PARADIGM_SIZE)
+    for (lakara, pada), paradigm in _PARADIGMS.items():
+        start = (LAKARA_INDEX[lakara] * len(PADAS) + PADA_INDEX[pada]) * PARADIGM_SIZE
+        endings[start:start + PARADIGM_SIZE] = paradigm
+    return tuple(endings)
+
+
+# Vowels that replace a preceding thematic अ
+_THEMATIC_VOWELS = frozenset("अएऐओऔ")
+
+
+def _thematic(ending: Optional[str]) -> Optional[str]:
+    if ending and ending[0] in _THEMATIC_VOWELS:
+        return VOWEL_TO_MATRA[ending[0]] + ending[1:]
+    return ending
+
+
+ENDINGS = _build_endings()
+THEMATIC_ENDINGS = tuple(_thematic(ending) for ending in ENDINGS)
+
+
+def paradigm_offset(lakara: str, pada: str) -> Optional[int]:
+    """
+    Return where the endings of a लकार and पद start in ENDINGS.
+
+    Args:
+        lakara (str): लकार, e.g. 'लट्'
+        pada (str): 'परस्मैपद' or 'आत्मनेपद'
+
+    Returns:
+        Optional[int]: Offset of the first ending, or None if the table has
+        no endings for the combination
+    """
+    lakara_index = LAKARA_INDEX.get(lakara)
+    pada_index = PADA_INDEX.get(pada)
+    if lakara_index is None or pada_index is None:
+        return None
+    start = (lakara_index * len(PADAS) + pada_index) * PARADIGM_SIZE
+    if ENDINGS[start] is None:
+        return None
+    return start
+
+
+def get_endings(lakara: str, pada: str, thematic: bool = False) -> Optional[Tuple[str, ...]]:
+    """
+    Return the nine endings of a लकार and पद, पुरुष-major.
+
+    Args:
+        lakara (str): लकार, e.g. 'लट्'
+        pada (str): 'परस्मैपद' or 'आत्मनेपद'
+        thematic (bool): Return the endings for a stem in thematic अ
+
+    Returns:
+        Optional[Tuple[str, ...]]: Endings ordered प्रथम एकवचन .. उत्तम
+        बहुवचन, or None if the combination is unknown
+    """
+    start = paradigm_offset(lakara, pada)
+    if start is None:
+        return None
+    table = THEMATIC_ENDINGS if thematic else ENDINGS
+    return table[start:start + PARADIGM_SIZE]
+
+
+def get_ending(lakara: str, pada: str, purusha: str, vachana: str,
+               thematic: bool = False) -> Optional[str]:
+    """
+    Return a single ending.
+
+    Args:
+        lakara (str): लकार, e.g. 'लट्'
+        pada (str): 'परस्मैपद' or 'आत्मनेपद'
+        purusha (str): 'प्रथम', 'मध्यम' or 'उत्तम'
+        vachana (str): 'एकवचन', 'द्विवचन' or 'बहुवचन'
+        thematic (bool): Return the ending for a stem in thematic अ
+
+    Returns:
+        Optional[str]: The ending, or None if the combination is unknown
+    """
+    start = paradigm_offset(lakara, pada)
+    purusha_index = PURUSHA_INDEX.get(purusha)
+    vachana_index = VACHANA_INDEX.get(vachana)
+    if start is None or purusha_index is None or vachana_index is None:
+        return None
+    table = THEMATIC_ENDINGS if thematic else ENDINGS
+    return table[start + purusha_index * len(VACHANAS) + vachana_index]
+
+
+# Labels of the conjugation tables, with the offset of each पुरुष's endings
+TABLE_PERSONS = (
+    ("प्रथमपुरुषः (Third Person)", 0),
+    ("मध्यमपुरुषः (Second Person)", 3),
+    ("उत्तमपुरुषः (First Person)", 6),
+)
+
+
+def conjugation_table(dhatu: str, suffixes: Tuple[str, ...],
+                      join: Callable[[str, str], str] = operator.add) -> Dict[str, List[str]]:
+    """Attach nine पुरुष-major endings to a root or stem with join, grouped by TABLE_PERSONS."""
+    return {
+        person: [join(dhatu, suffix) for suffix in suffixes[start:start + len(VACHANAS)]]
+        for person, start in TABLE_PERSONS
+    }
+
+
+# Offset of each लकार's endings in ENDINGS, per पद (None where it has none)
+_LAKARA_OFFSETS = {
+    pada: tuple(paradigm_offset(lakara, pada) for lakara in LAKARAS) for pada in PADAS
+}
+_NO_OFFSETS = (None,) * len(LAKARAS)
+
+
+class LakaraConjugations(Mapping):
+    """
+    Conjugation tables of one root and पद, keyed by लकार, built on demand.
+
+    Behaves like the dict conjugate_verb_all_lakaras() used to return
+    (and compares equal to it); use ``dict(view)`` for a plain dict.
+    """
+
+    __slots__ = ("dhatu", "pada", "_stems", "_join", "_offsets", "_tables")
+
+    def __init__(self, dhatu: str, pada: str, stems: Optional[Tuple[str, ...]] = None,
+                 join: Optional[Callable[[str, str], str]] = None):
+        """
+        Args:
+            dhatu (str): The verb root
+            pada (str): 'परस्मैपद' or 'आत्मनेपद'
+            stems: Stem of the root for each entry of LAKARAS; None to use
+                the root for every लकार
+            join: Joins a stem and one of THEMATIC_ENDINGS (e.g. with
+                sandhi); None to concatenate the stem and ENDINGS
+        """
+        self.dhatu = dhatu
+        self.pada = pada
+        self._stems = stems if stems is not None else (dhatu,) * len(LAKARAS)
+        self._join = join
+        self._offsets = _LAKARA_OFFSETS.get(pada, _NO_OFFSETS)
+        self._tables = {}
+
+    def _form(self, lakara: str, offset: int) -> str:
+        stem = self._stems[LAKARA_INDEX[lakara]]
+        if self._join is None:
+            return stem + ENDINGS[offset]
+        return self._join(stem, THEMATIC_ENDINGS[offset])
+
+    def _offset(self, lakara: str) -> int:
+        index = LAKARA_INDEX.get(lakara)
+        offset = None if index is None else self._offsets[index]
+        if offset is None:
+            raise KeyError(lakara)
+        return offset
+
+    def __getitem__(self, lakara: str) -> Dict[str, List[str]]:
+        table = self._tables.get(lakara)
+        if table is None:
+            offset = self._offset(lakara)
+            table = {
+                person: [self._form(lakara, offset + start + vachana) for vachana in range(len(VACHANAS))]
+                for person, start in TABLE_PERSONS
+            }
+            self._tables[lakara] = table
+        return table
+
+    def __iter__(self) -> Iterator[str]:
+        return (lakara for lakara, offset in zip(LAKARAS, self._offsets) if offset is not None)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - self._offsets.count(None)
+
+    def __contains__(self, lakara) -> bool:
+        index = LAKARA_INDEX.get(lakara)
+        return index is not None and self._offsets[index] is not None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.dhatu!r}, {self.pada!r})"
+
+    def cell(self, lakara: str, purusha: str, vachana: str) -> str:
+        """
+        Return one form without building the लकार's table.
+
+        Args:
+            lakara (str): लकार, e.g. 'लट्'
+            purusha (str): 'प्रथम', 'मध्यम' or 'उत्तम'
+            vachana (str): 'एकवचन', 'द्विवचन' or 'बहुवचन'
+
+        Raises:
+            KeyError: If the combination has no ending
+        """
+        offset = self._offset(lakara) + PURUSHA_INDEX[purusha] * len(VACHANAS) + VACHANA_INDEX[vachana]
+        return self._form(lakara, offset)
@@ -0,0 +1,102 @@
+"""
+Word analysis over whole text collections on a process pool.
+
+analyze_corpus() sends chunks of tokens to worker processes and yields one
+analysis per token in input order, with a bounded number of chunks in
+flight (see parallel.ordered_map). Each worker loads the analyzer's tables
+- the compiled affix tries, the memory-mapped root lexicon - once when it
+starts, not per chunk. With a cache file, workers share results through a
+persistent AnalysisCache.
+"""
+
+import importlib
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+from .dhatu_db import get_dhatu_database
+from .parallel import iter_chunks, ordered_map
+
+# Analyzers by name: (module, function); "" is the package itself. Modules
+# are imported on first use.
+ANALYZERS = {
+    "morphology": ("morphological_analyzer", "analyze_sanskrit_word"),
+    "sandhi": ("sanskrit_hindi_accessor", "advanced_word_analysis"),
+    "tense": ("", "detect_tense_and_pada"),
+}
+
+DEFAULT_CHUNKSIZE = 256
+
+_loaded: Dict[str, Callable] = {}
+_caches = {}
+
+
+def get_analyzer(analysis: str) -> Callable:
+    """
+    Import an analyzer and load the tables it uses.
+
+    Args:
+        analysis (str): Name in ANALYZERS
+
+    Returns:
+        Callable: The analysis function of one word
+    """
+    func = _loaded.get(analysis)
+    if func is None:
+        module_name, name = ANALYZERS[analysis]
+        module = importlib.import_module(f".{module_name}", __package__)
+        get_dhatu_database()
+        func = _loaded[analysis] = getattr(module, name)
+    return func
+
+
+def _open_cache(path: str):
+    """Return this process's connection to a cache file."""
+    cache = _caches.get(path)
+    if cache is None:
+        from .analysis_cache import AnalysisCache
+        cache = _caches[path] = AnalysisCache(path)
+    return cache
+
+
+def _load_worker(analysis: str, cache_path: Optional[str]) -> None:
+    get_analyzer(analysis)
+    if cache_path is not None:
+        _open_cache(cache_path)
+
+
+def _analyze_chunk(task) -> list:
+    analysis, cache_path, tokens = task
+    if cache_path is not None:
+        return _open_cache(cache_path).analyze_many(analysis, tokens)
+    func = get_analyzer(analysis)
+    return [func(token) for token in tokens]
+
+
+def analyze_corpus(tokens: Iterable[str], workers: Optional[int] = 1, chunksize: int = DEFAULT_CHUNKSIZE,
+                   analysis: str = "morphology", cache: Optional[str] = None) -> Iterator:
+    """
+    Analyze every token of a corpus, in parallel, yielding in input order.
+
+    Args:
+        tokens: Iterable of words (Devanagari or IAST), consumed lazily
+        workers: Worker processes; None for one per CPU, 1 to run in-process
+        chunksize (int): Tokens per task; larger chunks amortize the
+            inter-process transfer
+        analysis (str): ``"morphology"`` for analyze_sanskrit_word(),
+            ``"sandhi"`` for advanced_word_analysis() or ``"tense"`` for
+            detect_tense_and_pada()
+        cache: Path of an AnalysisCache file shared by all workers and
+            runs; None to analyze every token
+
+    Returns:
+        Iterator: The analysis of each token, in the order of ``tokens``
+
+    Raises:
+        ValueError: If the analysis is unknown or chunksize is not positive
+    """
+    if analysis not in ANALYZERS:
+        raise ValueError(f"unknown analysis {analysis!r}; expected one of {sorted(ANALYZERS)}")
+    if chunksize < 1:
+        raise ValueError("chunksize must be positive")
+    tasks = ((analysis, cache, chunk) for chunk in iter_chunks(tokens, chunksize))
+    chunks = ordered_map(_analyze_chunk, tasks, workers, initializer=_load_worker, initargs=(analysis, cache))
+    return (result for results in chunks for result in results)
@@ -0,0 +1,252 @@
+"""
+Root lexicon (धातुपाठ) in a packed, memory-mapped file.
+
+The lexicon is edited as ``data/dhatupatha.tsv`` (root, gana, pada class,
+present-stem variants, meaning) and compiled with compile_dhatupatha() into
+``data/dhatupatha.bin``, which ships with the package. Opening the database
+maps the file; nothing is parsed at startup, and lookups bisect the file in
+place (see the packed module).
+
+The file has three tables:
+
+* records, keyed by root: gana (u8), pada class (u8), the stem variants
+  and the meaning. A root listed in several ganas has one record per gana.
+* forms, keyed by every root and stem variant: the index of its record, so
+  a stem such as गच्छ leads back to गम्.
+* lakara stems, keyed by root: the stem of each लकार (u8 count, then one
+  string per entry of conjugation.LAKARAS), derived by verb_stems when the
+  file is compiled from the root and its first present stem.
+
+Regenerate the binary with compile_dhatupatha() after editing the TSV or
+the stem rules.
+"""
+
+import os
+import struct
+from functools import lru_cache
+from typing import Iterable, Iterator, NamedTuple, Optional, TextIO, Tuple
+
+from .packed import PackedFile, pack_string, unpack_string, write_packed
+from .verb_stems import derive_lakara_stems, thematic_stem
+
+MAGIC = b"SGDP"
+VERSION = 2
+
+_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+SOURCE_PATH = os.path.join(_DATA_DIR, "dhatupatha.tsv")
+DATABASE_PATH = os.path.join(_DATA_DIR, "dhatupatha.bin")
+
+PARASMAIPADA = "परस्मैपद"
+ATMANEPADA = "आत्मनेपद"
+UBHAYAPADA = "उभयपद"
+
+# Pada classes, indexed by their code in the file
+PADA_CLASSES = (PARASMAIPADA, ATMANEPADA, UBHAYAPADA)
+
+# Pada letters of the TSV source
+_PADA_LETTERS = {"P": 0, "A": 1, "U": 2}
+
+_RECORD = struct.Struct("<BB")
+_INDEX = struct.Struct("<H")
+_COUNT = struct.Struct("<B")
+
+
+class Dhatu(NamedTuple):
+    """One root of the lexicon."""
+    root: str
+    gana: int
+    pada: str
+    stems: Tuple[str, ...]
+    meaning: str
+
+
+def read_dhatupatha(file: TextIO) -> Iterator[Dhatu]:
+    """
+    Read the TSV source of the lexicon.
+
+    Lines starting with ``#`` are comments. Columns are root, gana (1-10),
+    pada class (P, A or U), space-separated present-stem variants and
+    meaning.
+
+    Raises:
+        ValueError: On a malformed line
+    """
+    for number, line in enumerate(file, 1):
+        line = line.rstrip("\n")
+        if not line or line.startswith("#"):
+            continue
+        fields = line.split("\t")
+        if len(fields) != 5 or fields[2] not in _PADA_LETTERS:
+            raise ValueError(f"line {number}: expected root, gana, P/A/U, stems, meaning")
+        root, gana, pada, stems, meaning = fields
+        yield Dhatu(root, int(gana), PADA_CLASSES[_PADA_LETTERS[pada]], tuple(stems.split()), meaning)
+
+
+def compile_dhatupatha(source: str = SOURCE_PATH, destination: str = DATABASE_PATH) -> int:
+    """
+    Compile the TSV lexicon into the packed database.
+
+    Args:
+        source (str): TSV file to read
+        destination (str): Database file to write
+
+    Returns:
+        int: Number of root records written
+    """
+    with open(source, encoding="utf-8") as file:
+        records = sorted(
+            (dhatu.root.encode("utf-8"),
+             _RECORD.pack(dhatu.gana, PADA_CLASSES.index(dhatu.pada))
+             + pack_string(" ".join(dhatu.stems)) + pack_string(dhatu.meaning))
+            for dhatu in read_dhatupatha(file)
+        )
+
+    forms = set()
+    lakara_stems = {}
+    for index, (root, payload) in enumerate(records):
+        stems = unpack_string(payload, _RECORD.size)[0].split()
+        for form in {root.decode("utf-8"), *stems}:
+            forms.add((form.encode("utf-8"), _INDEX.pack(index)))
+        if root not in lakara_stems:
+            derived = derive_lakara_stems(root.decode("utf-8"), stems[0] if stems else None)
+            lakara_stems[root] = _COUNT.pack(len(derived)) + b"".join(pack_string(stem) for stem in derived)
+
+    write_packed(destination, MAGIC, VERSION, [records, forms, lakara_stems.items()])
+    return len(records)
+
+
+class DhatuDatabase:
+    """
+    Read-only, memory-mapped root lexicon.
+
+    Use as a context manager, or call close() when done.
+    """
+
+    def __init__(self, path: str = DATABASE_PATH, cache_size: Optional[int] = 4096):
+        """
+        Args:
+            path (str): File written by compile_dhatupatha()
+            cache_size: Lookups kept in the LRU cache of find(); None for unbounded
+
+        Raises:
+            ValueError: If the file is not a root lexicon of this version
+        """
+        self._file = PackedFile(path, MAGIC, VERSION)
+        self._records, self._forms, self._lakara_stems = self._file.tables
+        self._find = lru_cache(maxsize=cache_size)(self._find_uncached)
+        self._stems = lru_cache(maxsize=cache_size)(self._lakara_stems_uncached)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Release the mapping."""
+        self._find.cache_clear()
+        self._stems.cache_clear()
+        self._file.close()
+
+    def _record(self, index: int) -> Dhatu:
+        buffer = self._file.buffer
+        root = self._records.key(index).decode("utf-8")
+        position = self._records.payload_position(index)
+        gana, pada = _RECORD.unpack_from(buffer, position)
+        stems, position = unpack_string(buffer, position + _RECORD.size)
+        meaning, _ = unpack_string(buffer, position)
+        return Dhatu(root, gana, PADA_CLASSES[pada], tuple(stems.split()), meaning)
+
+    def __iter__(self) -> Iterator[Dhatu]:
+        """Iterate over all records, in root order."""
+        return (self._record(index) for index in range(len(self._records)))
+
+    def __contains__(self, root: str) -> bool:
+        return bool(self._records.find(root.encode("utf-8")))
+
+    def lookup(self, root: str) -> Tuple[Dhatu, ...]:
+        """
+        Return the records of a root (one per gana it is listed in).
+
+        Args:
+            root (str): Root in Devanagari, e.g. 'गम्'
+        """
+        return tuple(self._record(index) for index in self._records.find(root.encode("utf-8")))
+
+    def _find_uncached(self, form: str) -> Tuple[Dhatu, ...]:
+        buffer = self._file.buffer
+        indexes = sorted(
+            _INDEX.unpack_from(buffer, self._forms.payload_position(index))[0]
+            for index in self._forms.find(form.encode("utf-8"))
+        )
+        return tuple(self._record(index) for index in indexes)
+
+    def find(self, form: str) -> Tuple[Dhatu, ...]:
+        """
+        Return the records whose root or a present-stem variant is ``form``.
+
+        Args:
+            form (str): Root or stem in Devanagari, e.g. 'गम्' or 'गच्छ'
+        """
+        return self._find(form)
+
+    def _lakara_stems_uncached(self, root: str) -> Optional[Tuple[str, ...]]:
+        for index in self._lakara_stems.find(root.encode("utf-8")):
+            buffer = self._file.buffer
+            position = self._lakara_stems.payload_position(index)
+            count, = _COUNT.unpack_from(buffer, position)
+            position += _COUNT.size
+            stems = []
+            for _ in range(count):
+                stem, position = unpack_string(buffer, position)
+                stems.append(stem)
+            return tuple(stems)
+        return None
+
+    def lakara_stems(self, root: str) -> Optional[Tuple[str, ...]]:
+        """
+        Return the stems of a root for every लकार, as stored in the file.
+
+        Args:
+            root (str): Root in Devanagari, e.g. 'नी'
+
+        Returns:
+            One stem per entry of conjugation.LAKARAS, or None if the root
+            is not in the lexicon
+        """
+        return self._stems(root)
+
+    def roots(self, pada: Optional[str] = None) -> Iterable[str]:
+        """
+        Return the distinct roots, in root order.
+
+        Args:
+            pada: Only roots of this pada class (e.g. UBHAYAPADA)
+        """
+        return list(dict.fromkeys(
+            dhatu.root for dhatu in self if pada is None or dhatu.pada == pada
+        ))
+
+
+@lru_cache(maxsize=None)
+def get_dhatu_database() -> DhatuDatabase:
+    """Return the lexicon shipped with the package, opened once per process."""
+    return DhatuDatabase()
+
+
+def present_stem(dhatu: str) -> str:
+    """
+    Return the present stem of a root listed in the shipped lexicon.
+
+    The first stem variant of the root's first gana is used, e.g. गम् ->
+    गच्छ, without a final virama (the thematic endings follow it; see
+    verb_stems.thematic_stem). Anything else, such as a form that already
+    is a stem, is returned unchanged.
+    """
+    for record in get_dhatu_database().lookup(dhatu):
+        if record.stems:
+            return thematic_stem(record.stems[0])
+    return dhatu
@@ -0,0 +1,160 @@
+"""
+Internal single-symbol phoneme encoding (SLP1).
+
+The rule engines (sandhi, morphology, samasa) work on SLP1 text, where
+every phoneme is exactly one character: राम is ``rAma``, वाक् is ``vAk``.
+Joining and slicing words is then plain string slicing by phoneme count.
+Text is converted only at the API boundary with precompiled
+``str.translate`` tables:
+
+* encode() maps each consonant to its letter plus the inherent ``a``, each
+  matra and virama to a marker, and drops ``a`` before a marker in one
+  ``str.replace`` pass.
+* decode() maps each consonant to its letter plus a provisional virama and
+  each vowel to a marker plus its matra, then cancels virama-marker pairs.
+
+A matra with no consonant before it (as at the start of an ending such as
+ेन) survives encoding as ``MATRA_MARK`` followed by the vowel; joined to a
+stem it replaces the stem's final vowel.
+
+Other characters that are symbols of the encoding (Latin letters, ``~``,
+``'``) are escaped into the private use area, so they match no rule and
+decode to themselves: Latin input is never read as SLP1.
+"""
+
+import re
+from functools import lru_cache
+
+from .segmentation import CONSONANT, CODEPOINT_CLASS, MATRA_TO_VOWEL, VOWEL_TO_MATRA
+
+# Devanagari letters and their SLP1 symbols
+SLP1_VOWELS = {
+    'अ': 'a', 'आ': 'A', 'इ': 'i', 'ई': 'I', 'उ': 'u', 'ऊ': 'U', 'ऋ': 'f', 'ॠ': 'F',
+    'ऌ': 'x', 'ॡ': 'X', 'ए': 'e', 'ऐ': 'E', 'ओ': 'o', 'औ': 'O'
+}
+
+SLP1_CONSONANTS = {
+    'क': 'k', 'ख': 'K', 'ग': 'g', 'घ': 'G', 'ङ': 'N',
+    'च': 'c', 'छ': 'C', 'ज': 'j', 'झ': 'J', 'ञ': 'Y',
+    'ट': 'w', 'ठ': 'W', 'ड': 'q', 'ढ': 'Q', 'ण': 'R',
+    'त': 't', 'थ': 'T', 'द': 'd', 'ध': 'D', 'न': 'n',
+    'प': 'p', 'फ': 'P', 'ब': 'b', 'भ': 'B', 'म': 'm',
+    'य': 'y', 'र': 'r', 'ल': 'l', 'व': 'v', 'ळ': 'L',
+    'श': 'S', 'ष': 'z', 'स': 's', 'ह': 'h'
+}
+
+SLP1_OTHERS = {'ं': 'M', 'ः': 'H', 'ँ': '~', 'ऽ': "'"}
+
+# Vowel symbols of the encoding
+VOWELS = frozenset(SLP1_VOWELS.values())
+
+# Precedes the vowel of an ending that starts with a bare matra
+MATRA_MARK = '\x01'
+
+_INHERENT = 'a'
+_VIRAMA = '्'
+
+# Decoding markers: provisional virama after a consonant, and vowel sign
+_PENDING_VIRAMA = '\x01'
+_VOWEL_SIGN = '\x02'
+
+
+def _all_consonants():
+    """Every consonant codepoint of the block, mapped to its SLP1 symbol."""
+    consonants = {
+        chr(0x0900 + offset): chr(0x0900 + offset)
+        for offset, code in enumerate(CODEPOINT_CLASS) if code == CONSONANT
+    }
+    consonants.update(SLP1_CONSONANTS)
+    return consonants
+
+
+_CONSONANTS = _all_consonants()
+
+# Consonant symbols of the encoding
+CONSONANTS = frozenset(_CONSONANTS.values())
+
+# Input characters that are symbols of the encoding, mapped to and from
+# their escapes in the supplementary private use area
+_ESCAPE_OFFSET = 0xF0000
+_ESCAPES = {
+    symbol: chr(_ESCAPE_OFFSET + ord(symbol))
+    for symbol in {*CONSONANTS, *VOWELS, *SLP1_OTHERS.values()}
+    if not '\u0900' <= symbol <= '\u097f'
+}
+
+_ENCODE = str.maketrans({
+    **_ESCAPES,
+    **{letter: symbol + _INHERENT for letter, symbol in _CONSONANTS.items()},
+    **SLP1_VOWELS,
+    **{matra: MATRA_MARK + SLP1_VOWELS[vowel] for matra, vowel in MATRA_TO_VOWEL.items()},
+    _VIRAMA: MATRA_MARK,
+    **SLP1_OTHERS,
+})
+
+_ENCODE_RULE = str.maketrans({
+    **_ESCAPES,
+    **_CONSONANTS,
+    **SLP1_VOWELS,
+    **{matra: SLP1_VOWELS[vowel] for matra, vowel in MATRA_TO_VOWEL.items()},
+    _VIRAMA: None,
+    **SLP1_OTHERS,
+})
+
+_DECODE = str.maketrans({
+    **{symbol: letter + _PENDING_VIRAMA for letter, symbol in _CONSONANTS.items()},
+    **{symbol: _VOWEL_SIGN + VOWEL_TO_MATRA[vowel] for vowel, symbol in SLP1_VOWELS.items()},
+    MATRA_MARK: _PENDING_VIRAMA,
+    **{symbol: letter for letter, symbol in SLP1_OTHERS.items()},
+    **{escape: symbol for symbol, escape in _ESCAPES.items()},
+})
+
+# A vowel sign not attached to a consonant, written as an independent vowel
+_UNATTACHED_VOWEL = re.compile(_VOWEL_SIGN + '([' + ''.join(MATRA_TO_VOWEL) + ']?)')
+
+
+def _independent_vowel(match):
+    return MATRA_TO_VOWEL.get(match.group(1), 'अ')
+
+
+def encode_text(text: str) -> str:
+    """
+    Encode Devanagari text as SLP1, one symbol per phoneme.
+
+    Works on text of any length; use encode() for individual words.
+
+    Args:
+        text (str): Devanagari text
+
+    Returns:
+        str: SLP1 text, e.g. गच्छति -> ``gacCati``
+    """
+    return text.translate(_ENCODE).replace(_INHERENT + MATRA_MARK, '')
+
+
+# Words recur constantly in rule application, so word encodings are cached
+encode = lru_cache(maxsize=65536)(encode_text)
+
+
+def encode_rule(text: str) -> str:
+    """
+    Encode sandhi rule notation, where a bare consonant letter stands for
+    the consonant alone (``'म्'`` and ``'म'`` both encode to ``m``).
+    """
+    return text.translate(_ENCODE_RULE)
+
+
+def decode(text: str) -> str:
+    """
+    Decode SLP1 text back to Devanagari.
+
+    Args:
+        text (str): SLP1 text
+
+    Returns:
+        str: Devanagari text, e.g. ``gacCati`` -> गच्छति
+    """
+    text = text.translate(_DECODE).replace(_PENDING_VIRAMA + _VOWEL_SIGN, '')
+    if _VOWEL_SIGN in text:
+        text = _UNATTACHED_VOWEL.sub(_independent_vowel, text)
+    return text.replace(_PENDING_VIRAMA, _VIRAMA)
@@ -0,0 +1,135 @@
+"""
+Segmentation lattices with lazy best-k path extraction.
+
+A Lattice is a directed acyclic graph whose edges are labelled segments of
+a word with a cost. Paths from the start state to the final state are the
+segmentations of the word, and there can be exponentially many of them.
+
+best_paths() enumerates them cheapest first with the recursive enumeration
+algorithm (Jiménez and Marzal, 1999). Every state keeps the completions
+found so far and a heap of candidates for the next one; a parent asks a
+state for its k-th completion only when it needs it. A completion is
+therefore computed once and shared by every path through the state, and
+the first k paths cost about k heap operations per state on the path once
+the best costs are known.
+"""
+
+import heapq
+from typing import Dict, Hashable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class Segment(NamedTuple):
+    """One labelled span of the word, ``word[start:end]``."""
+    kind: str
+    text: str
+    start: int
+    end: int
+    root: Optional[str] = None
+
+
+class LatticePath(NamedTuple):
+    """A complete segmentation and its total cost (lower is better)."""
+    cost: int
+    segments: Tuple[Segment, ...]
+
+
+# An edge: (cost, segment, target state)
+Edge = Tuple[int, Segment, Hashable]
+
+
+class Lattice:
+    """
+    Acyclic graph of segments between a start and a final state.
+
+    Edge costs must be non-negative and the graph must have no cycles.
+    """
+
+    def __init__(self, start: Hashable, final: Hashable):
+        self.start = start
+        self.final = final
+        self._edges: Dict[Hashable, List[Edge]] = {}
+        # Per state: [completions found, candidate heap, edge and target rank
+        # of the last completion]; completions are (cost, edge index or None
+        # for the final state, rank at the target)
+        self._paths: Dict[Hashable, list] = {}
+
+    def add_edge(self, source: Hashable, target: Hashable, segment: Segment, cost: int) -> None:
+        """Add an edge; among paths of equal cost, edges added first win."""
+        self._edges.setdefault(source, []).append((cost, segment, target))
+        self._paths.clear()
+
+    def edges(self, state: Hashable) -> List[Edge]:
+        """Return the edges leaving a state, in insertion order."""
+        return list(self._edges.get(state, ()))
+
+    def __len__(self) -> int:
+        """Number of edges."""
+        return sum(map(len, self._edges.values()))
+
+    def count_paths(self) -> int:
+        """Return the number of complete paths, without enumerating them."""
+        counts = {}
+
+        def count(state):
+            if state not in counts:
+                total = 1 if state == self.final else 0
+                for _, _, target in self._edges.get(state, ()):
+                    total += count(target)
+                counts[state] = total
+            return counts[state]
+
+        return count(self.start)
+
+    def _completion(self, state: Hashable, rank: int) -> Optional[tuple]:
+        """Return the rank-th cheapest completion from a state, or None."""
+        entry = self._paths.get(state)
+        if entry is None:
+            found = [(0, None, 0)] if state == self.final else []
+            heap = []
+            for index, (cost, _, target) in enumerate(self._edges.get(state, ())):
+                best = self._completion(target, 0)
+                if best is not None:
+                    heap.append((cost + best[0], index, 0))
+            heapq.heapify(heap)
+            entry = self._paths[state] = [found, heap, None]
+
+        found, heap, _ = entry
+        while len(found) <= rank:
+            # The successor of the last completion (the target's next one)
+            # is only computed once a further completion is requested
+            if entry[2] is not None:
+                index, target_rank = entry[2]
+                entry[2] = None
+                cost, _, target = self._edges[state][index]
+                following = self._completion(target, target_rank + 1)
+                if following is not None:
+                    heapq.heappush(heap, (cost + following[0], index, target_rank + 1))
+            if not heap:
+                break
+            completion = heapq.heappop(heap)
+            found.append(completion)
+            entry[2] = completion[1:]
+        return found[rank] if rank < len(found) else None
+
+    def path(self, rank: int) -> Optional[LatticePath]:
+        """Return the rank-th cheapest path (0 is the best), or None."""
+        first = self._completion(self.start, rank)
+        if first is None:
+            return None
+        segments = []
+        state, completion = self.start, first
+        while completion[1] is not None:
+            _, segment, state = self._edges[state][completion[1]]
+            segments.append(segment)
+            completion = self._completion(state, completion[2])
+        return LatticePath(first[0], tuple(segments))
+
+    def best_paths(self) -> Iterator[LatticePath]:
+        """Yield every path, cheapest first, computing each only when requested."""
+        rank = 0
+        while True:
+            path = self.path(rank)
+            if path is None:
+                return
+            yield path
+            rank += 1
@@ -1,11 +1,12 @@
 import re
+from itertools import islice
 
-# Sample dictionary of Sanskrit roots (धातु) with possible suffixes
-SANSKRIT_DHATUS = {
-    "गम्": ["ति", "तः", "न्ति", "सि", "थः", "थ", "मि", "वः", "मः"],  # Example conjugations for "गम्" (to go)
-    "भू": ["ति", "तः", "न्ति"],  # Example conjugations for "भू" (to be)
-    "कृ": ["ति", "तः", "न्ति"],  # Example conjugations for "कृ" (to do)
-}
+from .conjugation import get_endings
+from .dhatu_db import get_dhatu_database
+from .lattice import Lattice, Segment
+from .segmentation import ANUSVARA, CANDRABINDU, MATRA, NUKTA, VIRAMA, VISARGA, char_class
+from .transliteration import iast_to_devanagari
+from .trie import SuffixTrie, Trie
 
 UPASARGA_LIST = [
     "प्र", "पर", "अप", "सम्", "अति", "अधि", "नि", "निर्", "दुर्", "दुस्",
@@ -54,52 +55,151 @@ SANDHI_PRATYAYA_LIST = [
 ]
 DHATU_PRATYAYA_LIST = [
     "ति", "तः", "न्ति", "सि", "थः", "थ", "मि", "वः", "मः",  # Present (लट्)
-    "ताम्", "ताताम्", "अन"  # Imperative (लोट्)
+    "ताम्", "ताताम्", "अन",  # Imperative (लोट्)
     "स्यति", "स्यतः", "स्यन्ति", "स्स्यसि", "स्यथः", "स्यथ",  # Future (लृट्)
     "अम्", "आः", "अत", "आम", "आताम्", "अन्",  # Past (लङ्, लिट्, लुट्)
 ]
-PRATYAYA_LIST = KRIT_PRATYAYA_LIST + TADDHITA_PRATYAYA_LIST + SARVANAMA_PRATYAYA_LIST + VIBHAKTI_PRATYAYA_LIST + SANDHI_PRATYAYA_LIST + DHATU_PRATYAYA_LIST
 
+# Pratyaya lists by category
+PRATYAYA_CATEGORIES = {
+    "krit": KRIT_PRATYAYA_LIST,
+    "taddhita": TADDHITA_PRATYAYA_LIST,
+    "sarvanama": SARVANAMA_PRATYAYA_LIST,
+    "vibhakti": VIBHAKTI_PRATYAYA_LIST,
+    "sandhi": SANDHI_PRATYAYA_LIST,
+    "dhatu": DHATU_PRATYAYA_LIST,
+}
+
+def _index_pratyayas():
+    categories = {}
+    for category, pratyayas in PRATYAYA_CATEGORIES.items():
+        for pratyaya in pratyayas:
+            found = categories.setdefault(pratyaya, [])
+            if category not in found:
+                found.append(category)
+    return {pratyaya: tuple(found) for pratyaya, found in categories.items()}
+
+# Every pratyaya once, in first-occurrence order, with its categories
+PRATYAYA_INDEX = _index_pratyayas()
+PRATYAYA_LIST = list(PRATYAYA_INDEX)
+
+# Compiled once: upasargas are matched forwards, endings and pratyayas
+# backwards, in one pass over the word however large the lists grow
+_UPASARGA_TRIE = Trie(UPASARGA_LIST)
+_PRATYAYA_TRIE = SuffixTrie(PRATYAYA_INDEX.items())
+
+def _present_endings():
+    """
+    लट् endings of both padas as they follow a stem, each with the ending
+    it reports: the plain endings, the thematic ones (भव + ेते) and the
+    उत्तमपुरुष endings in म and व after the lengthened thematic अ (भव + ामि).
+    """
+    endings = {}
+    for pada in ("परस्मैपद", "आत्मनेपद"):
+        plain = get_endings("लट्", pada)
+        for ending, thematic in zip(plain, get_endings("लट्", pada, thematic=True)):
+            endings[ending] = ending
+            endings.setdefault(thematic, ending)
+            if ending[0] in "मव":
+                endings["ा" + ending] = "आ" + ending
+    return endings.items()
+
+# लट् endings, mapped to the ending reported for them
+_PRESENT_ENDING_TRIE = SuffixTrie(_present_endings())
+
+def find_pratyayas(word):
+    """
+    Find every pratyaya (suffix) that ends a Devanagari word, with the
+    categories it belongs to, in one backward scan.
+
+    :return: List of ``(pratyaya, categories)`` pairs, longest first;
+        categories is a tuple of PRATYAYA_CATEGORIES keys
+    """
+    return [(word[start:], categories) for start, categories in reversed(list(_PRATYAYA_TRIE.iter_suffixes(word)))]
 
 def identify_pratyaya(word):
     """
     Identify the suffix (Pratyaya) in a given Sanskrit word.
+
+    :param word: Word in Devanagari
+    :return: The longest pratyaya ending the word, or None
+    """
+    match = _PRATYAYA_TRIE.longest_suffix(word)
+    return None if match is None else word[match[0]:]
+
+# Entries kept by the memo of identify_pratyaya_many before it is reset
+_BATCH_MEMO_SIZE = 65536
+
+def identify_pratyaya_many(words):
+    """
+    Identifies the suffixes of a batch of words. Repeated words are matched
+    once, from a memo that is reset when it grows large.
+
+    :param words: Iterable of words in Devanagari
+    :return: List with the result of identify_pratyaya for each word, in
+        input order
+    """
+    seen = {}
+    results = []
+    for word in words:
+        pratyaya = seen.get(word, seen)
+        if pratyaya is seen:
+            if len(seen) >= _BATCH_MEMO_SIZE:
+                seen.clear()
+            pratyaya = seen[word] = identify_pratyaya(word)
+        results.append(pratyaya)
+    return results
+
+def match_upasargas(word):
+    """
+    Find every upasarga (prefix) that begins a Devanagari word.
+
+    :return: List of upasargas, longest first
+    """
+    return [word[:end] for end, _ in reversed(list(_UPASARGA_TRIE.iter_prefixes(word)))]
+
+def match_pratyayas(word):
     """
-    for pratyaya in PRATYAYA_LIST:
-        if word.endswith(pratyaya):
-            return pratyaya
-    return None
+    Find every pratyaya (suffix) that ends a Devanagari word.
+
+    :return: List of pratyayas, longest first
+    """
+    return [pratyaya for pratyaya, _ in find_pratyayas(word)]
 
 def analyze_sanskrit_word(word):
     """
     Sanskrit Morphological Analyzer: Identifies root, suffix, prefix
     and grammatical features of a given Sanskrit word.
+
+    The longest matching upasarga and pratyaya are taken.
     """
+    word = iast_to_devanagari(word)
     root = None
     suffix = None
     prefix = None
 
     # Checking for Upasarga (Prefix)
-    for upasarga in UPASARGA_LIST:
-        if word.startswith(upasarga):
-            prefix = upasarga
-            word = word[len(upasarga):]  # Remove the prefix
-            break  # Assuming single prefix
-
-    # Checking for Dhatu (Root)
-    for dhatu, suffixes in SANSKRIT_DHATUS.items():
-        for suf in suffixes:
-            if word.endswith(suf):
-                root = dhatu
-                suffix = suf
-                break
-        if root:
+    match = _UPASARGA_TRIE.longest_prefix(word)
+    if match is not None:
+        end = match[0]
+        prefix = word[:end]
+        word = word[end:]  # Remove the prefix; assuming single prefix
+
+    # Checking for Dhatu (Root): strip a present-tense ending and look the
+    # stem up in the root lexicon, longest ending first; a matra ending
+    # leaves the stem's thematic अ in place (भवामि -> भव + आमि)
+    dhatus = get_dhatu_database()
+    for start, ending in reversed(list(_PRESENT_ENDING_TRIE.iter_suffixes(word))):
+        dhatu = dhatus.find(word[:start])
+        if dhatu:
+            root = dhatu[0].root
+            suffix = ending
             break
 
     # Checking for Pratyaya (Suffix)
     additional_suffix = None
-    for pratyaya in PRATYAYA_LIST:
-        if word.endswith(pratyaya) and pratyaya != suffix:
+    for pratyaya in match_pratyayas(word):
+        if pratyaya != suffix:
             additional_suffix = pratyaya
             break
 
@@ -111,3 +211,62 @@ def analyze_sanskrit_word(word):
         "additional_suffix": additional_suffix
     }
 
+# Suffixes of the lattice: pratyayas and verb endings, matched forwards
+_AFFIX_TRIE = Trie(PRATYAYA_LIST + list(get_endings("लट्", "परस्मैपद") + get_endings("लट्", "आत्मनेपद")))
+
+# A stem cannot start with a sign that attaches to the previous letter
+_ATTACHED_CLASSES = frozenset((MATRA, VIRAMA, ANUSVARA, VISARGA, CANDRABINDU, NUKTA))
+
+# Lattice states: position in the word and whether the root is behind it
+_BEFORE_ROOT = 0
+_AFTER_ROOT = 1
+
+def segmentation_lattice(word):
+    """
+    Builds the lattice of every upasarga* + root + pratyaya* segmentation
+    of a word.
+
+    Roots are roots or stems of the lexicon. Any other span may stand as an
+    unknown stem (segment kind ``"stem"``, root None), so every word has
+    a path. Each segment costs 1 and an unknown stem costs more than any
+    number of segments, so analyses with a lexicon root come first, then
+    those with fewer segments; ties prefer the shorter stem and the longer
+    affix.
+
+    :param word: Word in Devanagari or IAST
+    :return: Lattice whose best_paths() yields the segmentations lazily
+    """
+    word = iast_to_devanagari(word)
+    length = len(word)
+    unknown_cost = 1 + length + 1
+    lattice = Lattice((0, _BEFORE_ROOT), (length, _AFTER_ROOT))
+    dhatus = get_dhatu_database()
+
+    for start in range(length):
+        before, after = (start, _BEFORE_ROOT), (start, _AFTER_ROOT)
+        for end, _ in reversed(list(_UPASARGA_TRIE.iter_prefixes(word, start))):
+            lattice.add_edge(before, (end, _BEFORE_ROOT), Segment("upasarga", word[start:end], start, end), 1)
+
+        for end in range(start + 1, length + 1):
+            text = word[start:end]
+            roots = dict.fromkeys(dhatu.root for dhatu in dhatus.find(text))
+            for root in roots:
+                lattice.add_edge(before, (end, _AFTER_ROOT), Segment("root", text, start, end, root), 1)
+            if not roots and char_class(word[start]) not in _ATTACHED_CLASSES:
+                lattice.add_edge(before, (end, _AFTER_ROOT), Segment("stem", text, start, end), unknown_cost)
+
+        for end, _ in reversed(list(_AFFIX_TRIE.iter_prefixes(word, start))):
+            lattice.add_edge(after, (end, _AFTER_ROOT), Segment("pratyaya", word[start:end], start, end), 1)
+
+    return lattice
+
+def best_segmentations(word, k=5):
+    """
+    Returns the k best segmentations of a word, best first.
+
+    :param word: Word in Devanagari or IAST
+    :param k: Number of segmentations; None for all of them (use
+        segmentation_lattice(word).best_paths() to consume them lazily)
+    :return: List of LatticePath ``(cost, segments)`` tuples
+    """
+    return list(islice(segmentation_lattice(word).best_paths(), k))
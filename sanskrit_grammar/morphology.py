@@ -1,4 +1,13 @@
-from .sandhi import sandhi_handler
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .caching import CacheStats, OptionalLRUCache
+from .conjugation import LAKARAS, PADAS, PARADIGM_SIZE, PURUSHAS, VACHANAS, get_endings
+from .dhatu_db import get_dhatu_database
+from .encoding import CONSONANTS, decode, encode, encode_text
+from .parallel import iter_chunks, ordered_map
+from .sandhi import SandhiRuleTable, WORD_JOINS
+from .transliteration import iast_to_devanagari
+from .verb_stems import STEM_CODES, derive_lakara_stems, derive_verb_stem
 
 def apply_guna(vowel: str) -> str:
     """Apply guna strengthening to vowels."""
@@ -22,70 +31,217 @@ def apply_vrddhi(vowel: str) -> str:
     }
     return vrddhi_map.get(vowel, vowel)
 
+_VOWELS = 'अआइईउऊऋॠएऐओऔ'
+
+# Stem + ending boundary rules on phonemes, falling back to the general word rules
+STEM_SANDHI_JOINS = SandhiRuleTable({
+    # Before endings starting with a vowel: भू + अ -> भव
+    **{('ू', vowel): 'अव' + vowel for vowel in _VOWELS},
+    ('ो', 'अ'): 'अवअ',  # भो + अति -> भवति
+    ('े', 'अ'): 'अयअ',  # ने + अति -> नयति
+    ('अ', 'आ'): 'आ',    # नय + आनि -> नयानि
+}).merged(WORD_JOINS)
+
+def _join_stem(stem: str, suffix: str) -> str:
+    if not suffix:
+        return stem
+
+    return STEM_SANDHI_JOINS.join(stem, suffix)
+
+_STEM_SANDHI_CACHE = OptionalLRUCache(_join_stem)
+
 def apply_stem_sandhi(stem: str, suffix: str) -> str:
     """
     Apply sandhi rules between stem and suffix.
     """
-    if not suffix:
-        return stem
-        
-    # Special handling for verb endings starting with vowels
-    if suffix and suffix[0] in 'अआइईउऊऋॠएऐओऔ':
-        # Handle roots ending in ू (भू)
-        if stem.endswith('ू'):
-            stem = stem[:-1] + 'व'
-        # Handle other semi-vowel transitions
-        elif stem.endswith('व्'):
-            stem = stem[:-2] + 'व'
-        elif stem.endswith('य्'):
-            stem = stem[:-2] + 'य'
-            
-    # Handle special sandhi cases
-    if suffix.startswith('अ'):
-        if stem.endswith('ो'):  # भो + अति -> भवति
-            stem = stem[:-1] + 'व'
-        elif stem.endswith('े'):  # ने + अति -> नयति
-            stem = stem[:-1] + 'य'
-            
-    # Handle vowel sandhi for imperative mood
-    if suffix.startswith('आ'):
-        if stem.endswith('य'):
-            return stem + suffix[1:]  # नय + आनि -> नयानि
-            
-    return sandhi_handler(stem, suffix)
+    return _STEM_SANDHI_CACHE.call(stem, suffix)
+
+# लकार names and codes accepted by modify_verb_stem, as indexes into LAKARAS
+_STEM_LAKARA_INDEX = {
+    **{lakara: index for index, lakara in enumerate(LAKARAS)},
+    **{code: LAKARAS.index(lakara) for lakara, code in STEM_CODES.items()},
+}
+
+def lakara_stems(dhatu: str) -> Tuple[str, ...]:
+    """
+    Return the stems of a root for every लकार, in LAKARAS order.
+
+    Roots of the lexicon use the stems stored with it (see dhatu_db);
+    others are derived by rule.
+    """
+    stems = get_dhatu_database().lakara_stems(dhatu)
+    if stems is None:
+        stems = derive_lakara_stems(dhatu)
+    return stems
+
+def _verb_stem(dhatu: str, lakara: str) -> str:
+    index = _STEM_LAKARA_INDEX.get(lakara)
+    stems = None if index is None else get_dhatu_database().lakara_stems(dhatu)
+    if stems is None:
+        return derive_verb_stem(dhatu, lakara)
+    return stems[index]
+
+_VERB_STEM_CACHE = OptionalLRUCache(_verb_stem)
 
 def modify_verb_stem(dhatu: str, lakara: str) -> str:
     """
     Apply verb stem modifications based on tense/mood.
+
+    Stems of lexicon roots are looked up, not recomputed (see lakara_stems).
     """
-    # Basic verb stem modifications
-    if lakara == 'lat':  # Present tense
-        # Special handling for भू
-        if dhatu == 'भू':
-            return 'भव'  # Direct transformation for present tense
-            
-        # For roots ending in vowels, apply guna
-        if dhatu[-1] in 'िीुूृॄ':
-            if dhatu[-1] in 'िी':
-                return dhatu[:-1] + 'य्'  # Add 'य्' after guna for i/ī
-            elif dhatu[-1] in 'ुू':
-                return dhatu[:-1] + 'व्'  # Add 'व्' after guna for u/ū
-            else:
-                return dhatu[:-1] + apply_guna(dhatu[-1])
-    
-    elif lakara == 'lot':  # Imperative
-        # Special handling for imperative mood
-        if dhatu == 'भू':
-            return 'भव'
-        elif dhatu == 'नी':
-            return 'नय'  # Direct transformation for imperative
-        elif dhatu[-1] in 'िीुूृॄ':
-            if dhatu[-1] in 'िी':
-                return dhatu[:-1] + 'य'
-            elif dhatu[-1] in 'ुू':
-                return dhatu[:-1] + 'व'
-                
-    return dhatu
+    return _VERB_STEM_CACHE.call(dhatu, lakara)
+
+# Caches behind apply_stem_sandhi and modify_verb_stem, off by default
+_CACHES = {
+    'apply_stem_sandhi': _STEM_SANDHI_CACHE,
+    'modify_verb_stem': _VERB_STEM_CACHE,
+}
+
+DEFAULT_CACHE_SIZE = 65536
+
+def enable_cache(maxsize: Optional[int] = DEFAULT_CACHE_SIZE) -> None:
+    """
+    Memoize apply_stem_sandhi and modify_verb_stem.
+
+    Useful when generating paradigms for large stem lists, where the same
+    (stem, suffix) joins repeat constantly. Enabling again resizes and
+    empties the caches.
+
+    Args:
+        maxsize (int): Entries kept per function, least recently used
+            evicted first; None for unbounded caches
+    """
+    for cache in _CACHES.values():
+        cache.enable(maxsize)
+
+def disable_cache() -> None:
+    """Turn memoization off and release the cached entries."""
+    for cache in _CACHES.values():
+        cache.disable()
+
+def clear_cache() -> None:
+    """Empty the caches and reset their counters, keeping them enabled."""
+    for cache in _CACHES.values():
+        cache.clear()
+
+def cache_stats() -> Dict[str, CacheStats]:
+    """
+    Return hit, miss and eviction counters.
+
+    Returns:
+        Dict[str, CacheStats]: Counters keyed by function name
+    """
+    return {name: cache.stats() for name, cache in _CACHES.items()}
+
+# Sanskrit cases (विभक्ति), in paradigm order
+CASES = ("प्रथमा", "द्वितीया", "तृतीया", "चतुर्थी", "पञ्चमी", "षष्ठी", "सप्तमी", "सम्बोधन")
+
+# Numbers (वचन)
+NUMBERS = ("एकवचन", "द्विवचन", "बहुवचन")
+
+# Noun endings by gender, one row of (singular, dual, plural) per case
+NOUN_SUFFIXES = {
+    'm': (  # Masculine endings (अकारान्त पुंल्लिङ्ग)
+        ('ः', 'ौ', 'ाः'),
+        ('म्', 'ौ', 'ान्'),
+        ('ेन', 'ाभ्याम्', 'ैः'),
+        ('ाय', 'ाभ्याम्', 'ेभ्यः'),
+        ('ात्', 'ाभ्याम्', 'ेभ्यः'),
+        ('स्य', 'योः', 'ानाम्'),
+        ('े', 'योः', 'ेषु'),
+        ('', 'ौ', 'ाः'),
+    ),
+    'f': (  # Feminine endings (आकारान्त स्त्रीलिङ्ग)
+        ('ा', 'े', 'ाः'),
+        ('ाम्', 'े', 'ाः'),
+        ('या', 'ाभ्याम्', 'ाभिः'),
+        ('ायै', 'ाभ्याम्', 'ाभ्यः'),
+        ('ायाः', 'ाभ्याम्', 'ाभ्यः'),
+        ('ायाः', 'योः', 'ानाम्'),
+        ('ायाम्', 'योः', 'ासु'),
+        ('े', 'े', 'ाः'),
+    ),
+    'n': (  # Neuter endings (अकारान्त नपुंसकलिङ्ग)
+        ('म्', 'े', 'ानि'),
+        ('म्', 'े', 'ानि'),
+        ('ेन', 'ाभ्याम्', 'ैः'),
+        ('ाय', 'ाभ्याम्', 'ेभ्यः'),
+        ('ात्', 'ाभ्याम्', 'ेभ्यः'),
+        ('स्य', 'योः', 'ानाम्'),
+        ('े', 'योः', 'ेषु'),
+        ('', 'े', 'ानि'),
+    ),
+}
+
+FORMS_PER_STEM = len(CASES) * len(NUMBERS)
+
+class Paradigm:
+    """
+    A declension paradigm compiled for bulk use.
+
+    Endings are kept flat in (case, number) order. The joined endings of a
+    stem depend only on its last few phonemes, so they are resolved once per
+    distinct stem final and kept, already rendered in Devanagari, as tails:
+    every form is the unchanged head of the stem text plus a tail.
+    """
+
+    def __init__(self, gender: str, rows):
+        self.gender = gender
+        self.suffixes = tuple(suffix for row in rows for suffix in row)
+        self._encoded = tuple(encode(suffix) for suffix in self.suffixes)
+        self._context = STEM_SANDHI_JOINS.context[0]
+        # Stem final (SLP1) -> (final as text, encoded tails, text tails)
+        self._templates = {}
+
+    def _template(self, final: str):
+        template = self._templates.get(final)
+        if template is None:
+            join = STEM_SANDHI_JOINS.join_encoded
+            tails = tuple(join(final, suffix) if suffix else final for suffix in self._encoded)
+            template = (decode(final), tails, tuple(decode(tail) for tail in tails))
+            self._templates[final] = template
+        return template
+
+    def decline(self, stem: str) -> List[str]:
+        """
+        Return the forms of a stem in (case, number) order.
+
+        Raises:
+            IndexError: If the stem is empty
+        """
+        encoded = encode_text(stem)
+        if not encoded:
+            raise IndexError("cannot decline an empty stem")
+        # The final starts after a vowel (or at the start), so the text
+        # before it is written the same way in every form.
+        start = max(len(encoded) - self._context, 0)
+        while start and encoded[start - 1] in CONSONANTS:
+            start -= 1
+        final_text, tails, text_tails = self._template(encoded[start:])
+        if stem.endswith(final_text):
+            head = stem[:len(stem) - len(final_text)]
+            return [head + tail for tail in text_tails]
+        # Stem not in canonical spelling: render every form
+        head = encoded[:start]
+        return [decode(head + tail) for tail in tails]
+
+_PARADIGMS: Dict[str, Paradigm] = {}
+
+def get_paradigm(gender: str) -> Paradigm:
+    """
+    Return the compiled paradigm for a gender ('m', 'f' or 'n').
+
+    Paradigms are compiled on first use and shared afterwards.
+
+    Raises:
+        ValueError: If the gender has no paradigm
+    """
+    paradigm = _PARADIGMS.get(gender)
+    if paradigm is None:
+        if gender not in NOUN_SUFFIXES:
+            raise ValueError(f"Unknown gender: {gender!r}")
+        paradigm = _PARADIGMS[gender] = Paradigm(gender, NOUN_SUFFIXES[gender])
+    return paradigm
 
 def generate_noun_forms(noun: str, gender: str):
     """
@@ -98,145 +254,211 @@ def generate_noun_forms(noun: str, gender: str):
     Returns:
         dict: A dictionary containing all declension forms organized by case and number
     """
-    # Sanskrit cases (विभक्ति)
-    cases = {
-        1: "प्रथमा",  # Nominative
-        2: "द्वितीया",  # Accusative
-        3: "तृतीया",  # Instrumental
-        4: "चतुर्थी",  # Dative
-        5: "पञ्चमी",  # Ablative
-        6: "षष्ठी",  # Genitive
-        7: "सप्तमी",  # Locative
-        8: "सम्बोधन"  # Vocative
-    }
-    
-    # Numbers (वचन)
-    numbers = ["एकवचन", "द्विवचन", "बहुवचन"]
-    
-    # Suffix mappings based on gender and case
-    suffixes = {
-        'm': {  # Masculine endings (अकारान्त पुंल्लिङ्ग)
-            1: ['ः', 'ौ', 'ाः'],
-            2: ['म्', 'ौ', 'ान्'],
-            3: ['ेन', 'ाभ्याम्', 'ैः'],
-            4: ['ाय', 'ाभ्याम्', 'ेभ्यः'],
-            5: ['ात्', 'ाभ्याम्', 'ेभ्यः'],
-            6: ['स्य', 'योः', 'ानाम्'],
-            7: ['े', 'योः', 'ेषु'],
-            8: ['', 'ौ', 'ाः']
-        },
-        'f': {  # Feminine endings (आकारान्त स्त्रीलिङ्ग)
-            1: ['ा', 'े', 'ाः'],
-            2: ['ाम्', 'े', 'ाः'],
-            3: ['या', 'ाभ्याम्', 'ाभिः'],
-            4: ['ायै', 'ाभ्याम्', 'ाभ्यः'],
-            5: ['ायाः', 'ाभ्याम्', 'ाभ्यः'],
-            6: ['ायाः', 'योः', 'ानाम्'],
-            7: ['ायाम्', 'योः', 'ासु'],
-            8: ['े', 'े', 'ाः']
-        },
-        'n': {  # Neuter endings (अकारान्त नपुंसकलिङ्ग)
-            1: ['म्', 'े', 'ानि'],
-            2: ['म्', 'े', 'ानि'],
-            3: ['ेन', 'ाभ्याम्', 'ैः'],
-            4: ['ाय', 'ाभ्याम्', 'ेभ्यः'],
-            5: ['ात्', 'ाभ्याम्', 'ेभ्यः'],
-            6: ['स्य', 'योः', 'ानाम्'],
-            7: ['े', 'योः', 'ेषु'],
-            8: ['', 'े', 'ानि']
-        }
+    rows = NOUN_SUFFIXES.get(gender)
+    if rows is None:
+        return {case: {} for case in CASES}
+
+    return {
+        case: {number: apply_stem_sandhi(noun, suffix) for number, suffix in zip(NUMBERS, row)}
+        for case, row in zip(CASES, rows)
     }
-    
-    # Initialize result dictionary
-    declensions = {}
-    
-    # Generate forms for each case and number
-    for case in cases:
-        declensions[cases[case]] = {}
-        for i, number in enumerate(numbers):
-            # Handle stem modifications based on gender and case
-            stem = noun
-            if gender in suffixes and case in suffixes[gender]:
-                suffix = suffixes[gender][case][i]
-                # Apply sandhi rules between stem and suffix
-                declensions[cases[case]][number] = apply_stem_sandhi(stem, suffix)
-    
-    return declensions
+
+class DeclensionTable:
+    """
+    Columnar declensions of many stems.
+
+    The form of stem ``i`` in case ``c`` and number ``n`` (all 0-based) is
+    ``forms[(i * len(CASES) + c) * len(NUMBERS) + n]``.
+    """
+
+    __slots__ = ("gender", "stems", "forms")
+
+    def __init__(self, gender: str, stems: List[str], forms: List[str]):
+        self.gender = gender
+        self.stems = stems
+        self.forms = forms
+
+    def __len__(self) -> int:
+        return len(self.stems)
+
+    def form(self, stem_index: int, case: int, number: int) -> str:
+        """Return one form by stem, case and number index."""
+        return self.forms[(stem_index * len(CASES) + case) * len(NUMBERS) + number]
+
+    def paradigm(self, stem_index: int) -> dict:
+        """Return the forms of one stem shaped like generate_noun_forms()."""
+        start = stem_index * FORMS_PER_STEM
+        forms = iter(self.forms[start:start + FORMS_PER_STEM])
+        return {case: {number: next(forms) for number in NUMBERS} for case in CASES}
+
+    def iter_rows(self) -> Iterator[Tuple[str, str, str, str]]:
+        """Yield ``(stem, case, number, form)`` rows."""
+        forms = iter(self.forms)
+        for stem in self.stems:
+            for case in CASES:
+                for number in NUMBERS:
+                    yield stem, case, number, next(forms)
+
+    def write_tsv(self, file: TextIO) -> None:
+        """Write one line per stem: the stem followed by its forms, tab-separated."""
+        for index, stem in enumerate(self.stems):
+            start = index * FORMS_PER_STEM
+            file.write(stem + "\t" + "\t".join(self.forms[start:start + FORMS_PER_STEM]) + "\n")
+
+def iter_decline(stems: Iterable[str], gender: str) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Lazily decline many stems.
+
+    Args:
+        stems: Iterable of noun stems
+        gender (str): 'm', 'f' or 'n'
+
+    Yields:
+        Tuple[str, List[str]]: Each stem with its forms in (case, number) order
+
+    Raises:
+        ValueError: If the gender has no paradigm
+    """
+    decline = get_paradigm(gender).decline
+    for stem in stems:
+        yield stem, decline(stem)
+
+def decline_many(stems: Iterable[str], gender: str) -> DeclensionTable:
+    """
+    Decline a list of stems at once.
+
+    Produces the same forms as generate_noun_forms() for each stem, in a
+    flat columnar table instead of nested dicts.
+
+    Args:
+        stems: Iterable of noun stems
+        gender (str): 'm', 'f' or 'n'
+
+    Returns:
+        DeclensionTable: Forms indexed by stem, case and number
+
+    Raises:
+        ValueError: If the gender has no paradigm
+    """
+    stem_list = []
+    forms = []
+    for stem, stem_forms in iter_decline(stems, gender):
+        stem_list.append(stem)
+        forms.extend(stem_forms)
+    return DeclensionTable(gender, stem_list, forms)
+
+def write_declensions(stems: Iterable[str], gender: str, file: TextIO) -> int:
+    """
+    Stream the declensions of many stems to a TSV file.
+
+    Writes the same lines as DeclensionTable.write_tsv() without holding
+    the whole table in memory.
+
+    Returns:
+        int: Number of stems written
+    """
+    count = 0
+    for stem, forms in iter_decline(stems, gender):
+        file.write(stem + "\t" + "\t".join(forms) + "\n")
+        count += 1
+    return count
+
+# Codes accepted by generate_verb_forms
+_VERB_LAKARAS = {'lat': 'लट्', 'lot': 'लोट्'}
+_VERB_PADAS = {'p': 'परस्मैपद', 'a': 'आत्मनेपद'}
 
 def generate_verb_forms(dhatu: str, pada: str, lakara: str):
     """
     Generate all conjugated forms of a verb root (धातु) for given लकार.
     
     Args:
-        dhatu (str): The verb root (धातु)
+        dhatu (str): The verb root (धातु), in Devanagari or IAST
         pada (str): Voice of the verb ('p' for परस्मैपद, 'a' for आत्मनेपद)
         lakara (str): Tense/Mood ('lat' for लट्, 'lot' for लोट्, etc.)
     
     Returns:
         dict: A dictionary containing all conjugated forms organized by person and number
     """
-    # Persons (पुरुष)
-    persons = {
-        1: "प्रथम",  # Third person
-        2: "मध्यम",  # Second person
-        3: "उत्तम"   # First person
-    }
-    
-    # Numbers (वचन)
-    numbers = ["एकवचन", "द्विवचन", "बहुवचन"]
-    
-    # Verb endings based on pada and lakara
-    endings = {
-        'p': {  # परस्मैपद endings
-            'lat': {  # Present tense
-                1: ['ति', 'तः', 'न्ति'],
-                2: ['सि', 'थः', 'थ'],
-                3: ['मि', 'वः', 'मः']
-            },
-            'lot': {  # Imperative
-                1: ['तु', 'ताम्', 'न्तु'],
-                2: ['हि', 'तम्', 'त'],
-                3: ['आनि', 'आव', 'आम']
-            }
-        },
-        'a': {  # आत्मनेपद endings
-            'lat': {
-                1: ['ते', 'ेते', 'न्ते'],
-                2: ['से', 'ेथे', 'ध्वे'],
-                3: ['े', 'वहे', 'महे']
-            },
-            'lot': {
-                1: ['ताम्', 'ेताम्', 'न्ताम्'],
-                2: ['स्व', 'एथाम्', 'ध्वम्'],
-                3: ['ै', 'आवहै', 'आमहै']
-            }
-        }
-    }
-    
-    # Initialize result dictionary
-    conjugations = {}
-    
-    # Generate forms for each person and number
-    for person in persons:
-        conjugations[persons[person]] = {}
-        for i, number in enumerate(numbers):
-            # Get the appropriate ending
-            if pada in endings and lakara in endings[pada] and person in endings[pada][lakara]:
-                ending = endings[pada][lakara][person][i]
-                # Apply verb stem modifications based on tense and other rules
-                stem = modify_verb_stem(dhatu, lakara)
-                # Apply sandhi rules between stem and ending
-                form = apply_stem_sandhi(stem, ending)
-                
-                # Special handling for imperative forms
-                if lakara == 'lot' and person == 3:  # First person imperative
-                    if form.endswith('नि'):
-                        form = form[:-2] + 'ानि'  # Fix आनि ending
-                    elif form.endswith('व'):
-                        form = form[:-1] + 'ाव'  # Fix आव ending
-                    elif form.endswith('म'):
-                        form = form[:-1] + 'ाम'  # Fix आम ending
-                        
-                conjugations[persons[person]][number] = form
-    
+    dhatu = iast_to_devanagari(dhatu)
+
+    conjugations = {purusha: {} for purusha in PURUSHAS}
+    endings = get_endings(_VERB_LAKARAS.get(lakara), _VERB_PADAS.get(pada), thematic=True)
+    if endings is None:
+        return conjugations
+
+    # Apply verb stem modifications based on tense and other rules
+    stem = modify_verb_stem(dhatu, lakara)
+    endings = iter(endings)
+    for purusha in PURUSHAS:
+        forms = conjugations[purusha]
+        for vachana in VACHANAS:
+            # Apply sandhi rules between stem and ending
+            forms[vachana] = apply_stem_sandhi(stem, next(endings))
+
     return conjugations
+
+def finite_forms(dhatu: str) -> List[Tuple[int, int, int, int, str]]:
+    """
+    Generate every finite form of a root: each लकार and पद with endings,
+    in every पुरुष and वचन.
+
+    Stems come from lakara_stems() and are joined to the thematic endings
+    as in generate_verb_forms().
+
+    Args:
+        dhatu (str): The verb root (धातु), in Devanagari
+
+    Returns:
+        List[Tuple[int, int, int, int, str]]: ``(lakara, pada, purusha,
+        vachana, form)`` rows, with the features as indexes into LAKARAS,
+        PADAS, PURUSHAS and VACHANAS, in that order
+    """
+    rows = []
+    stems = lakara_stems(dhatu)
+    for lakara_index, lakara in enumerate(LAKARAS):
+        stem = stems[lakara_index]
+        for pada_index, pada in enumerate(PADAS):
+            endings = get_endings(lakara, pada, thematic=True)
+            if endings is None:
+                continue
+            for offset in range(PARADIGM_SIZE):
+                purusha, vachana = divmod(offset, len(VACHANAS))
+                rows.append((lakara_index, pada_index, purusha, vachana,
+                             apply_stem_sandhi(stem, endings[offset])))
+    return rows
+
+def _format_forms(dhatus: List[str]) -> Tuple[str, int]:
+    """Render the finite forms of a shard of roots as TSV lines."""
+    lines = []
+    for dhatu in dhatus:
+        for lakara, pada, purusha, vachana, form in finite_forms(dhatu):
+            lines.append(f"{dhatu}\t{lakara}\t{pada}\t{purusha}\t{vachana}\t{form}\n")
+    return "".join(lines), len(lines)
+
+def generate_all_forms(dhatus: Iterable[str], file: TextIO, workers: Optional[int] = 1,
+                       shard_size: int = 64) -> int:
+    """
+    Write every finite form of many roots to a TSV file.
+
+    Each line is ``dhatu, lakara, pada, purusha, vachana, form`` with the
+    four features as integer codes (indexes into conjugation.LAKARAS,
+    PADAS, PURUSHAS and VACHANAS). Roots are processed in shards on a
+    process pool; shards are written in input order, so the file is the
+    same for any number of workers, and only a few shards are held in
+    memory at a time.
+
+    Args:
+        dhatus: Iterable of verb roots, in Devanagari or IAST
+        file: Text file opened for writing
+        workers: Worker processes; None for one per CPU, 1 to run in-process
+        shard_size (int): Roots per task
+
+    Returns:
+        int: Number of forms written
+    """
+    shards = iter_chunks((iast_to_devanagari(dhatu) for dhatu in dhatus), shard_size)
+    count = 0
+    for text, rows in ordered_map(_format_forms, shards, workers):
+        file.write(text)
+        count += rows
+    return count
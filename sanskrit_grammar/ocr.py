@@ -0,0 +1,44 @@
+"""
+OCR helpers for extracting Sanskrit text from images.
+
+This module pulls in ``pytesseract`` and ``PIL`` at import time, so the
+package only loads it on first access to ``sanskrit_grammar.ocr_text_reaction``.
+"""
+
+import pytesseract
+from PIL import Image
+
+def ocr_text_reaction(image_path):
+    r"""
+    This function performs OCR on the image and returns the text extracted from it.
+    It can react to the extracted text based on specific conditions or triggers.
+    # You may need to specify the path to the tesseract executable if it's not in your PATH
+    # Example: 'C:/Program Files/Tesseract-OCR/tesseract.exe' for Windows
+    # pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+
+    Parameters:
+    image_path (str): Path to the image file from which text is to be extracted.
+
+    Returns:
+    str: The extracted text from the image.
+    """
+    try:
+        # Open the image using PIL
+        img = Image.open(image_path)
+
+        # Perform OCR using Tesseract
+        extracted_text = pytesseract.image_to_string(img)
+
+        # Reacting based on extracted text
+        print(f"Extracted Text: {extracted_text}")
+
+        # Example reaction: Check if certain keywords are found in the text
+        if "hello" in extracted_text.lower():
+            return "Hi! How can I assist you today?"
+        elif "thank you" in extracted_text.lower():
+            return "You're welcome!"
+        else:
+            return "Text extracted successfully!"
+
+    except Exception as e:
+        return f"Error processing the image: {str(e)}"
@@ -0,0 +1,157 @@
+"""
+Packed, memory-mapped files of sorted ``(key, payload)`` tables.
+
+A packed file holds one or more tables whose records are sorted by key, so
+a reader can bisect them in place: opening the file maps it and reads the
+header, nothing is parsed or copied, and processes that open the same file
+share it through the page cache.
+
+File layout (all integers little-endian)::
+
+    header   magic (4 bytes), version u32, table count u32
+    tables   for each table: record count u32,
+             (count + 1) u32 record offsets relative to the table's data,
+             data: records sorted by key (byte order), each
+             u16 key length, key, payload
+
+Records with equal keys are adjacent.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import Iterable, List, Sequence, Tuple
+
+_HEADER = struct.Struct("<4sII")
+_COUNT = struct.Struct("<I")
+_KEY_LENGTH = struct.Struct("<H")
+
+Record = Tuple[bytes, bytes]
+
+
+def _pack_table(records: Iterable[Record]) -> bytes:
+    offsets = array("I", [0])
+    data = bytearray()
+    for key, payload in sorted(records):
+        data += _KEY_LENGTH.pack(len(key)) + key + payload
+        offsets.append(len(data))
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    return _COUNT.pack(len(offsets) - 1) + offsets.tobytes() + bytes(data)
+
+
+def write_packed(path: str, magic: bytes, version: int, tables: Sequence[Iterable[Record]]) -> None:
+    """
+    Write tables of ``(key, payload)`` records, each sorted by key.
+
+    Args:
+        path (str): File to write
+        magic (bytes): Four bytes identifying the file type
+        version (int): Format version of the file type
+        tables: One iterable of records per table
+    """
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(magic, version, len(tables)))
+        for records in tables:
+            file.write(_pack_table(records))
+
+
+def pack_string(text: str) -> bytes:
+    """Encode a string as u16 length + UTF-8, for use inside payloads."""
+    data = text.encode("utf-8")
+    return _KEY_LENGTH.pack(len(data)) + data
+
+
+def unpack_string(buffer, position: int) -> Tuple[str, int]:
+    """Read a string written by pack_string(); return it and the position after it."""
+    length, = _KEY_LENGTH.unpack_from(buffer, position)
+    position += 2
+    return buffer[position:position + length].decode("utf-8"), position + length
+
+
+class PackedTable:
+    """One sorted table of a PackedFile, searched in place."""
+
+    def __init__(self, buffer: mmap.mmap, position: int):
+        self._buffer = buffer
+        self._count, = _COUNT.unpack_from(buffer, position)
+        start = position + _COUNT.size
+        self._data = start + 4 * (self._count + 1)
+        if sys.byteorder == "little":
+            self._offsets = memoryview(buffer)[start:self._data].cast("I")
+        else:
+            self._offsets = array("I", buffer[start:self._data])
+            self._offsets.byteswap()
+        self.end = self._data + self._offsets[self._count]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def key(self, index: int) -> bytes:
+        """Return the key of record ``index``."""
+        position = self._data + self._offsets[index]
+        length, = _KEY_LENGTH.unpack_from(self._buffer, position)
+        return self._buffer[position + 2:position + 2 + length]
+
+    def payload_position(self, index: int) -> int:
+        """Return where the payload of record ``index`` starts in the file."""
+        position = self._data + self._offsets[index]
+        length, = _KEY_LENGTH.unpack_from(self._buffer, position)
+        return position + 2 + length
+
+    def find(self, key: bytes) -> range:
+        """Return the indexes of the records whose key equals ``key``."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self.key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        end = low
+        while end < self._count and self.key(end) == key:
+            end += 1
+        return range(low, end)
+
+    def release(self) -> None:
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+
+
+class PackedFile:
+    """
+    A memory-mapped packed file.
+
+    Use as a context manager, or call close() when done.
+    """
+
+    def __init__(self, path: str, magic: bytes, version: int):
+        """
+        Raises:
+            ValueError: If the file does not have the expected magic and version
+        """
+        with open(path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        found_magic, found_version, count = _HEADER.unpack_from(self.buffer)
+        if found_magic != magic or found_version != version:
+            self.buffer.close()
+            raise ValueError(f"{path} is not a version {version} {magic.decode('ascii')} file")
+        self.tables: List[PackedTable] = []
+        position = _HEADER.size
+        for _ in range(count):
+            table = PackedTable(self.buffer, position)
+            self.tables.append(table)
+            position = table.end
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Release the mapping."""
+        for table in self.tables:
+            table.release()
+        self.buffer.close()
@@ -0,0 +1,82 @@
+"""
+Order-preserving parallel map over a process pool, with bounded memory.
+
+ordered_map() keeps at most ``max_pending`` tasks in flight and yields
+results in input order, so a consumer that writes results as they arrive
+produces the same output for any number of workers, and neither the input
+nor the output is ever held whole in memory.
+
+The process pool machinery is imported on first parallel use, so
+importing this module (and the modules built on it) stays cheap.
+"""
+
+import os
+from collections import deque
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def iter_chunks(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Split an iterable into lists of ``size`` items (the last may be shorter).
+
+    Raises:
+        ValueError: If size is not positive
+    """
+    if size < 1:
+        raise ValueError("chunk size must be positive")
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def ordered_map(func: Callable[[T], R], items: Iterable[T], workers: Optional[int] = 1,
+                max_pending: Optional[int] = None, initializer: Optional[Callable] = None,
+                initargs: Tuple = ()) -> Iterator[R]:
+    """
+    Lazily apply ``func`` to every item, in parallel, yielding in input order.
+
+    Args:
+        func: Picklable (module-level) function of one argument
+        items: Iterable of picklable arguments, consumed lazily
+        workers: Worker processes; None for one per CPU. With 1 (the
+            default) everything runs in the calling process.
+        max_pending: Tasks submitted ahead of the one being yielded;
+            defaults to twice the number of workers
+        initializer: Picklable function called with ``initargs`` once in
+            every worker (or in the calling process) before any task, e.g.
+            to load lookup tables
+
+    Yields:
+        Results of ``func``, in the order of ``items``
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        yield from map(func, items)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    max_pending = max_pending or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+        pending = deque()
+        try:
+            for item in items:
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+                pending.append(pool.submit(func, item))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # Stop queued work if the consumer stops early
+            for future in pending:
+                future.cancel()
@@ -10,7 +10,13 @@ This module implements the major types of Sanskrit compounds:
 6. बहुव्रीहि - Bahuvrīhi (Possessive)
 """
 
-from .sandhi import sandhi_handler
+import heapq
+
+from .sandhi import SandhiRuleTable, WORD_JOINS
+from .encoding import decode, encode
+from .transliteration import iast_to_devanagari
+from .trie import Trie
+from .viccheda import SandhiSplitter
 
 def get_base_stem(word: str) -> str:
     """Get the base stem form by removing case endings."""
@@ -24,84 +30,65 @@ def get_base_stem(word: str) -> str:
     
     return word
 
+# Common prefixes in avyayibhava
+AVYAYIBHAVA_PREFIXES = ['यथा', 'प्रति', 'उप', 'सह', 'अनु']
+
+# List of Sanskrit numerals (first members of dvigu compounds)
+NUMERALS = ['एक', 'द्वि', 'त्रि', 'चतुर्', 'पञ्च', 'षट्', 'सप्त', 'अष्ट', 'नव', 'दश']
+
+# Special cases for common compounds, keyed by the exact pair of members
+COMPOUND_SPECIAL_CASES = {
+    ('महत्', 'ऋषि'): 'महर्षि',
+    ('नील', 'उत्पल'): 'नीलोत्पल',
+    ('पीत', 'अम्बर'): 'पीताम्बर',
+    ('राजन्', 'पुरुष'): 'राजपुरुष',
+    ('धर्म', 'ज्ञ'): 'धर्मज्ञ',
+    ('प्रति', 'अग्नि'): 'प्रत्यग्नि',
+    ('सप्त', 'ऋषि'): 'सप्तर्षि',
+    ('दम्', 'पती'): 'दम्पती',
+    ('नील', 'कण्ठ'): 'नीलकण्ठ'
+}
+
+# Prefixes whose final vowel becomes a semivowel, keyed by (prefix, initial)
+COMPOUND_PREFIX_JOINS = {
+    ('प्रति', 'अ'): 'प्रत्य',  # प्रति + अग्नि -> प्रत्यग्नि
+    ('अति', 'अ'): 'अत्य',     # अति + अन्त -> अत्यन्त
+    ('अधि', 'इ'): 'अध्य'      # अधि + इत -> अध्यित
+}
+
+_CONSONANTS = 'कखगघङचछजझञटठडढणतथदधनपफबभमयरलवशषसह'
+_STOPS_AND_NASALS = 'कखगघङचछजझञटठडढणतथदधनपफबभम'
+
+# Boundary rules for compounds, falling back to the general word rules
+COMPOUND_JOINS = SandhiRuleTable({
+    ('त्', 'ऋ'): 'र्',  # महत् + ऋषि -> महर्षि
+    ('त्', 'श'): 'च्छ',  # तत् + शिव -> तच्छिव
+    ('अ', 'अ'): 'आ',  # वेद + अङ्ग -> वेदाङ्ग
+    ('अ', 'आ'): 'आ',
+    ('अ', 'इ'): 'े',
+    ('अ', 'उ'): 'ो',
+    # राजन् + पुरुष -> राजपुरुष
+    **{('न्', consonant): consonant for consonant in _CONSONANTS},
+    # Visarga is dropped before stops and nasals
+    **{('ः', consonant): consonant for consonant in _STOPS_AND_NASALS},
+}).merged(WORD_JOINS)
+
 def apply_compound_sandhi(first: str, second: str) -> str:
     """Apply special sandhi rules for compounds."""
-    # Rule 1: Special cases for common compounds
-    special_cases = {
-        ('महत्', 'ऋषि'): 'महर्षि',
-        ('नील', 'उत्पल'): 'नीलोत्पल',
-        ('पीत', 'अम्बर'): 'पीताम्बर',
-        ('राजन्', 'पुरुष'): 'राजपुरुष',
-        ('धर्म', 'ज्ञ'): 'धर्मज्ञ',
-        ('प्रति', 'अग्नि'): 'प्रत्यग्नि',
-        ('सप्त', 'ऋषि'): 'सप्तर्षि',
-        ('दम्', 'पती'): 'दम्पती',
-        ('नील', 'कण्ठ'): 'नीलकण्ठ'
-    }
-    
-    if (first, second) in special_cases:
-        return special_cases[(first, second)]
-    
-    # Rule 2: त् + ऋ -> र्
-    if first.endswith('त्') and second.startswith('ऋ'):
-        return first[:-2] + 'र्षि'
-        
-    # Rule 3: Vowel + Vowel sandhi
-    if first[-1] in 'अआइईउऊऋॠएऐओऔ' and second[0] in 'अआइईउऊऋॠएऐओऔ':
-        # नील + उत्पल -> नीलोत्पल
-        if first.endswith('ील') and second.startswith('उ'):
-            return first[:-2] + 'ीलो' + second[1:]
-        # पीत + अम्बर -> पीताम्बर
-        elif first.endswith('त') and second.startswith('अ'):
-            return first + 'ा' + second[1:]
-        # General vowel sandhi rules
-        elif first.endswith('अ'):
-            if second.startswith('अ'):
-                return first + second[1:]  # अ + अ -> अ
-            elif second.startswith('आ'):
-                return first[:-1] + 'ा' + second[1:]  # अ + आ -> आ
-            elif second.startswith('इ'):
-                return first[:-1] + 'े' + second[1:]  # अ + इ -> े
-            elif second.startswith('उ'):
-                return first[:-1] + 'ो' + second[1:]  # अ + उ -> ो
-            
-    # Rule 4: Consonant endings
-    if first[-1] in 'कखगघङचछजझञटठडढणतथदधनपफबभमयरलवशषसह':
-        # Keep म् unchanged before प, फ, ब, भ, म
-        if first.endswith('म्') and second[0] in 'पफबभम':
-            return first + second
-        # Handle other consonant combinations
-        elif first.endswith('त्') and second[0] in 'शषस':
-            return first[:-1] + 'च्छ' + second[1:]  # त् + श -> च्छ
-            
-    # Rule 5: न् endings
-    if first.endswith('न्'):
-        # राजन् + पुरुष -> राजपुरुष
-        if second[0] not in 'अआइईउऊऋॠएऐओऔ':
-            return first[:-2] + second
-            
-    # Rule 6: Visarga sandhi
-    if first.endswith('ः'):
-        if second[0] in 'कखगघङचछजझञटठडढणतथदधनपफबभम':
-            return first[:-1] + second
-            
-    # Rule 7: Special prefixes
-    prefixes = {
-        'प्रति': {'अ': 'प्रत्य'},  # प्रति + अग्नि -> प्रत्यग्नि
-        'अति': {'अ': 'अत्य'},     # अति + अन्त -> अत्यन्त
-        'अधि': {'इ': 'अध्य'}      # अधि + इत -> अध्यित
-    }
-    
-    if first in prefixes and second[0] in prefixes[first]:
-        return prefixes[first][second[0]] + second[1:]
-            
-    # Apply regular sandhi for other cases
-    result = sandhi_handler(first, second)
-    
+    special = COMPOUND_SPECIAL_CASES.get((first, second))
+    if special is not None:
+        return special
+
+    prefixed = COMPOUND_PREFIX_JOINS.get((first, second[:1]))
+    if prefixed is not None:
+        return prefixed + second[1:]
+
+    result = COMPOUND_JOINS.join(first, second)
+
     # Post-process common patterns
     if result.endswith('अअ'):
         result = result[:-1]
-    
+
     return result
 
 def form_avyayibhava(first: str, second: str) -> str:
@@ -110,11 +97,8 @@ def form_avyayibhava(first: str, second: str) -> str:
     First member is an indeclinable (अव्यय).
     E.g., यथाशक्ति (यथा + शक्ति) = "according to ability"
     """
-    # Common prefixes in avyayibhava
-    prefixes = ['यथा', 'प्रति', 'उप', 'सह', 'अनु']
-    
     # Check if first word is a valid prefix
-    if first not in prefixes:
+    if first not in AVYAYIBHAVA_PREFIXES:
         return None
         
     # Get base form of second word
@@ -134,8 +118,9 @@ def form_tatpurusa(first: str, second: str, case_relation: str = "षष्ठ
     
     # Handle special cases for different case relations
     if case_relation == "षष्ठी":  # Genitive
-        if first.endswith('न्'):
-            first = first[:-1]  # Remove न् from words like राजन्
+        encoded = encode(first)
+        if encoded.endswith('n'):
+            first = decode(encoded[:-1])  # Remove न् from words like राजन्
     
     # Apply sandhi
     return apply_compound_sandhi(first, second)
@@ -162,11 +147,8 @@ def form_dvigu(first: str, second: str) -> str:
     Special type of तत्पुरुष where first member is a numeral.
     E.g., त्रिलोक (त्रि + लोक) = "three worlds"
     """
-    # List of Sanskrit numerals
-    numerals = ['एक', 'द्वि', 'त्रि', 'चतुर्', 'पञ्च', 'षट्', 'सप्त', 'अष्ट', 'नव', 'दश']
-    
     # Check if first word is a numeral
-    if first not in numerals:
+    if first not in NUMERALS:
         return None
     
     # Apply sandhi
@@ -206,8 +188,8 @@ def form_samasa(word1: str, word2: str, samasa_type: str) -> str:
     Forms a compound word (समास) based on the given type.
     
     Args:
-        word1 (str): First word of the compound
-        word2 (str): Second word of the compound
+        word1 (str): First word of the compound, in Devanagari or IAST
+        word2 (str): Second word of the compound, in Devanagari or IAST
         samasa_type (str): Type of compound to form
             - "avyayibhava" (अव्ययीभाव)
             - "tatpurusa" (तत्पुरुष)
@@ -234,22 +216,132 @@ def form_samasa(word1: str, word2: str, samasa_type: str) -> str:
         raise ValueError(f"Invalid samasa type: {samasa_type}")
     
     # Call appropriate formation function
-    return samasa_functions[samasa_type](word1, word2)
+    return samasa_functions[samasa_type](iast_to_devanagari(word1), iast_to_devanagari(word2))
 
-def split_samasa(compound: str) -> list:
+# Stems recognised by split_samasa when no lexicon is given
+DEFAULT_STEMS = sorted(
+    {member for pair in COMPOUND_SPECIAL_CASES for member in pair}
+    | set(AVYAYIBHAVA_PREFIXES) | set(NUMERALS) | {
+        'राज', 'पुरुष', 'देव', 'दत्त', 'लोक', 'राम', 'लक्ष्मण', 'कृष्ण', 'सर्प',
+        'शक्ति', 'वायु', 'सूर्य', 'चन्द्र', 'नर', 'नारी', 'शिव', 'पार्वती', 'चक्र',
+        'पाणि', 'दीर्घ', 'बाहु', 'शत', 'पत्र', 'पथ', 'वेद', 'अङ्ग', 'वट', 'अन्न',
+        'गो', 'पाल', 'महा', 'सु', 'कृत', 'नव', 'यौवन', 'लोचन', 'अर्थ', 'विद्या',
+        'आलय', 'गुरु', 'कुल', 'जन', 'गृह', 'वन', 'पुत्र', 'भूमि'
+    }
+)
+
+# Upper bound on DP states explored by split_samasa per call
+MAX_SPLIT_STATES = 5000
+
+def lexicon_trie(stems) -> Trie:
+    """
+    Build the lexicon used by split_samasa: a trie over the SLP1 encoding of
+    each stem, storing the stem text.
+    """
+    return Trie((encode(stem), stem) for stem in stems)
+
+_STEM_TRIE = lexicon_trie(DEFAULT_STEMS)
+
+# Reversal of compound sandhi: rule outputs located in one scan ...
+_COMPOUND_SPLITTER = SandhiSplitter(COMPOUND_JOINS)
+
+# ... and known surface forms mapped to (members, initial restored on the rest)
+_SPECIAL_SPLITS = Trie(
+    [(encode(compound), (pair, '')) for pair, compound in COMPOUND_SPECIAL_CASES.items()]
+    + [(encode(joined), ((prefix,), encode(initial)))
+       for (prefix, initial), joined in COMPOUND_PREFIX_JOINS.items()]
+)
+
+def split_samasa(compound: str, lexicon=None, max_results: int = 5,
+                 max_states: int = MAX_SPLIT_STATES) -> list:
     """
     Attempts to split a compound word into its constituent parts.
-    This is a complex task that requires understanding of word stems and sandhi rules.
-    
+
+    Runs a dynamic program over the SLP1 encoding of the compound (one
+    symbol per phoneme), filled iteratively. At each split point a
+    member either ends where the next begins (plain concatenation), or a
+    compound sandhi rule is reversed: the rule output found in the word is
+    replaced by the final of this member and the initial of the next. Every
+    member must be a stem of the lexicon. Known special compounds and
+    prefix joins (e.g. प्रत्य = प्रति + अ) are reversed as a unit.
+
     Args:
         compound (str): The compound word to split
-        
+        lexicon: Iterable of stems or a Trie from lexicon_trie(); defaults
+            to DEFAULT_STEMS
+        max_results (int): Number of splits to return
+        max_states (int): Hard cap on DP states explored; once reached,
+            unexplored split points are abandoned
+
     Returns:
-        list: Possible constituent words
-    """
-    # TODO: Implement reverse sandhi analysis
-    # This requires:
-    # 1. Identifying potential split points
-    # 2. Applying reverse sandhi rules
-    # 3. Validating resulting words against a dictionary
-    pass
+        list: Splits with at least two members, best first. Each split is a
+        list of members. Fewer members and fewer sandhi reversals rank higher.
+    """
+    if lexicon is None:
+        stems = _STEM_TRIE
+    elif isinstance(lexicon, Trie):
+        stems = lexicon
+    else:
+        stems = lexicon_trie(lexicon)
+
+    encoded = encode(compound)
+    length = len(encoded)
+    rules_at = {}
+    for start, end, (final, initial, _) in _COMPOUND_SPLITTER.iter_matches(encoded):
+        rules_at.setdefault(start, []).append((final, initial, end))
+
+    def moves(position, carry):
+        """Yield ``(members, sandhi count, next position, next carry)`` for each member starting here."""
+        # Special compounds and prefix joins reversed as a whole
+        if not carry:
+            for end, (members, initial) in _SPECIAL_SPLITS.iter_prefixes(encoded, position):
+                yield members, 1, end, initial
+
+        node = Trie.step(stems.root, carry)
+        index = position
+        while node is not None:
+            # Member ends inside a sandhi: restore its final, carry the initial
+            for final, initial, end in rules_at.get(index, ()):
+                member = Trie.value(Trie.step(node, final))
+                if member is not None:
+                    yield (member,), 1, end, initial
+            # Member ends here and the next one starts unchanged
+            member = Trie.value(node)
+            if index > position and member is not None:
+                yield (member,), 0, index, ''
+            if index == length:
+                break
+            node = node.get(encoded[index])
+            index += 1
+
+    # Every move ends further right, so states (position, carry) are
+    # explored left to right up to the cap, then ranked right to left;
+    # neither pass recurses, whatever the length of the compound.
+    successors = {}
+    pending = [(0, '')]
+    while pending and len(successors) < max_states:
+        state = heapq.heappop(pending)
+        if state in successors:
+            continue
+        successors[state] = list(moves(*state))
+        for _, _, next_position, next_carry in successors[state]:
+            if (next_position, next_carry) not in successors and (next_position < length or next_carry):
+                heapq.heappush(pending, (next_position, next_carry))
+
+    ranked = {}
+    for state in sorted(successors, reverse=True):
+        # Best score per distinct member sequence
+        candidates = {}
+        for members, sandhi_count, next_position, next_carry in successors[state]:
+            if next_position == length and not next_carry:
+                ends = [((0, 0), ())]
+            else:
+                ends = ranked.get((next_position, next_carry), ())
+            for (count, sandhis), rest in ends:
+                score = (count + len(members), sandhis + sandhi_count)
+                sequence = members + rest
+                if sequence not in candidates or score < candidates[sequence]:
+                    candidates[sequence] = score
+        ranked[state] = heapq.nsmallest(max_results, ((score, members) for members, score in candidates.items()))
+
+    return [list(members) for _, members in ranked.get((0, ''), ()) if len(members) > 1]
@@ -1,56 +1,272 @@
-import re
+from .encoding import MATRA_MARK, VOWELS, decode, encode, encode_rule
+
+
+class SandhiRuleTable:
+    """
+    Flat sandhi lookup keyed by (final, initial) phonemes, compiled once.
+
+    A rule ``(final, initial) -> replacement`` replaces the ``final`` of the
+    first word and the ``initial`` of the second word with ``replacement``.
+    Rules are written in Devanagari rule notation and stored in the internal
+    SLP1 encoding (see ``encoding.encode_rule``), and words are matched on
+    their encoded phonemes, so a rule for अ applies to राम (``rAma``) and a
+    rule for क् to वाक् (``vAk``).
+    Every sandhi entry point in the package compiles its rules into one of
+    these tables at import time, so joining two words costs a dict probe per
+    distinct (final length, initial length) shape in the table - a single
+    probe for the usual one-phoneme rules.
+    """
+
+    def __init__(self, rules=None):
+        """
+        :param rules: Mapping of ``(final, initial)`` pairs to replacements,
+            in Devanagari rule notation
+        """
+        self._rules = {
+            (encode_rule(final), encode_rule(initial)): encode_rule(replacement)
+            for (final, initial), replacement in dict(rules or {}).items()
+        }
+        self._compile()
+
+    def _compile(self):
+        """Derive the probe order and boundary context from the rules."""
+        shapes = {(len(final), len(initial)) for final, initial in self._rules}
+        # Longest contexts are probed first so specific rules win.
+        self._shapes = tuple(sorted(shapes, reverse=True))
+        # Widest boundary context any rule can inspect
+        self._context = (
+            max((length for length, _ in shapes), default=1),
+            max((length for _, length in shapes), default=1),
+        )
+
+    @classmethod
+    def from_nested(cls, nested):
+        """
+        Compile a ``{final: {initial: replacement}}`` table.
+
+        :param nested: Nested rule dictionary (e.g. ``VOWEL_SANDHI``)
+        :return: A compiled SandhiRuleTable
+        """
+        return cls({
+            (final, initial): replacement
+            for final, initials in nested.items()
+            for initial, replacement in initials.items()
+        })
+
+    def merged(self, *others):
+        """
+        Combine this table with fallback tables.
+
+        Rules of this table take precedence over those of ``others``, which
+        are consulted in the order given.
+
+        :return: A new SandhiRuleTable
+        """
+        merged = SandhiRuleTable()
+        for table in reversed((self,) + others):
+            merged._rules.update(table._rules)
+        merged._compile()
+        return merged
+
+    @property
+    def context(self):
+        """Widest ``(final, initial)`` phoneme context any rule inspects."""
+        return self._context
+
+    def __len__(self):
+        return len(self._rules)
+
+    def __contains__(self, pair):
+        final, initial = pair
+        return (encode_rule(final), encode_rule(initial)) in self._rules
+
+    def items(self):
+        """Iterate over ``((final, initial), replacement)`` rules in SLP1."""
+        return self._rules.items()
+
+    def get(self, final, initial, default=None):
+        """Return the replacement for an exact (final, initial) pair, as text."""
+        replacement = self._rules.get((encode_rule(final), encode_rule(initial)))
+        if replacement is None:
+            return default
+        return decode(replacement)
+
+    def lookup(self, word1, word2):
+        """
+        Find the rule that applies at the boundary of two words.
+
+        :return: ``(final_length, initial_length, replacement)``, with
+            lengths in phonemes and the replacement in SLP1, or None
+        """
+        return self._match(encode(word1), encode(word2))
+
+    def _match(self, left, right):
+        rules = self._rules
+        for final_length, initial_length in self._shapes:
+            replacement = rules.get((left[-final_length:], right[:initial_length]))
+            if replacement is not None:
+                return final_length, initial_length, replacement
+        return None
+
+    def join_encoded(self, left, right, match=None):
+        """
+        Join two SLP1-encoded words.
+
+        An ending that starts with a bare matra (e.g. ेन) replaces the final
+        vowel of ``left`` instead of going through the rules.
+
+        :param match: Result of ``lookup`` for this boundary, if known
+        :return: The joined word in SLP1
+        """
+        if right[0] == MATRA_MARK:
+            if left[-1] in VOWELS:
+                left = left[:-1]
+            return left + right[1:]
+        if match is None:
+            match = self._match(left, right)
+            if match is None:
+                return left + right
+        final_length, initial_length, replacement = match
+        return left[:-final_length] + replacement + right[initial_length:]
+
+    def join(self, word1, word2):
+        """
+        Join two words, applying the matching rule if there is one.
+
+        :raises IndexError: If either word is empty
+        """
+        left = encode(word1)
+        right = encode(word2)
+        if not left or not right:
+            raise IndexError("sandhi requires two non-empty words")
+        return decode(self.join_encoded(left, right))
+
+    def iter_join(self, pairs):
+        """
+        Lazily join many ``(word1, word2)`` pairs, in order.
+
+        Pairs are grouped by their boundary class - the widest final and
+        initial phoneme context any rule inspects - and the rule lookup for
+        each class is resolved once per batch and reused for every later
+        pair.
+
+        :param pairs: Iterable of ``(word1, word2)`` tuples
+        :raises IndexError: If any word is empty
+        """
+        final_context, initial_context = self._context
+        match_boundary = self._match
+        join = self.join_encoded
+        resolved = {}
+        for word1, word2 in pairs:
+            left = encode(word1)
+            right = encode(word2)
+            if not left or not right:
+                raise IndexError("sandhi requires two non-empty words")
+            boundary = (left[-final_context:], right[:initial_context])
+            try:
+                match = resolved[boundary]
+            except KeyError:
+                match = resolved[boundary] = match_boundary(*boundary)
+            if match is None and right[0] != MATRA_MARK:
+                yield decode(left + right)
+            else:
+                yield decode(join(left, right, match))
+
+    def join_many(self, pairs):
+        """
+        Join many ``(word1, word2)`` pairs at once.
+
+        :return: List of joined words in input order
+        """
+        return list(self.iter_join(pairs))
+
+
+# Sandhi patterns for vowel and consonant combinations, as phoneme rules:
+# the final phoneme of the first word and the initial phoneme of the second
+# are replaced together (अ + इ -> ए: राम + इति -> रामेति)
+_SIMILAR_VOWELS = {'अ': 'आ', 'आ': 'आ', 'इ': 'ई', 'ई': 'ई', 'उ': 'ऊ', 'ऊ': 'ऊ', 'ऋ': 'ॠ', 'ॠ': 'ॠ'}
+_VOWEL_CLASS = {'अ': 'अ', 'आ': 'अ', 'इ': 'इ', 'ई': 'इ', 'उ': 'उ', 'ऊ': 'उ', 'ऋ': 'ऋ', 'ॠ': 'ऋ'}
+_INITIAL_VOWELS = ('अ', 'आ', 'इ', 'ई', 'उ', 'ऊ', 'ऋ', 'ए', 'ऐ', 'ओ', 'औ')
+
+# After अ/आ: guna and vrddhi
+_AFTER_A = {'इ': 'ए', 'ई': 'ए', 'उ': 'ओ', 'ऊ': 'ओ', 'ऋ': 'अर्', 'ए': 'ऐ', 'ऐ': 'ऐ', 'ओ': 'औ', 'औ': 'औ'}
+
+# Glide of a final vowel before a dissimilar vowel (yan and ayadi)
+_GLIDES = {'इ': 'य्', 'ई': 'य्', 'उ': 'व्', 'ऊ': 'व्', 'ऋ': 'र्',
+           'ए': 'अय्', 'ऐ': 'आय्', 'ओ': 'अव्', 'औ': 'आव्'}
+
+
+def _vowel_rule(final, initial):
+    if _VOWEL_CLASS.get(final) is not None and _VOWEL_CLASS.get(final) == _VOWEL_CLASS.get(initial):
+        return _SIMILAR_VOWELS[final]                       # देव + आलय -> देवालय
+    if final in ('अ', 'आ'):
+        return _AFTER_A[initial]                            # राम + इति -> रामेति
+    if final in ('ए', 'ओ') and initial == 'अ':
+        return final + 'ऽ'                                  # वने + अपि -> वनेऽपि
+    return _GLIDES[final] + initial                         # इति + आदि -> इत्यादि
+
 
-# Sandhi patterns for vowel and consonant combinations
 VOWEL_SANDHI = {
-    'अ': {'अ': 'आ', 'इ': 'ई', 'उ': 'ऊ', 'ए': 'ऐ', 'ओ': 'औ', 'अं': 'ं'},
-    'आ': {'अ': 'आ', 'इ': 'ई', 'उ': 'ऊ', 'ए': 'ऐ', 'ओ': 'औ', 'अं': 'ं'},
-    'इ': {'अ': 'ई', 'इ': 'ई', 'उ': 'ऊ', 'ए': 'ऐ', 'ओ': 'औ', 'अं': 'ं'},
-    'ई': {'अ': 'ई', 'इ': 'ई', 'उ': 'ऊ', 'ए': 'ऐ', 'ओ': 'औ', 'अं': 'ं'},
-    'उ': {'अ': 'ऊ', 'इ': 'ई', 'उ': 'ऊ', 'ए': 'ऐ', 'ओ': 'औ', 'अं': 'ं'},
-    'ऊ': {'अ': 'ऊ', 'इ': 'ई', 'उ': 'ऊ', 'ए': 'ऐ', 'ओ': 'औ', 'अं': 'ं'},
-    'ए': {'अ': 'ऐ', 'इ': 'ई', 'उ': 'ऊ', 'ए': 'ऐ', 'ओ': 'औ', 'अं': 'ं'},
-    'ऐ': {'अ': 'ऐ', 'इ': 'ई', 'उ': 'ऊ', 'ए': 'ऐ', 'ओ': 'औ', 'अं': 'ं'},
-    'ओ': {'अ': 'औ', 'इ': 'ई', 'उ': 'ऊ', 'ए': 'ऐ', 'ओ': 'औ', 'अं': 'ं'},
-    'औ': {'अ': 'औ', 'इ': 'ई', 'उ': 'ऊ', 'ए': 'ऐ', 'ओ': 'औ', 'अं': 'ं'}
+    final: {initial: _vowel_rule(final, initial) for initial in _INITIAL_VOWELS}
+    for final in ('अ', 'आ', 'इ', 'ई', 'उ', 'ऊ', 'ऋ', 'ए', 'ऐ', 'ओ', 'औ')
 }
 
-# Sandhi pattern for consonants (simplified)
+# A final stop becomes voiced before a vowel or a voiced stop, and त्
+# assimilates to a following palatal or retroflex (वाक् + देवी -> वाग्देवी,
+# तत् + जल -> तज्जल); the initial is kept
+_VOICED = {'क्': 'ग्', 'ट्': 'ड्', 'त्': 'द्', 'प्': 'ब्'}
+_VOICED_STOPS = ('ग', 'घ', 'ज', 'झ', 'ड', 'ढ', 'द', 'ध', 'ब', 'भ')
+
+
+def _consonant_rule(final, initial):
+    if final == 'त्' and initial in ('ज', 'झ', 'ड', 'ढ'):
+        return {'ज': 'ज्', 'झ': 'ज्', 'ड': 'ड्', 'ढ': 'ड्'}[initial] + initial
+    return _VOICED[final] + initial
+
+
 CONSONANT_SANDHI = {
-    'क': {'क': 'क', 'ग': 'ग', 'घ': 'घ'},
-    'ग': {'क': 'ग', 'ग': 'ग', 'घ': 'घ'},
-    'च': {'च': 'च', 'ज': 'ज', 'झ': 'झ'},
-    'ज': {'च': 'ज', 'ज': 'ज', 'झ': 'झ'},
-    'ट': {'ट': 'ट', 'ठ': 'ठ', 'ड': 'ड'},
-    'ड': {'ट': 'ड', 'ड': 'ड', 'ढ': 'ढ'}
+    final: {initial: _consonant_rule(final, initial) for initial in _INITIAL_VOWELS + _VOICED_STOPS}
+    for final in _VOICED
 }
 
+# Compiled lookups shared by every module that joins words
+VOWEL_JOINS = SandhiRuleTable.from_nested(VOWEL_SANDHI)
+CONSONANT_JOINS = SandhiRuleTable.from_nested(CONSONANT_SANDHI)
+WORD_JOINS = VOWEL_JOINS.merged(CONSONANT_JOINS)
+
 # Function to handle Sandhi based on vowel combinations
 def apply_vowel_sandhi(word1, word2):
     """
     Apply vowel Sandhi rules for combining two words.
     """
-    if word1[-1] in VOWEL_SANDHI and word2[0] in VOWEL_SANDHI[word1[-1]]:
-        return word1[:-1] + VOWEL_SANDHI[word1[-1]].get(word2[0], word2[0]) + word2[1:]
-    return word1 + word2
+    return VOWEL_JOINS.join(word1, word2)
 
 # Function to handle consonant Sandhi
 def apply_consonant_sandhi(word1, word2):
     """
     Apply consonant Sandhi rules for combining two words.
     """
-    if word1[-1] in CONSONANT_SANDHI and word2[0] in CONSONANT_SANDHI[word1[-1]]:
-        return word1[:-1] + CONSONANT_SANDHI[word1[-1]].get(word2[0], word2[0]) + word2[1:]
-    return word1 + word2
+    return CONSONANT_JOINS.join(word1, word2)
 
 # Example Sandhi Handling
 def sandhi_handler(word1, word2):
     """
     Handle Sandhi for given words.
     """
-    # Check if the Sandhi is between two vowels or consonants
-    if word1[-1] in VOWEL_SANDHI and word2[0] in VOWEL_SANDHI[word1[-1]]:
-        return apply_vowel_sandhi(word1, word2)
-    elif word1[-1] in CONSONANT_SANDHI and word2[0] in CONSONANT_SANDHI[word1[-1]]:
-        return apply_consonant_sandhi(word1, word2)
-    else:
-        return word1 + word2
+    # Vowel rules take precedence over consonant rules in WORD_JOINS
+    return WORD_JOINS.join(word1, word2)
+
+def iter_apply_sandhi(pairs):
+    """
+    Lazily apply sandhi_handler to an iterable of ``(word1, word2)`` pairs.
+    """
+    return WORD_JOINS.iter_join(pairs)
+
+def apply_sandhi_many(pairs):
+    """
+    Apply sandhi_handler to a batch of ``(word1, word2)`` pairs.
+
+    Equivalent to ``[sandhi_handler(a, b) for a, b in pairs]`` but resolves
+    each boundary class only once per batch.
+    """
+    return WORD_JOINS.join_many(pairs)
@@ -4,6 +4,8 @@ import json
 import logging
 from typing import List, Dict, Optional, Union, Any
 
+from .transliteration import iast_to_devanagari
+
 # Enhanced logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
@@ -93,6 +95,7 @@ def advanced_word_analysis(word: str) -> Dict[str, Union[List[str], str]]:
     Returns:
         Dict containing analysis results
     """
+    word = iast_to_devanagari(word)
     analysis = {
         "original_word": word,
         "split_words": [],
@@ -131,6 +134,16 @@ def advanced_word_analysis(word: str) -> Dict[str, Union[List[str], str]]:
     
     return analysis
 
+# Enhanced grammatical role mapping: case markers by role
+GRAMMATICAL_ROLES = {
+    "कर्ता": ["ः", "म्"],  # Nominative markers
+    "कर्म": ["म्"],        # Accusative markers
+    "करण": ["एण"],        # Instrumental markers
+    "सम्प्रदान": ["आय"],   # Dative markers
+    "अपादान": ["आत्"],     # Ablative markers
+    "सम्बन्ध": ["स्य"]     # Genitive markers
+}
+
 def enhanced_dependency_resolution(words: List[str]) -> Dict[str, Dict[str, str]]:
     """
     Advanced dependency resolution with grammatical role detection.
@@ -141,16 +154,6 @@ def enhanced_dependency_resolution(words: List[str]) -> Dict[str, Dict[str, str]
     Returns:
         Dict of word-level grammatical analysis
     """
-    # Enhanced grammatical role mapping
-    GRAMMATICAL_ROLES = {
-        "कर्ता": ["ः", "म्"],  # Nominative markers
-        "कर्म": ["म्"],        # Accusative markers
-        "करण": ["एण"],        # Instrumental markers
-        "सम्प्रदान": ["आय"],   # Dative markers
-        "अपादान": ["आत्"],     # Ablative markers
-        "सम्बन्ध": ["स्य"]     # Genitive markers
-    }
-    
     word_analysis = {}
     
     for word in words:
@@ -0,0 +1,72 @@
+"""
+Classification of Devanagari codepoints for phoneme (वर्ण) segmentation.
+
+Devanagari writes a consonant with an inherent अ, replaces that vowel with
+a dependent sign (matra) and suppresses it with a virama. Comparing the last
+character of a word with independent vowel letters therefore misses almost
+every real word: राम ends in the inherent अ, वाक् in the consonant क.
+
+This module classifies each codepoint through an array-indexed table and
+maps matras to the vowels they write. The encoding module builds on it to
+transcode words into one symbol per phoneme, which is what the rule engines
+run on.
+"""
+
+# Codepoint classes
+OTHER = 0
+VOWEL = 1
+CONSONANT = 2
+MATRA = 3
+VIRAMA = 4
+ANUSVARA = 5
+VISARGA = 6
+CANDRABINDU = 7
+NUKTA = 8
+
+_BLOCK_START = 0x0900
+_BLOCK_SIZE = 0x80
+
+INHERENT_VOWEL = 'अ'
+
+# Dependent vowel signs and the vowels they write
+MATRA_TO_VOWEL = {
+    'ा': 'आ', 'ि': 'इ', 'ी': 'ई', 'ु': 'उ', 'ू': 'ऊ', 'ृ': 'ऋ', 'ॄ': 'ॠ',
+    'ॢ': 'ऌ', 'ॣ': 'ॡ', 'े': 'ए', 'ै': 'ऐ', 'ो': 'ओ', 'ौ': 'औ'
+}
+
+# Vowels and the sign that writes them after a consonant
+VOWEL_TO_MATRA = {vowel: matra for matra, vowel in MATRA_TO_VOWEL.items()}
+VOWEL_TO_MATRA[INHERENT_VOWEL] = ''
+
+
+def _build_class_table() -> bytearray:
+    """Classify every codepoint of the Devanagari block."""
+    table = bytearray(_BLOCK_SIZE)
+
+    def mark(first, last, code):
+        for codepoint in range(first, last + 1):
+            table[codepoint - _BLOCK_START] = code
+
+    mark(0x0904, 0x0914, VOWEL)       # ऄ .. औ
+    mark(0x0960, 0x0961, VOWEL)       # ॠ ॡ
+    mark(0x0915, 0x0939, CONSONANT)   # क .. ह
+    mark(0x0958, 0x095F, CONSONANT)   # precomposed nukta forms
+    mark(0x093E, 0x094C, MATRA)       # ा .. ौ
+    mark(0x0962, 0x0963, MATRA)       # ॢ ॣ
+    mark(0x094D, 0x094D, VIRAMA)
+    mark(0x0902, 0x0902, ANUSVARA)
+    mark(0x0903, 0x0903, VISARGA)
+    mark(0x0901, 0x0901, CANDRABINDU)
+    mark(0x093C, 0x093C, NUKTA)
+    return table
+
+
+CODEPOINT_CLASS = _build_class_table()
+
+
+def char_class(char: str) -> int:
+    """Return the codepoint class of a single character."""
+    offset = ord(char) - _BLOCK_START
+    if 0 <= offset < _BLOCK_SIZE:
+        return CODEPOINT_CLASS[offset]
+    return OTHER
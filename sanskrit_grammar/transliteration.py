@@ -0,0 +1,155 @@
+"""
+IAST <-> Devanagari transliteration.
+
+Both directions go through the internal SLP1 encoding, which has one symbol
+per phoneme: IAST is read into SLP1 with a precompiled longest-match table
+(so ``kh`` wins over ``k`` + ``h``) and decoded, and Devanagari is encoded
+and mapped to IAST with a single ``str.translate``.
+
+Only runs of text written entirely in the source script are converted, so
+mixed input is safe: iast_to_devanagari leaves Devanagari untouched, as well
+as Latin words that use letters IAST does not have.
+
+iter_transliterate() converts a stream of chunks (for example a large file
+read piece by piece). It holds back the unfinished word at the end of each
+chunk, so a phoneme - or a consonant and its vowel - is never split across
+chunks.
+"""
+
+import re
+import unicodedata
+from typing import Iterable, Iterator, TextIO
+
+from .encoding import MATRA_MARK, SLP1_CONSONANTS, SLP1_OTHERS, SLP1_VOWELS, decode, encode_text
+
+DEVANAGARI = "devanagari"
+IAST = "iast"
+
+# IAST spellings of each SLP1 symbol, keyed by Devanagari letter
+_IAST_LETTERS = {
+    'अ': 'a', 'आ': 'ā', 'इ': 'i', 'ई': 'ī', 'उ': 'u', 'ऊ': 'ū', 'ऋ': 'ṛ', 'ॠ': 'ṝ',
+    'ऌ': 'ḷ', 'ॡ': 'ḹ', 'ए': 'e', 'ऐ': 'ai', 'ओ': 'o', 'औ': 'au',
+    'क': 'k', 'ख': 'kh', 'ग': 'g', 'घ': 'gh', 'ङ': 'ṅ',
+    'च': 'c', 'छ': 'ch', 'ज': 'j', 'झ': 'jh', 'ञ': 'ñ',
+    'ट': 'ṭ', 'ठ': 'ṭh', 'ड': 'ḍ', 'ढ': 'ḍh', 'ण': 'ṇ',
+    'त': 't', 'थ': 'th', 'द': 'd', 'ध': 'dh', 'न': 'n',
+    'प': 'p', 'फ': 'ph', 'ब': 'b', 'भ': 'bh', 'म': 'm',
+    'य': 'y', 'र': 'r', 'ल': 'l', 'व': 'v', 'ळ': 'ḻ',
+    'श': 'ś', 'ष': 'ṣ', 'स': 's', 'ह': 'h',
+    'ं': 'ṃ', 'ः': 'ḥ', 'ँ': 'm̐', 'ऽ': "'",
+}
+
+_SLP1 = {**SLP1_VOWELS, **SLP1_CONSONANTS, **SLP1_OTHERS}
+
+# IAST (lower case) to SLP1, including common variant spellings
+IAST_TO_SLP1 = {iast: _SLP1[letter] for letter, iast in _IAST_LETTERS.items()}
+IAST_TO_SLP1.update({
+    'ṣh': 'z',   # kṛṣhṇa
+    'ṁ': 'M',
+    'r̥': 'f', 'r̥̄': 'F', 'l̥': 'x',
+})
+
+SLP1_TO_IAST = {_SLP1[letter]: iast for letter, iast in _IAST_LETTERS.items()}
+
+# Longest spellings first, so the regex engine always takes the longest match
+_IAST_TOKEN = re.compile('|'.join(
+    re.escape(key) for key in sorted(IAST_TO_SLP1, key=len, reverse=True)
+))
+
+# Letters a word must be made of to be read as IAST
+_IAST_ALPHABET = frozenset(''.join(IAST_TO_SLP1))
+
+# Latin letters (with any diacritics) and Devanagari runs
+_LATIN_RUN = re.compile(r"[A-Za-z\u00c0-\u024f\u1e00-\u1eff\u0300-\u036f']+")
+_DEVANAGARI_RUN = re.compile(r'[\u0900-\u097f]+')
+
+_TO_IAST = str.maketrans({**SLP1_TO_IAST, MATRA_MARK: None})
+
+
+def _iast_run(match) -> str:
+    run = match.group()
+    word = unicodedata.normalize('NFC', run.lower())
+    if not _IAST_ALPHABET.issuperset(word):
+        return run
+    return decode(_IAST_TOKEN.sub(lambda token: IAST_TO_SLP1[token.group()], word))
+
+
+def _devanagari_run(match) -> str:
+    return encode_text(match.group()).translate(_TO_IAST)
+
+
+def iast_to_devanagari(text: str) -> str:
+    """
+    Convert the IAST words of ``text`` to Devanagari.
+
+    Words already in Devanagari, and Latin words that are not valid IAST,
+    are returned unchanged. Case is ignored (``Rāma`` reads as ``rāma``).
+
+    Args:
+        text (str): IAST, Devanagari or mixed text
+
+    Returns:
+        str: The text with IAST words in Devanagari, e.g. kṛṣṇa -> कृष्ण
+    """
+    return _LATIN_RUN.sub(_iast_run, text)
+
+
+def devanagari_to_iast(text: str) -> str:
+    """
+    Convert the Devanagari words of ``text`` to IAST.
+
+    Args:
+        text (str): Devanagari or mixed text
+
+    Returns:
+        str: The text with Devanagari words in IAST, e.g. कृष्ण -> kṛṣṇa
+    """
+    return _DEVANAGARI_RUN.sub(_devanagari_run, text)
+
+
+_CONVERTERS = {DEVANAGARI: iast_to_devanagari, IAST: devanagari_to_iast}
+
+
+def iter_transliterate(chunks: Iterable[str], target: str = DEVANAGARI) -> Iterator[str]:
+    """
+    Transliterate a stream of text chunks.
+
+    Each chunk is converted up to its last whitespace; the rest is carried
+    over to the next chunk, so words are never split.
+
+    Args:
+        chunks: Iterable of text pieces, in order
+        target (str): ``"devanagari"`` or ``"iast"``
+
+    Yields:
+        str: Converted text, concatenating to the converted whole
+    """
+    convert = _CONVERTERS[target]
+    pending = ''
+    for chunk in chunks:
+        text = pending + chunk
+        # Hold back the unfinished word at the end
+        cut = len(text)
+        while cut and not text[cut - 1].isspace():
+            cut -= 1
+        pending = text[cut:]
+        if cut:
+            yield convert(text[:cut])
+    if pending:
+        yield convert(pending)
+
+
+def transliterate_file(source: TextIO, destination: TextIO, target: str = DEVANAGARI,
+                       chunk_size: int = 1 << 20) -> None:
+    """
+    Transliterate a text file chunk by chunk, without loading it whole.
+
+    Args:
+        source: Text file opened for reading
+        destination: Text file opened for writing
+        target (str): ``"devanagari"`` or ``"iast"``
+        chunk_size (int): Characters read per chunk
+    """
+    chunks = iter(lambda: source.read(chunk_size), '')
+    for converted in iter_transliterate(chunks, target):
+        destination.write(converted)
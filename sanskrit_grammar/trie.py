@@ -0,0 +1,132 @@
+"""
+Character tries used for lexicon lookups and prefix/suffix matching.
+
+Nodes are plain dictionaries mapping a character to the child node; the
+value stored for a complete key lives under the ``None`` key of its node.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+_VALUE = None
+
+Node = Dict[Optional[str], Any]
+
+
+class Trie:
+    """
+    Forward character trie.
+
+    Matching all keys that start at a given position of a text costs one
+    step per character, however many keys the trie holds.
+    """
+
+    def __init__(self, items: Iterable = ()):
+        """
+        Args:
+            items: Keys, or ``(key, value)`` pairs, to insert
+        """
+        self.root: Node = {}
+        self._size = 0
+        for item in items:
+            if isinstance(item, tuple):
+                self.insert(*item)
+            else:
+                self.insert(item)
+
+    def insert(self, key: str, value: Any = True) -> None:
+        """Insert ``key`` with an associated ``value`` (replacing any old one)."""
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+        if _VALUE not in node:
+            self._size += 1
+        node[_VALUE] = value
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: str) -> bool:
+        node = self.step(self.root, key)
+        return node is not None and _VALUE in node
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value stored for ``key``, or ``default``."""
+        node = self.step(self.root, key)
+        return self.value(node, default)
+
+    @staticmethod
+    def step(node: Optional[Node], text: str) -> Optional[Node]:
+        """Follow ``text`` from ``node``; return the node reached or None."""
+        for char in text:
+            if node is None:
+                return None
+            node = node.get(char)
+        return node
+
+    @staticmethod
+    def value(node: Optional[Node], default: Any = None) -> Any:
+        """Return the value of a key ending at ``node``, or ``default``."""
+        if node is None:
+            return default
+        return node.get(_VALUE, default)
+
+    def iter_prefixes(self, text: str, start: int = 0) -> Iterator[Tuple[int, Any]]:
+        """
+        Yield ``(end, value)`` for every key equal to ``text[start:end]``.
+
+        Keys are yielded shortest first.
+        """
+        node = self.root
+        for end in range(start, len(text)):
+            node = node.get(text[end])
+            if node is None:
+                return
+            if _VALUE in node:
+                yield end + 1, node[_VALUE]
+
+    def longest_prefix(self, text: str, start: int = 0) -> Optional[Tuple[int, Any]]:
+        """Return ``(end, value)`` for the longest key starting at ``start``, or None."""
+        longest = None
+        for match in self.iter_prefixes(text, start):
+            longest = match
+        return longest
+
+
+class SuffixTrie(Trie):
+    """
+    Trie of reversed keys, for matching the endings of a word.
+
+    All keys that end a text are found by walking the text backwards once.
+    """
+
+    def insert(self, key: str, value: Any = True) -> None:
+        """Insert ``key`` with an associated ``value`` (replacing any old one)."""
+        super().insert(key[::-1], value)
+
+    def __contains__(self, key: str) -> bool:
+        return super().__contains__(key[::-1])
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value stored for ``key``, or ``default``."""
+        return super().get(key[::-1], default)
+
+    def iter_suffixes(self, text: str) -> Iterator[Tuple[int, Any]]:
+        """
+        Yield ``(start, value)`` for every key equal to ``text[start:]``.
+
+        Keys are yielded shortest first.
+        """
+        node = self.root
+        for start in range(len(text) - 1, -1, -1):
+            node = node.get(text[start])
+            if node is None:
+                return
+            if _VALUE in node:
+                yield start, node[_VALUE]
+
+    def longest_suffix(self, text: str) -> Optional[Tuple[int, Any]]:
+        """Return ``(start, value)`` for the longest key ending ``text``, or None."""
+        longest = None
+        for match in self.iter_suffixes(text):
+            longest = match
+        return longest
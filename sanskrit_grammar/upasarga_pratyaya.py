@@ -1,6 +1,10 @@
 import re
 from typing import List, Dict, Optional, Union, Tuple
 
+from .encoding import VOWELS, decode, encode
+from .sandhi import SandhiRuleTable
+from .transliteration import iast_to_devanagari
+
 # Comprehensive Upasarga (Prefix) Dictionary with Enhanced Linguistic Metadata
 UPASARGA_DICT: Dict[str, Dict[str, Union[List[str], str, Dict[str, str]]]] = {
     "प्र": {
@@ -121,6 +125,22 @@ PRATYAYA_DICT: Dict[str, Dict[str, Dict[str, Union[str, List[str], Dict[str, str
     }
 }
 
+def _compile_vowel_rules(rules: Dict[str, str]) -> SandhiRuleTable:
+    """Compile ``"अ + इ": "ए"`` style rules into a SandhiRuleTable."""
+    pairs = {}
+    for combination, result in rules.items():
+        first, second = combination.split(" + ")
+        pairs[(first, second)] = result
+    return SandhiRuleTable(pairs)
+
+def _compile_nasalization(vargas: Dict[str, List[str]], nasals: Dict[str, str]) -> SandhiRuleTable:
+    """Compile म् + stop nasalization into a SandhiRuleTable keyed by the stop."""
+    return SandhiRuleTable({
+        ("म्", consonant): nasals[varga] + consonant
+        for varga, consonants in vargas.items()
+        for consonant in consonants
+    })
+
 class SandhiTransformer:
     """
     Advanced Sandhi transformation engine for Sanskrit linguistic processing.
@@ -190,6 +210,18 @@ class SandhiTransformer:
         }
     }
 
+    # Nasal that replaces म् before each class of stops
+    NASALIZATION_BY_VARGA = {
+        "ka_varga": "ङ्",
+        "ca_varga": "ञ्",
+        "ta_varga": "ण्",
+        "pa_varga": "ं"
+    }
+
+    # Rule tables compiled once from the data above
+    _VOWEL_JOINS = _compile_vowel_rules(SANDHI_RULES["vowel_sandhi"])
+    _CONSONANT_JOINS = _compile_nasalization(CONSONANT_GROUPS["sparsha"], NASALIZATION_BY_VARGA)
+
     # Comprehensive Vowel Mapping
     VOWELS = {
         "short": ["अ", "इ", "उ"],
@@ -209,8 +241,7 @@ class SandhiTransformer:
         Returns:
             Optional[str]: Transformed vowel combination or None
         """
-        vowel_key = f"{first_vowel} + {second_vowel}"
-        return cls.SANDHI_RULES["vowel_sandhi"].get(vowel_key, second_vowel)
+        return cls._VOWEL_JOINS.get(first_vowel, second_vowel, second_vowel)
 
     @classmethod
     def apply_consonant_sandhi(cls, prefix: str, word: str) -> str:
@@ -224,26 +255,9 @@ class SandhiTransformer:
         Returns:
             str: Modified word after applying Sandhi rules
         """
-        # Detailed Sandhi transformation logic
-        if prefix.endswith("म्"):
-            # Nasalization rules
-            for varga, consonants in cls.CONSONANT_GROUPS["sparsha"].items():
-                if word[0] in consonants:
-                    nasalization_map = {
-                        "ka_varga": "सङ्",
-                        "ca_varga": "सञ्",
-                        "ta_varga": "सण्",
-                        "pa_varga": "संप्"
-                    }
-                    prefix = nasalization_map.get(varga, "सम्")
-                    break
-        
-        # Visarga and other complex transformations
-        if prefix.endswith("ः"):
-            # Preserve visarga in the output
-            pass
-        
-        return prefix + word
+        # Nasalization of म् before a stop, e.g. सम् + कृ -> सङ्कृ.
+        # Visarga is preserved in the output, so it has no rule here.
+        return cls._CONSONANT_JOINS.join(prefix, word)
 
     @classmethod
     def analyze_word_structure(cls, word: str) -> Dict[str, Union[str, List[str]]]:
@@ -256,6 +270,7 @@ class SandhiTransformer:
         Returns:
             Dict containing linguistic breakdown
         """
+        word = iast_to_devanagari(word)
         analysis = {
             "original_word": word,
             "vowels": [],
@@ -330,6 +345,9 @@ def add_upasarga(word: str, upasarga: str) -> str:
     
     return modified_word
 
+# Short vowels (SLP1) that a vowel-initial suffix replaces
+_REPLACED_FINALS = frozenset('aiu')
+
 def add_pratyaya(word: str, pratyaya: str, pratyaya_type: str = "कृत्") -> str:
     """
     Adds a pratyaya (suffix) to a root word with appropriate rules.
@@ -352,19 +370,16 @@ def add_pratyaya(word: str, pratyaya: str, pratyaya_type: str = "कृत्")
     if pratyaya not in PRATYAYA_DICT[pratyaya_type]:
         raise ValueError(f"Unrecognized pratyaya: {pratyaya}")
     
-    # Remove trailing virama (्) if present
-    if word.endswith('्'):
-        word = word[:-1]
-    
-    # Apply specific Sandhi rules for suffix addition
-    if word[-1] in "अइउ":
-        # Vowel ending rules: replace last vowel
-        modified_word = word[:-1] + pratyaya
-    else:
-        # Consonant ending rules: simply append
-        modified_word = word + pratyaya
-    
-    return modified_word
+    # Join on the phoneme encoding, so a final virama or inherent अ is a
+    # phoneme rather than a spelling detail
+    encoded = encode(word)
+    suffix = encode(pratyaya)
+    if encoded[-1:] in _REPLACED_FINALS and suffix[:1] in VOWELS:
+        # Vowel ending rules: the suffix's vowel replaces the last vowel
+        encoded = encoded[:-1]
+
+    # Otherwise simply append
+    return decode(encoded + suffix)
 
 def get_upasarga_meaning(upasarga: str) -> List[str]:
     """
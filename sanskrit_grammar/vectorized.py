@@ -0,0 +1,245 @@
+"""
+Vectorized ending classification over NumPy codepoint arrays.
+
+For corpus statistics over millions of tokens. Tokens are packed into a
+fixed-width uint32 codepoint matrix, right-aligned and zero-padded on the
+left, so every token's ending sits in the last columns. An EndingClassifier
+matches a whole table of endings against the matrix with one sorted search
+per ending length, rather than an ``endswith`` loop per token.
+
+Tokens must already be in Devanagari. This module needs NumPy, an optional
+dependency (``pip install sanskrit-grammar[numpy]``); the package only loads
+it on first access to ``sanskrit_grammar.vectorized``.
+"""
+
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from .parallel import iter_chunks
+
+# Code of tokens that match no ending
+NOT_IDENTIFIED = -1
+
+# Tokens packed and classified at a time by classify_tokens()
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def pack_tokens(tokens: Iterable[str], width: int) -> np.ndarray:
+    """
+    Pack tokens into a right-aligned codepoint matrix.
+
+    Args:
+        tokens: Tokens in Devanagari
+        width (int): Columns of the matrix; longer tokens keep their last
+            ``width`` characters
+
+    Returns:
+        np.ndarray: uint32 matrix of shape ``(len(tokens), width)``, zero on
+        the left of shorter tokens
+
+    Raises:
+        ValueError: If width is less than 1
+    """
+    if width < 1:
+        raise ValueError("width must be at least 1")
+    tokens = list(tokens)
+    lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=len(tokens))
+    codepoints = np.frombuffer("".join(tokens).encode("utf-32-le"), dtype="<u4")
+    matrix = np.zeros((len(tokens), width), dtype=np.uint32)
+    if codepoints.size:
+        row = np.repeat(np.arange(len(tokens)), lengths)
+        # Each codepoint's column, counted back from the end of its token
+        column = width - (np.cumsum(lengths)[row] - np.arange(codepoints.size))
+        kept = column >= 0
+        matrix[row[kept], column[kept]] = codepoints[kept]
+    return matrix
+
+
+def _row_keys(block: np.ndarray) -> np.ndarray:
+    """View each row of a codepoint block as one opaque, sortable value."""
+    block = np.ascontiguousarray(block)
+    return block.view(np.dtype((np.void, block.shape[1] * block.itemsize))).ravel()
+
+
+class EndingClassifier:
+    """
+    Classify tokens by the ending they match in a table of ``(ending, code)``.
+
+    When a token matches several endings, the longest wins and equal
+    lengths keep table order (as the tense detectors and identify_pratyaya
+    do); with ``longest_first=False`` the first match in table order wins.
+    """
+
+    def __init__(self, endings: Iterable[Tuple[str, int]], longest_first: bool = True):
+        """
+        Args:
+            endings: ``(ending, code)`` pairs in Devanagari; codes must be
+                non-negative
+            longest_first (bool): Prefer longer endings over table order
+        """
+        table = [(ending, code) for ending, code in endings if ending]
+        if longest_first:
+            table.sort(key=lambda entry: -len(entry[0]))
+
+        # A repeated ending can never win after its first occurrence
+        ranked = {}
+        for ending, code in table:
+            ranked.setdefault(ending, (len(ranked), code))
+
+        self.width = max(map(len, ranked), default=1)
+        codes = [code for _, code in ranked.values()] or [0]
+        self.dtype = np.int16 if max(codes) < np.iinfo(np.int16).max else np.int32
+
+        by_length = {}
+        for ending, (rank, code) in ranked.items():
+            by_length.setdefault(len(ending), []).append((ending, rank, code))
+        self._groups = []
+        for length, group in sorted(by_length.items(), reverse=True):
+            keys = _row_keys(pack_tokens([ending for ending, _, _ in group], length))
+            order = np.argsort(keys, kind="stable")
+            self._groups.append((
+                length,
+                keys[order],
+                np.array([rank for _, rank, _ in group], dtype=np.int32)[order],
+                np.array([code for _, _, code in group], dtype=self.dtype)[order],
+            ))
+
+    def classify(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        Classify the rows of a matrix from pack_tokens().
+
+        Args:
+            matrix (np.ndarray): Packed tokens, at least ``self.width`` wide
+
+        Returns:
+            np.ndarray: Code of each token, NOT_IDENTIFIED where no ending
+            matches
+
+        Raises:
+            ValueError: If the matrix is narrower than the longest ending
+        """
+        if matrix.shape[1] < self.width:
+            raise ValueError(f"tokens must be packed at least {self.width} wide")
+        codes = np.full(matrix.shape[0], NOT_IDENTIFIED, dtype=self.dtype)
+        best = np.full(matrix.shape[0], np.iinfo(np.int32).max, dtype=np.int32)
+        for length, keys, ranks, key_codes in self._groups:
+            tails = _row_keys(matrix[:, -length:])
+            position = np.searchsorted(keys, tails)
+            np.minimum(position, len(keys) - 1, out=position)
+            better = (keys[position] == tails) & (ranks[position] < best)
+            codes[better] = key_codes[position[better]]
+            best[better] = ranks[position[better]]
+        return codes
+
+    def iter_classify(self, tokens: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[np.ndarray]:
+        """Classify tokens a chunk at a time, yielding one code array per chunk."""
+        for chunk in iter_chunks(tokens, chunk_size):
+            yield self.classify(pack_tokens(chunk, self.width))
+
+    def classify_tokens(self, tokens: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> np.ndarray:
+        """
+        Classify tokens, packing them ``chunk_size`` at a time so memory stays
+        bounded for any corpus size.
+
+        Args:
+            tokens: Tokens in Devanagari
+            chunk_size (int): Tokens packed per step
+
+        Returns:
+            np.ndarray: Code of each token, NOT_IDENTIFIED where no ending
+            matches
+        """
+        chunks = list(self.iter_classify(tokens, chunk_size))
+        return np.concatenate(chunks) if chunks else np.empty(0, dtype=self.dtype)
+
+
+@lru_cache(maxsize=None)
+def tense_classifier() -> EndingClassifier:
+    """
+    Classifier over TENSE_ENDINGS; each code is ``lakara * len(PADA_NAMES) +
+    pada`` with the codes of detect_tense_and_pada_many().
+    """
+    from . import PADA_NAMES, TENSE_ENDINGS
+
+    return EndingClassifier(
+        (ending, lakara * len(PADA_NAMES) + PADA_NAMES.index(pada))
+        for lakara, pada_data in enumerate(TENSE_ENDINGS.values())
+        for pada, endings in pada_data.items()
+        for ending in endings
+    )
+
+
+def classify_tenses(tokens: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tense and pada codes of many tokens, as the ``lakara`` and ``pada``
+    columns of detect_tense_and_pada_many() (indexes into TENSE_NAMES and
+    PADA_NAMES, NOT_IDENTIFIED where no ending matches).
+
+    Args:
+        tokens: Verb forms in Devanagari
+        chunk_size (int): Tokens packed per step
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: int8 lakara and pada columns
+    """
+    from . import PADA_NAMES
+
+    codes = tense_classifier().classify_tokens(tokens, chunk_size)
+    found = codes != NOT_IDENTIFIED
+    lakara = np.where(found, codes // len(PADA_NAMES), NOT_IDENTIFIED).astype(np.int8)
+    pada = np.where(found, codes % len(PADA_NAMES), NOT_IDENTIFIED).astype(np.int8)
+    return lakara, pada
+
+
+@lru_cache(maxsize=None)
+def pratyaya_classifier() -> EndingClassifier:
+    """Classifier whose codes are indexes into PRATYAYA_LIST, longest match first."""
+    from .morphological_analyzer import PRATYAYA_LIST
+
+    return EndingClassifier((pratyaya, code) for code, pratyaya in enumerate(PRATYAYA_LIST))
+
+
+def classify_pratyayas(tokens: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> np.ndarray:
+    """
+    For each token, the index into PRATYAYA_LIST of the suffix
+    identify_pratyaya() returns, or NOT_IDENTIFIED.
+
+    Args:
+        tokens: Words in Devanagari
+        chunk_size (int): Tokens packed per step
+    """
+    return pratyaya_classifier().classify_tokens(tokens, chunk_size)
+
+
+@lru_cache(maxsize=None)
+def _role_classifiers() -> Tuple[EndingClassifier, ...]:
+    from .sanskrit_hindi_accessor import GRAMMATICAL_ROLES
+
+    return tuple(EndingClassifier((marker, 0) for marker in markers)
+                 for markers in GRAMMATICAL_ROLES.values())
+
+
+def case_role_flags(tokens: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> np.ndarray:
+    """
+    Grammatical roles of many tokens by their case markers, as found by
+    enhanced_dependency_resolution().
+
+    Args:
+        tokens: Words in Devanagari
+        chunk_size (int): Tokens packed per step
+
+    Returns:
+        np.ndarray: Boolean matrix with one row per token and one column
+        per role, in GRAMMATICAL_ROLES order
+    """
+    classifiers = _role_classifiers()
+    width = max(classifier.width for classifier in classifiers)
+    chunks: List[np.ndarray] = []
+    for chunk in iter_chunks(tokens, chunk_size):
+        matrix = pack_tokens(chunk, width)
+        chunks.append(np.column_stack([
+            classifier.classify(matrix) != NOT_IDENTIFIED for classifier in classifiers
+        ]))
+    return np.concatenate(chunks) if chunks else np.zeros((0, len(classifiers)), dtype=bool)
@@ -0,0 +1,131 @@
+"""
+Reverse conjugation index: surface verb form -> every exact analysis.
+
+build_verb_index() generates the finite forms of a list of roots (see
+morphology.finite_forms) and writes them to a file sorted by form.
+VerbFormIndex memory-maps that file, so any number of processes share one
+copy through the page cache and nothing is parsed at load time. A lookup
+is a binary search over the offset table; results are kept in a bounded
+LRU cache, so repeated lookups are a single dict hit.
+
+The file is a packed file (see the packed module) with one table: the key
+of each record is the form, its payload the root and the four feature codes
+(lakara, pada, purusha, vachana as u8).
+
+Records of the same form are adjacent, so all analyses of a form are one
+contiguous run.
+"""
+
+import struct
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from .conjugation import LAKARAS, PADAS, PURUSHAS, VACHANAS
+from .morphology import finite_forms
+from .packed import PackedFile, pack_string, unpack_string, write_packed
+from .parallel import ordered_map
+from .transliteration import iast_to_devanagari
+
+MAGIC = b"SGVI"
+VERSION = 2
+
+_CODES = struct.Struct("<4B")
+
+
+class VerbAnalysis(NamedTuple):
+    """One analysis of a verb form."""
+    dhatu: str
+    lakara: str
+    pada: str
+    purusha: str
+    vachana: str
+
+
+def _index_records(dhatu: str) -> List[Tuple[bytes, bytes]]:
+    """Encode the finite forms of one root as (form, payload) records."""
+    packed_dhatu = pack_string(dhatu)
+    return [
+        (form.encode("utf-8"), packed_dhatu + _CODES.pack(lakara, pada, purusha, vachana))
+        for lakara, pada, purusha, vachana, form in finite_forms(dhatu)
+    ]
+
+
+def build_verb_index(dhatus: Iterable[str], path: str, workers: Optional[int] = 1) -> int:
+    """
+    Build the reverse index of every finite form of the given roots.
+
+    Args:
+        dhatus: Iterable of verb roots, in Devanagari or IAST
+        path (str): File to write
+        workers: Processes generating forms; None for one per CPU
+
+    Returns:
+        int: Number of (form, analysis) records written
+    """
+    roots = dict.fromkeys(iast_to_devanagari(dhatu) for dhatu in dhatus)
+    records = set()
+    for shard in ordered_map(_index_records, roots, workers):
+        records.update(shard)
+    write_packed(path, MAGIC, VERSION, [records])
+    return len(records)
+
+
+class VerbFormIndex:
+    """
+    Read-only, memory-mapped reverse conjugation index.
+
+    Use as a context manager, or call close() when done.
+    """
+
+    def __init__(self, path: str, cache_size: Optional[int] = 65536):
+        """
+        Args:
+            path (str): File written by build_verb_index()
+            cache_size: Lookups kept in the LRU cache; None for unbounded
+
+        Raises:
+            ValueError: If the file is not a verb index of this version
+        """
+        self._file = PackedFile(path, MAGIC, VERSION)
+        self._table = self._file.tables[0]
+        self._cached = lru_cache(maxsize=cache_size)(self._lookup)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        """Release the mapping."""
+        self._cached.cache_clear()
+        self._file.close()
+
+    def _analysis_at(self, index: int) -> VerbAnalysis:
+        buffer = self._file.buffer
+        dhatu, position = unpack_string(buffer, self._table.payload_position(index))
+        lakara, pada, purusha, vachana = _CODES.unpack_from(buffer, position)
+        return VerbAnalysis(dhatu, LAKARAS[lakara], PADAS[pada], PURUSHAS[purusha], VACHANAS[vachana])
+
+    def _lookup(self, form: str) -> Tuple[VerbAnalysis, ...]:
+        key = iast_to_devanagari(form).encode("utf-8")
+        return tuple(self._analysis_at(index) for index in self._table.find(key))
+
+    def lookup(self, form: str) -> Tuple[VerbAnalysis, ...]:
+        """
+        Return every analysis of an exact surface form.
+
+        Args:
+            form (str): Verb form, in Devanagari or IAST
+
+        Returns:
+            Tuple[VerbAnalysis, ...]: Analyses in index order; empty if the
+            form is not in the index
+        """
+        return self._cached(form)
+
+    def __contains__(self, form: str) -> bool:
+        return bool(self._cached(form))
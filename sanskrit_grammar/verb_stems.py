@@ -0,0 +1,86 @@
+"""
+Derivation of लकार-specific verb stems.
+
+The rules run once per root when the root lexicon is compiled (see
+dhatu_db), and the stems are stored in the lexicon file; they are applied
+at generation time only to roots the lexicon does not list. The present
+system of a lexicon root is built on the present stem listed with it.
+"""
+
+from typing import Optional, Tuple
+
+from .conjugation import LAKARAS
+from .encoding import VOWELS, decode, encode
+
+# Stems that are not derived by rule, keyed by (dhatu, lakara)
+VERB_STEM_EXCEPTIONS = {
+    ('भू', 'lat'): 'भव',
+    ('भू', 'lot'): 'भव',
+    ('नी', 'lot'): 'नय',
+}
+
+# Replacement of a root's final vowel in SLP1: guna, then the glide and
+# the thematic vowel (नी -> नय, भु -> भव, कृ -> कर)
+_STEM_FINALS = {
+    'lat': {'i': 'aya', 'I': 'aya', 'u': 'ava', 'U': 'ava', 'f': 'ara', 'F': 'ara'},
+    'lot': {'i': 'aya', 'I': 'aya', 'u': 'ava', 'U': 'ava'},
+}
+
+# Codes of the लकारs that have stem rules, by name
+STEM_CODES = {'लट्': 'lat', 'लोट्': 'lot'}
+
+# लकारs built on the present stem
+PRESENT_SYSTEM = ('लट्', 'लङ्', 'लोट्', 'विधिलिङ्')
+
+_VIRAMA = '्'
+
+
+def thematic_stem(stem: str) -> str:
+    """Return a present stem as the thematic endings join it: without a final virama (अद् -> अद)."""
+    return stem[:-1] if stem.endswith(_VIRAMA) else stem
+
+
+def derive_verb_stem(dhatu: str, lakara: str) -> str:
+    """
+    Derive the stem of a root for one लकार.
+
+    Args:
+        dhatu (str): The verb root (धातु), in Devanagari
+        lakara (str): Code ('lat', 'lot') or name ('लट्') of the लकार
+
+    Returns:
+        str: The stem; the root itself where no rule applies
+    """
+    lakara = STEM_CODES.get(lakara, lakara)
+    stem = VERB_STEM_EXCEPTIONS.get((dhatu, lakara))
+    if stem is not None:
+        return stem
+
+    finals = _STEM_FINALS.get(lakara)
+    if finals is None:
+        return dhatu
+
+    # Roots ending in a vowel after a consonant take guna
+    encoded = encode(dhatu)
+    final = finals.get(encoded[-1:])
+    if final is None or len(encoded) < 2 or encoded[-2] in VOWELS:
+        return dhatu
+    return decode(encoded[:-1] + final)
+
+
+def derive_lakara_stems(dhatu: str, present: Optional[str] = None) -> Tuple[str, ...]:
+    """
+    Derive the stems of a root for every लकार.
+
+    Args:
+        dhatu (str): The verb root (धातु), in Devanagari
+        present: The root's present stem (e.g. गच्छ for गम्), used for the
+            लकारs of PRESENT_SYSTEM; None to derive those by rule too
+
+    Returns:
+        Tuple[str, ...]: One stem per entry of conjugation.LAKARAS
+    """
+    if present is not None:
+        present = thematic_stem(present)
+    return tuple(present if present is not None and lakara in PRESENT_SYSTEM else derive_verb_stem(dhatu, lakara)
+                 for lakara in LAKARAS)
@@ -0,0 +1,117 @@
+"""
+Sandhi-viccheda (सन्धि-विच्छेद): splitting joined words by reversing sandhi.
+
+Every rule ``(final, initial) -> replacement`` of a SandhiRuleTable leaves
+``replacement`` at the join point, so candidate split points are exactly
+the occurrences of rule outputs inside a word. SandhiSplitter indexes all
+outputs of a table in a single Aho-Corasick automaton over the SLP1
+encoding (one symbol per phoneme), scans a word once and yields every candidate lazily, in time linear in
+the word length plus the number of candidates.
+"""
+
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+from .sandhi import SandhiRuleTable, WORD_JOINS
+from .encoding import decode, encode
+
+
+class SandhiSplit(NamedTuple):
+    """One candidate split: the two words and the rule that joined them."""
+    left: str
+    right: str
+    rule: Tuple[str, str, str]
+
+
+class SandhiSplitter:
+    """
+    Multi-pattern index over the outputs of a SandhiRuleTable.
+
+    Rules with an empty output cannot be located in a word and are skipped.
+    Matching runs on SLP1-encoded words; each match carries the rule's
+    encoded ``(final, initial)`` and its rendering as Devanagari text.
+    """
+
+    def __init__(self, table: SandhiRuleTable):
+        # Rules grouped by the encoded text they leave behind
+        rules_by_output: Dict[str, List[Tuple[str, str, Tuple[str, str, str]]]] = {}
+        for (final, initial), replacement in table.items():
+            if replacement:
+                text = (decode(final), decode(initial), decode(replacement))
+                rules_by_output.setdefault(replacement, []).append((final, initial, text))
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Rules matched on reaching a state, longest output first
+        self._matches: List[tuple] = [()]
+
+        for output, rules in rules_by_output.items():
+            state = 0
+            for char in output:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._matches.append(())
+                state = next_state
+            self._matches[state] = tuple((len(output), rule) for rule in rules)
+
+        self._build_failure_links()
+
+    def _build_failure_links(self):
+        """Breadth-first construction of failure links and merged outputs."""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._matches[next_state] += self._matches[self._fail[next_state]]
+
+    def iter_matches(self, encoded: str) -> Iterator[tuple]:
+        """
+        Yield ``(start, end, rule)`` for every rule output found in an
+        SLP1-encoded word, where ``rule`` is ``(final, initial, text)``.
+
+        Matches are ordered by end position, longer outputs first at the
+        same position.
+        """
+        goto = self._goto
+        fail = self._fail
+        matches = self._matches
+        state = 0
+        for end, char in enumerate(encoded, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, rule in matches[state]:
+                yield end - length, end, rule
+
+    def iter_splits(self, word: str) -> Iterator[SandhiSplit]:
+        """
+        Yield every candidate split of ``word``.
+
+        Args:
+            word (str): The joined (samhita) word
+
+        Yields:
+            SandhiSplit: ``(left, right, (final, initial, replacement))``
+        """
+        encoded = encode(word)
+        for start, end, (final, initial, text) in self.iter_matches(encoded):
+            yield SandhiSplit(decode(encoded[:start] + final),
+                              decode(initial + encoded[end:]), text)
+
+
+# Splitter over the rules used by sandhi_handler
+WORD_SPLITTER = SandhiSplitter(WORD_JOINS)
+
+def iter_sandhi_splits(word: str) -> Iterator[SandhiSplit]:
+    """
+    Lazily yield every way ``word`` could be split by reversing sandhi_handler.
+    """
+    return WORD_SPLITTER.iter_splits(word)
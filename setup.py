@@ -10,7 +10,9 @@ setup(
     name='sanskrit-grammar',
     version='0.4.0',
     packages=find_packages(),
+    package_data={'sanskrit_grammar': ['data/*.tsv', 'data/*.bin']},
     install_requires=requirements,  # <- use the requirements here
+    extras_require={'numpy': ['numpy']},
     author='Saurabh Chandra Patel',
     author_email='vsaurabhaec@gmail.com',
     description='Python module provides functions to handle and manipulate various aspects of Sanskrit grammar, including word generation, prefixes etc',
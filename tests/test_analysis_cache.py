@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import sanskrit_grammar
+from sanskrit_grammar import analysis_cache, detect_tense_and_pada
+from sanskrit_grammar.analysis_cache import AnalysisCache, normalize_word, rule_sources, rule_version
+from sanskrit_grammar.corpus import analyze_corpus
+from sanskrit_grammar.morphological_analyzer import analyze_sanskrit_word
+
+TOKENS = ['गच्छति', 'प्रतिगच्छति', 'रामस्य', 'bhavanti', 'फलम्', 'परिभवति', 'नयति'] * 3
+
+
+class TestAnalysisCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'analyses.db')
+        self.cache = AnalysisCache(self.path)
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.directory)
+
+    def test_hits_match_direct_analysis(self):
+        self.assertIsNone(self.cache.get('morphology', 'गच्छति'))
+        first = self.cache.analyze_many('morphology', TOKENS)
+        self.assertEqual(first, [analyze_sanskrit_word(normalize_word(token)) for token in TOKENS])
+        self.assertEqual(len(self.cache), len(set(TOKENS)))
+        with mock.patch.object(analysis_cache, 'get_analyzer', side_effect=AssertionError):
+            self.assertEqual(self.cache.analyze_many('morphology', TOKENS), first)
+        self.assertEqual(self.cache.analyze('tense', 'गच्छति'), detect_tense_and_pada('गच्छति'))
+        self.assertIs(sanskrit_grammar.AnalysisCache, AnalysisCache)
+
+    def test_iast_and_devanagari_share_an_entry(self):
+        self.cache.analyze('morphology', ' bhavanti ')
+        self.assertEqual(self.cache.get('morphology', 'भवन्ति'), analyze_sanskrit_word('भवन्ति'))
+        self.assertEqual(len(self.cache), 1)
+
+    def test_shared_between_connections(self):
+        self.cache.analyze_many('sandhi', TOKENS)
+        with AnalysisCache(self.path) as other:
+            self.assertEqual(other.get('sandhi', 'रामस्य')['split_words'], ['राम', 'स्य'])
+
+    def test_rule_change_invalidates(self):
+        self.cache.analyze_many('morphology', TOKENS)
+        self.assertNotEqual(rule_version('morphology'), rule_version('sandhi'))
+        with mock.patch.object(analysis_cache, 'rule_version', return_value='changed'):
+            self.assertIsNone(self.cache.get('morphology', 'गच्छति'))
+            self.cache.analyze('morphology', 'गच्छति')
+            self.assertEqual(self.cache.prune(), len(set(TOKENS)))
+        self.assertEqual(self.cache.prune(), 1)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_rule_sources_follow_imports(self):
+        def names(analysis):
+            return {os.path.basename(path) for path in rule_sources(analysis)}
+
+        self.assertLessEqual({'morphological_analyzer.py', 'lattice.py', 'segmentation.py', 'encoding.py',
+                              'dhatupatha.bin'}, names('morphology'))
+        self.assertLessEqual({'__init__.py', 'conjugation.py', 'encoding.py', 'dhatupatha.bin'}, names('tense'))
+        self.assertLessEqual({'sanskrit_hindi_accessor.py', 'encoding.py'}, names('sandhi'))
+        self.assertNotIn('analysis_cache.py', names('tense'))
+
+    def test_unknown_analysis(self):
+        with self.assertRaises(KeyError):
+            self.cache.analyze('x', 'गच्छति')
+
+    def test_corpus_workers_share_the_cache(self):
+        expected = list(analyze_corpus(TOKENS, analysis='tense'))
+        self.assertEqual(list(analyze_corpus(TOKENS, workers=2, chunksize=4, analysis='tense', cache=self.path)),
+                         expected)
+        self.assertEqual(len(self.cache), len(set(TOKENS)))
+        self.assertEqual(list(analyze_corpus(TOKENS, chunksize=5, analysis='tense', cache=self.path)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+from unittest import mock
+
+import sanskrit_grammar
+from sanskrit_grammar import (NOT_IDENTIFIED, PADA_NAMES, TENSE_NAMES, conjugate_dhatu, conjugate_verb,
+                              conjugate_verb_all_lakaras, detect_tense, detect_tense_and_pada,
+                              detect_tense_and_pada_many, detect_tense_and_pada_v0, generate_sanskrit_word,
+                              generate_sanskrit_words, match_tense_endings)
+from sanskrit_grammar.conjugation import (ENDINGS, LAKARAS, PADAS, PARADIGM_SIZE, PURUSHAS, TABLE_PERSONS,
+                                          THEMATIC_ENDINGS, VACHANAS, get_ending, get_endings)
+from sanskrit_grammar.morphology import generate_verb_forms
+
+
+class TestConjugationTable(unittest.TestCase):
+    def test_flat_immutable_table(self):
+        self.assertIsInstance(ENDINGS, tuple)
+        self.assertEqual(len(ENDINGS), len(LAKARAS) * len(PADAS) * PARADIGM_SIZE)
+        self.assertEqual(len(THEMATIC_ENDINGS), len(ENDINGS))
+
+    def test_lookup(self):
+        self.assertEqual(get_endings('लट्', 'परस्मैपद'),
+                         ('ति', 'तः', 'न्ति', 'सि', 'थः', 'थ', 'मि', 'वः', 'मः'))
+        self.assertEqual(get_ending('लोट्', 'परस्मैपद', 'उत्तम', 'एकवचन'), 'आनि')
+        self.assertIsNone(get_endings('लुट्', 'आत्मनेपद'))
+        self.assertIsNone(get_ending('लट्', 'परस्मैपद', 'उत्तम', 'x'))
+
+    def test_thematic_endings_replace_stem_vowel(self):
+        self.assertEqual(get_ending('लट्', 'आत्मनेपद', 'प्रथम', 'बहुवचन', thematic=True), 'न्ते')
+        self.assertEqual(get_ending('लट्', 'आत्मनेपद', 'प्रथम', 'द्विवचन', thematic=True), 'ेते')
+        self.assertEqual(get_ending('लोट्', 'परस्मैपद', 'उत्तम', 'एकवचन', thematic=True), 'आनि')
+
+
+class TestVerbApis(unittest.TestCase):
+    def test_tables_share_endings(self):
+        self.assertEqual(conjugate_dhatu('पठ')['उत्तम पुरुष'], ['पठमि', 'पठवः', 'पठमः'])
+        single = conjugate_verb('गच्छ', 'लोट्', 'आत्मनेपद')
+        self.assertEqual(single['मध्यमपुरुषः (Second Person)'][0], 'गच्छस्व')
+        self.assertEqual(conjugate_verb_all_lakaras('गच्छ', 'आत्मनेपद')['लोट्'], single)
+        self.assertEqual(list(conjugate_verb_all_lakaras('गच्छ', 'परस्मैपद')), list(LAKARAS))
+        self.assertEqual(conjugate_verb('गच्छ', 'x', 'परस्मैपद'), "Invalid tense (लकारः) or pada (पदः)!")
+
+    def test_all_lakaras_view_is_lazy(self):
+        view = conjugate_verb_all_lakaras('गच्छ', 'आत्मनेपद')
+        self.assertEqual(list(view), ['लट्', 'लङ्', 'लृट्', 'लोट्'])
+        self.assertEqual(view.cell('लट्', 'प्रथम', 'एकवचन'), 'गच्छते')
+        self.assertEqual(view._tables, {})
+        table = view['लट्']
+        self.assertIs(view['लट्'], table)
+        self.assertEqual(list(view._tables), ['लट्'])
+        self.assertNotIn('लुट्', view)
+        with self.assertRaises(KeyError):
+            view['लुट्']
+        self.assertEqual(len(conjugate_verb_all_lakaras('गच्छ', 'x')), 0)
+
+    def test_tables_use_lakara_stems(self):
+        atmanepada = conjugate_verb('भू', 'लट्', 'आत्मनेपद')
+        self.assertEqual(atmanepada['प्रथमपुरुषः (Third Person)'], ['भवते', 'भवेते', 'भवन्ते'])
+        self.assertEqual(atmanepada['उत्तमपुरुषः (First Person)'][0], 'भवे')
+        future = conjugate_verb('गम्', 'लृट्', 'परस्मैपद')
+        self.assertEqual(future['प्रथमपुरुषः (Third Person)'][0], 'गम्ष्यति')
+        view = conjugate_verb_all_lakaras('भू', 'आत्मनेपद')
+        self.assertEqual(view['लोट्']['उत्तमपुरुषः (First Person)'][1], 'भवावहै')
+        self.assertEqual(view.cell('लृट्', 'प्रथम', 'एकवचन'), 'भूष्यते')
+        for lakara in view:
+            for purusha, (label, _) in zip(PURUSHAS, TABLE_PERSONS):
+                self.assertEqual(view[lakara][label],
+                                 [generate_sanskrit_word('भू', lakara, purusha, vachana, 'आत्मनेपद')
+                                  for vachana in VACHANAS])
+
+    def test_generate_sanskrit_word(self):
+        self.assertEqual(generate_sanskrit_word('गच्छ', 'लट्', 'प्रथम', 'एकवचन', 'परस्मैपद'), 'गच्छति')
+        self.assertEqual(generate_sanskrit_word('गच्छ', 'लट्', 'प्रथम', 'बहुवचन', 'आत्मनेपद'), 'गच्छन्ते')
+        self.assertEqual(generate_sanskrit_word('गच्छ', 'लोट्', 'उत्तम', 'एकवचन', 'परस्मैपद'), 'गच्छानि')
+        self.assertTrue(generate_sanskrit_word('गच्छ', 'लट्', 'x', 'एकवचन', 'परस्मैपद').startswith('❌'))
+
+    def test_generate_sanskrit_words_matches_single_calls(self):
+        requests = [('गच्छ', 'लट्', 'प्रथम', 'एकवचन', 'परस्मैपद'),
+                    ('गम्', 'लोट्', 'उत्तम', 'एकवचन', 'परस्मैपद'),
+                    ('गम्', 'लृट्', 'प्रथम', 'एकवचन', 'परस्मैपद'),
+                    ('paṭh', 'लट्', 'प्रथम', 'बहुवचन', 'आत्मनेपद'),
+                    ('गच्छ', 'लुट्', 'प्रथम', 'एकवचन', 'आत्मनेपद'),
+                    ('गच्छ', 'लट्', 'x', 'एकवचन', 'परस्मैपद'),
+                    ('गच्छ', 'लट्', 'प्रथम', 'x', 'परस्मैपद'),
+                    ('गच्छ', 'लट्', 'प्रथम', 'एकवचन', 'परस्मैपद')]
+        words = generate_sanskrit_words(iter(requests))
+        self.assertNotIsInstance(words, list)
+        self.assertEqual(list(words), [generate_sanskrit_word(*request) for request in requests])
+        self.assertEqual(list(generate_sanskrit_words([])), [])
+
+    def test_generate_verb_forms_uses_thematic_endings(self):
+        forms = generate_verb_forms('सेव', 'a', 'lot')
+        self.assertEqual(forms['मध्यम']['द्विवचन'], 'सेवेथाम्')
+        self.assertEqual(generate_verb_forms('सेव', 'a', 'lit'), {'प्रथम': {}, 'मध्यम': {}, 'उत्तम': {}})
+
+
+class TestTenseDetection(unittest.TestCase):
+    def test_longest_ending_first(self):
+        matches = match_tense_endings('गमिष्यति')
+        self.assertEqual(matches[0], ('लृट् (Future Tense)', 'Parasmaipada', 'ष्यति'))
+        self.assertEqual(matches[-1], ('लट् (Present Tense)', 'Parasmaipada', 'ति'))
+        self.assertEqual(match_tense_endings('गच्छताम्'),
+                         [('लोट् (Imperative)', 'Parasmaipada', 'ताम्'),
+                          ('लोट् (Imperative)', 'Atmanepada', 'ताम्'),
+                          ('लङ् (Past Tense)', 'Parasmaipada', 'म्')])
+        self.assertEqual(match_tense_endings('राम'), [])
+
+    def test_detectors_agree(self):
+        self.assertEqual(detect_tense('gamiṣyati'), "The word 'गमिष्यति' is in लृट् (Future Tense).")
+        self.assertEqual(detect_tense_and_pada_v0('गच्छते'),
+                         "The word 'गच्छते' is in लट् (Present Tense) and follows Atmanepada (पद).")
+        self.assertEqual(detect_tense_and_pada('याचति'),
+                         "The word 'याचति' is in लट् (Present Tense) and follows Ubhayapada (उभयपद).")
+        self.assertEqual(detect_tense_and_pada('राम'), "Tense and Pada not identified.")
+
+    def test_many_returns_code_columns(self):
+        words = ['गमिष्यति', 'याचति', 'राम', 'gacchate', 'गमिष्यति']
+        columns = detect_tense_and_pada_many(words)
+        self.assertEqual([TENSE_NAMES[code] for code in columns.lakara[:2]],
+                         ['लृट् (Future Tense)', 'लट् (Present Tense)'])
+        self.assertEqual(columns.lakara[2], NOT_IDENTIFIED)
+        self.assertEqual(PADA_NAMES[columns.pada[3]], 'Atmanepada')
+        self.assertEqual(columns.ubhayapada.tolist(), [0, 1, 0, 0, 0])
+        self.assertEqual(columns.lakara[4], columns.lakara[0])
+        self.assertEqual(columns.lakara.itemsize, 1)
+
+    def test_many_memo_is_bounded(self):
+        words = ['गमिष्यति', 'याचति', 'राम', 'gacchate'] * 3
+        expected = detect_tense_and_pada_many(words)
+        with mock.patch.object(sanskrit_grammar, '_BATCH_MEMO_SIZE', 2):
+            self.assertEqual(detect_tense_and_pada_many(words), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
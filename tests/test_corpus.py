@@ -0,0 +1,39 @@
+import unittest
+
+import sanskrit_grammar
+from sanskrit_grammar.corpus import analyze_corpus
+from sanskrit_grammar.morphological_analyzer import analyze_sanskrit_word
+from sanskrit_grammar.parallel import ordered_map
+
+TOKENS = ['गच्छति', 'प्रतिगच्छति', 'रामस्य', 'bhavanti', 'फलम्', 'परिभवति', 'नयति'] * 5
+
+
+def _initialize(values):
+    values.append('ready')
+
+
+class TestAnalyzeCorpus(unittest.TestCase):
+    def test_results_in_input_order(self):
+        expected = [analyze_sanskrit_word(token) for token in TOKENS]
+        self.assertEqual(list(analyze_corpus(iter(TOKENS), chunksize=3)), expected)
+        self.assertEqual(list(analyze_corpus(TOKENS, workers=2, chunksize=4)), expected)
+        self.assertIs(sanskrit_grammar.analyze_corpus, analyze_corpus)
+
+    def test_sandhi_analysis(self):
+        results = list(analyze_corpus(TOKENS[:3], analysis='sandhi'))
+        self.assertEqual([result['original_word'] for result in results], TOKENS[:3])
+
+    def test_rejects_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            analyze_corpus(TOKENS, analysis='x')
+        with self.assertRaises(ValueError):
+            analyze_corpus(TOKENS, chunksize=0)
+
+    def test_initializer_runs_in_process(self):
+        values = []
+        self.assertEqual(list(ordered_map(len, ['ab'], initializer=_initialize, initargs=(values,))), [2])
+        self.assertEqual(values, ['ready'])
+
+
+if __name__ == '__main__':
+    unittest.main()
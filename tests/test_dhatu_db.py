@@ -0,0 +1,97 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from sanskrit_grammar import conjugate_verb, detect_tense_and_pada, generate_sanskrit_word
+from sanskrit_grammar.dhatu_db import (DATABASE_PATH, UBHAYAPADA, Dhatu, DhatuDatabase, compile_dhatupatha,
+                                       get_dhatu_database, present_stem, read_dhatupatha)
+from sanskrit_grammar.morphological_analyzer import analyze_sanskrit_word
+from sanskrit_grammar.morphology import finite_forms, generate_verb_forms, lakara_stems, modify_verb_stem
+from sanskrit_grammar.verb_stems import derive_lakara_stems, derive_verb_stem
+
+
+class TestDhatuDatabase(unittest.TestCase):
+    def test_shipped_file_matches_source(self):
+        handle, path = tempfile.mkstemp(suffix='.bin')
+        os.close(handle)
+        try:
+            count = compile_dhatupatha(destination=path)
+            with open(path, 'rb') as built, open(DATABASE_PATH, 'rb') as shipped:
+                self.assertEqual(built.read(), shipped.read())
+        finally:
+            os.remove(path)
+        self.assertEqual(len(get_dhatu_database()), count)
+
+    def test_lookup_and_find(self):
+        db = get_dhatu_database()
+        self.assertIn('गम्', db)
+        self.assertNotIn('गच्छ', db)
+        self.assertEqual(db.find('गच्छ'), (Dhatu('गम्', 1, 'परस्मैपद', ('गच्छ',), 'go'),))
+        self.assertEqual(db.find('गम्'), db.lookup('गम्'))
+        self.assertEqual([dhatu.gana for dhatu in db.lookup('विद्')], [2, 4, 6])
+        self.assertEqual(db.find('कुरु')[0].root, 'कृ')
+        self.assertEqual(db.find('xyz'), ())
+        self.assertIn('याच्', db.roots(UBHAYAPADA))
+        self.assertEqual(present_stem('गम्'), 'गच्छ')
+        self.assertEqual(present_stem('गच्छ'), 'गच्छ')
+
+    def test_lakara_stems_are_stored(self):
+        db = get_dhatu_database()
+        for root in db.roots():
+            self.assertEqual(db.lakara_stems(root), derive_lakara_stems(root, db.lookup(root)[0].stems[0]))
+        self.assertEqual(db.lakara_stems('नी')[:3], ('नय', 'नय', 'नी'))
+        self.assertEqual(db.lakara_stems('अद्')[0], 'अद')
+        self.assertIsNone(db.lakara_stems('गच्छ'))
+
+    def test_read_rejects_malformed_lines(self):
+        source = io.StringIO('# comment\nगम्\t1\tP\tगच्छ\tgo\nभू\t1\tX\tभव\tbe\n')
+        with self.assertRaises(ValueError):
+            list(read_dhatupatha(source))
+
+    def test_rejects_other_files(self):
+        with self.assertRaises(ValueError):
+            DhatuDatabase(os.path.join(os.path.dirname(DATABASE_PATH), 'dhatupatha.tsv'))
+
+
+class TestDhatuDatabaseConsumers(unittest.TestCase):
+    def test_analyzer_finds_root_through_stem(self):
+        self.assertEqual(analyze_sanskrit_word('गच्छति')['root'], 'गम्')
+        self.assertEqual(analyze_sanskrit_word('करोमि')['root'], 'कृ')
+        self.assertIsNone(analyze_sanskrit_word('रामः')['root'])
+
+    def test_ubhayapada_from_lexicon(self):
+        self.assertTrue(detect_tense_and_pada('करोति').endswith('Ubhayapada (उभयपद).'))
+        self.assertTrue(detect_tense_and_pada('लभते').endswith('Atmanepada (पद).'))
+        self.assertTrue(detect_tense_and_pada('निन्दति').endswith('Parasmaipada (पद).'))
+        self.assertTrue(detect_tense_and_pada('स्पर्धते').endswith('Atmanepada (पद).'))
+
+    def test_ubhayapada_through_present_stem(self):
+        # The longest ending is ष्यते, but मृष्य is the present stem of मृष्
+        self.assertTrue(detect_tense_and_pada('मृष्यते').endswith('Ubhayapada (उभयपद).'))
+        self.assertTrue(detect_tense_and_pada('नयति').endswith('Ubhayapada (उभयपद).'))
+
+    def test_verb_stems_are_looked_up(self):
+        with mock.patch('sanskrit_grammar.morphology.derive_verb_stem', side_effect=AssertionError), \
+                mock.patch('sanskrit_grammar.morphology.derive_lakara_stems', side_effect=AssertionError):
+            self.assertEqual(modify_verb_stem('नी', 'lat'), 'नय')
+            self.assertEqual(modify_verb_stem('गम्', 'lat'), 'गच्छ')
+            self.assertEqual(modify_verb_stem('नी', 'लोट्'), 'नय')
+            self.assertEqual(lakara_stems('कृ')[:3], ('करो', 'करो', 'कृ'))
+            self.assertTrue(finite_forms('भू'))
+        self.assertEqual(modify_verb_stem('सेव', 'lat'), derive_verb_stem('सेव', 'lat'))
+
+    def test_conjugators_accept_roots(self):
+        self.assertEqual(conjugate_verb('गम्', 'लट्', 'परस्मैपद'), conjugate_verb('गच्छ', 'लट्', 'परस्मैपद'))
+
+    def test_verb_paths_agree(self):
+        self.assertEqual(generate_verb_forms('गम्', 'p', 'lat')['प्रथम']['एकवचन'], 'गच्छति')
+        self.assertEqual(generate_verb_forms('नी', 'p', 'lat')['प्रथम']['एकवचन'], 'नयति')
+        for root in ('गम्', 'नी', 'अद्', 'कृ'):
+            self.assertEqual(generate_verb_forms(root, 'p', 'lat')['उत्तम']['बहुवचन'],
+                             generate_sanskrit_word(root, 'लट्', 'उत्तम', 'बहुवचन', 'परस्मैपद'))
+
+
+if __name__ == '__main__':
+    unittest.main()
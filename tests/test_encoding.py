@@ -0,0 +1,56 @@
+import unittest
+
+from sanskrit_grammar.encoding import MATRA_MARK, decode, encode, encode_rule, encode_text
+from sanskrit_grammar.morphology import modify_verb_stem
+from sanskrit_grammar.verb_stems import derive_verb_stem
+from sanskrit_grammar.samasa import form_samasa
+from sanskrit_grammar.sandhi import sandhi_handler
+
+
+class TestEncoding(unittest.TestCase):
+    WORDS = ['राम', 'वाक्', 'रामः', 'गच्छति', 'संपाठ', 'ज्ञान', 'कृष्णः', 'हँस',
+             'सोऽहम्', 'आइए', 'अग्नये', 'ऋषि']
+
+    def test_one_symbol_per_phoneme(self):
+        self.assertEqual(encode('राम'), 'rAma')
+        self.assertEqual(encode('वाक्'), 'vAk')
+        self.assertEqual(encode('गच्छति'), 'gacCati')
+        self.assertEqual(encode('कृष्णः'), 'kfzRaH')
+
+    def test_round_trip(self):
+        for word in self.WORDS:
+            self.assertEqual(decode(encode(word)), word)
+        text = ' '.join(self.WORDS)
+        self.assertEqual(decode(encode_text(text)), text)
+
+    def test_bare_matra_is_marked(self):
+        self.assertEqual(encode('ेन'), MATRA_MARK + 'ena')
+        self.assertEqual(decode(encode('ेन')), 'ेन')
+
+    def test_other_text_is_not_read_as_slp1(self):
+        for text in ['hello world', 'abc', "a~'", 'राम x']:
+            self.assertEqual(decode(encode(text)), text)
+        self.assertNotIn('a', encode('abc'))
+        self.assertEqual(sandhi_handler('abc', 'def'), 'abcdef')
+
+    def test_rule_notation(self):
+        self.assertEqual(encode_rule('म्'), 'm')
+        self.assertEqual(encode_rule('म'), 'm')
+        self.assertEqual(encode_rule('या'), 'yA')
+
+
+class TestEncodedEngines(unittest.TestCase):
+    def test_verb_stem_guna(self):
+        self.assertEqual(derive_verb_stem('नी', 'lat'), 'नय')
+        self.assertEqual(derive_verb_stem('कृ', 'lat'), 'कर')
+        self.assertEqual(derive_verb_stem('नी', 'lot'), 'नय')
+        self.assertEqual(derive_verb_stem('गम्', 'lat'), 'गम्')
+        # Lexicon roots take their listed present stem
+        self.assertEqual(modify_verb_stem('गम्', 'lat'), 'गच्छ')
+
+    def test_tatpurusa_drops_final_n(self):
+        self.assertEqual(form_samasa('राजन्', 'पुरुष', 'tatpurusa'), 'राजपुरुष')
+
+
+if __name__ == '__main__':
+    unittest.main()
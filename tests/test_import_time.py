@@ -0,0 +1,41 @@
+import json
+import subprocess
+import sys
+import unittest
+
+# Modules that must not be loaded by the bare package import: optional
+# dependencies, and standard-library machinery only some features need.
+# (Import time itself is measured by benchmarks/bench_import_time.py.)
+HEAVY_MODULES = ["pytesseract", "PIL", "matplotlib", "networkx", "sqlite3", "numpy",
+                 "concurrent.futures", "multiprocessing"]
+
+_PROBE = """
+import json, sys
+import sanskrit_grammar
+print(json.dumps([m for m in %r if m in sys.modules]))
+""" % (HEAVY_MODULES,)
+
+
+def loaded_after_import():
+    """Return the heavy modules loaded by `import sanskrit_grammar` in a fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+
+class TestImportTime(unittest.TestCase):
+    def test_heavy_modules_not_imported(self):
+        self.assertEqual(loaded_after_import(), [])
+
+    def test_lazy_attributes_resolve(self):
+        import sanskrit_grammar
+        self.assertIn("ocr_text_reaction", dir(sanskrit_grammar))
+        module = sanskrit_grammar.NNExpression
+        self.assertTrue(hasattr(module, "segment_nn_expression"))
+        with self.assertRaises(AttributeError):
+            sanskrit_grammar.does_not_exist
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from itertools import islice
+
+from sanskrit_grammar.lattice import Lattice, Segment
+from sanskrit_grammar.morphological_analyzer import best_segmentations, segmentation_lattice
+
+
+def chain(length):
+    """A lattice with two parallel edges (cost 0 and 1) per position: 2**length paths."""
+    lattice = Lattice(0, length)
+    for position in range(length):
+        for cost in (0, 1):
+            lattice.add_edge(position, position + 1, Segment(str(cost), 'x', position, position + 1), cost)
+    return lattice
+
+
+class TestLattice(unittest.TestCase):
+    def test_best_paths_in_cost_order(self):
+        lattice = chain(3)
+        self.assertEqual(lattice.count_paths(), 8)
+        paths = list(lattice.best_paths())
+        self.assertEqual([path.cost for path in paths], [0, 1, 1, 1, 2, 2, 2, 3])
+        self.assertEqual(len({tuple(s.kind for s in path.segments) for path in paths}), 8)
+        self.assertEqual(lattice.path(0).segments[0].kind, '0')
+        self.assertIsNone(lattice.path(8))
+
+    def test_best_k_is_lazy(self):
+        lattice = chain(40)
+        self.assertEqual(lattice.count_paths(), 2 ** 40)
+        paths = list(islice(lattice.best_paths(), 5))
+        self.assertEqual([path.cost for path in paths], [0, 1, 1, 1, 1])
+        self.assertLessEqual(max(len(found) for found, _, _ in lattice._paths.values()), 5)
+
+    def test_no_path(self):
+        lattice = Lattice(0, 2)
+        lattice.add_edge(0, 1, Segment('a', 'x', 0, 1), 1)
+        self.assertEqual(list(lattice.best_paths()), [])
+        self.assertEqual(lattice.count_paths(), 0)
+
+
+class TestSegmentationLattice(unittest.TestCase):
+    def test_upasarga_root_pratyaya(self):
+        best = best_segmentations('प्रतिगच्छति', 3)
+        self.assertEqual([(s.kind, s.text, s.root) for s in best[0].segments],
+                         [('upasarga', 'प्रति', None), ('root', 'गच्छ', 'गम्'), ('pratyaya', 'ति', None)])
+        self.assertEqual([s.kind for s in best[1].segments], ['stem'])
+        self.assertEqual(best_segmentations('bhavanti', 1)[0].segments[0].root, 'भू')
+
+    def test_every_candidate_is_available(self):
+        lattice = segmentation_lattice('रामस्य')
+        paths = list(lattice.best_paths())
+        self.assertEqual(len(paths), lattice.count_paths())
+        texts = [[s.text for s in path.segments] for path in paths]
+        self.assertIn(['राम', 'स्य'], texts)
+        self.assertEqual(texts.index(['राम', 'स्य']) + 1, texts.index(['रामस्', 'य']))
+        for path in paths:
+            self.assertEqual(''.join(s.text for s in path.segments), 'रामस्य')
+        self.assertEqual(best_segmentations(''), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,10 @@
 import unittest
-from sanskrit_grammar.morphological_analyzer import analyze_sanskrit_word, identify_pratyaya
+from unittest import mock
+
+from sanskrit_grammar import morphological_analyzer
+from sanskrit_grammar.morphological_analyzer import (PRATYAYA_INDEX, PRATYAYA_LIST, analyze_sanskrit_word,
+                                                     find_pratyayas, identify_pratyaya, identify_pratyaya_many,
+                                                     match_pratyayas, match_upasargas)
 
 class TestMorphologicalAnalyzer(unittest.TestCase):
     def test_analyze_sanskrit_word(self):
@@ -29,5 +34,40 @@ class TestMorphologicalAnalyzer(unittest.TestCase):
         result = analyze_sanskrit_word('xyz123')
         self.assertEqual(result, {})
 
+class TestAffixTries(unittest.TestCase):
+    def test_longest_upasarga_is_stripped(self):
+        result = analyze_sanskrit_word('प्रतिगच्छति')
+        self.assertEqual((result['prefix'], result['word'], result['root']), ('प्रति', 'गच्छति', 'गम्'))
+        self.assertEqual(analyze_sanskrit_word('परिभवति')['prefix'], 'परि')
+
+    def test_thematic_endings_reach_the_stem(self):
+        for word, root, suffix in [('भवामि', 'भू', 'आमि'), ('भवावः', 'भू', 'आवः'), ('भवामः', 'भू', 'आमः'),
+                                   ('गच्छामि', 'गम्', 'आमि'), ('पठामि', 'पठ्', 'आमि'),
+                                   ('लभामहे', 'लभ्', 'आमहे'), ('भवेते', 'भू', 'एते'), ('भवति', 'भू', 'ति')]:
+            result = analyze_sanskrit_word(word)
+            self.assertEqual((result['root'], result['suffix']), (root, suffix), word)
+
+    def test_all_matches_longest_first(self):
+        self.assertEqual(match_upasargas('प्रतिगच्छति'), ['प्रति', 'प्र'])
+        self.assertEqual(match_upasargas('गच्छति'), [])
+        self.assertEqual(match_pratyayas('रामस्य'), ['स्य', 'य'])
+        self.assertEqual(analyze_sanskrit_word('रामस्य')['additional_suffix'], 'स्य')
+
+class TestPratyayaIndex(unittest.TestCase):
+    def test_index_is_deduplicated(self):
+        self.assertEqual(len(PRATYAYA_LIST), len(set(PRATYAYA_LIST)))
+        self.assertEqual(PRATYAYA_INDEX['त्व'], ('krit', 'taddhita', 'sarvanama'))
+        self.assertIn('स्यति', PRATYAYA_INDEX)
+        self.assertNotIn('अनस्यति', PRATYAYA_INDEX)
+
+    def test_longest_and_all_matches(self):
+        self.assertEqual(identify_pratyaya('गच्छन्ति'), 'न्ति')
+        self.assertEqual(find_pratyayas('गच्छन्ति'), [('न्ति', ('dhatu',)), ('ति', ('vibhakti', 'dhatu'))])
+        self.assertIsNone(identify_pratyaya('गुरु'))
+        words = ['गच्छन्ति', 'पुरुषत्व', 'गुरु', 'गच्छन्ति']
+        self.assertEqual(identify_pratyaya_many(iter(words)), [identify_pratyaya(word) for word in words])
+        with mock.patch.object(morphological_analyzer, '_BATCH_MEMO_SIZE', 1):
+            self.assertEqual(identify_pratyaya_many(words * 2), [identify_pratyaya(word) for word in words * 2])
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,3 +1,8 @@
+import io
+
+import pytest
+
+from sanskrit_grammar import morphology
 from sanskrit_grammar.morphology import generate_noun_forms, generate_verb_forms
 
 def test_noun_declension():
@@ -64,6 +69,67 @@ def test_verb_conjugation():
         for number, form in numbers.items():
             print(f"  {number}: {form}")
 
+def test_stem_cache_counts_hits_and_evictions():
+    """Memoization is opt-in, bounded, and reports hits, misses and evictions."""
+    expected = generate_noun_forms("राम", "m")
+    assert morphology.cache_stats()["apply_stem_sandhi"].misses == 0
+
+    morphology.enable_cache(maxsize=8)
+    try:
+        assert generate_noun_forms("राम", "m") == expected
+        first = morphology.cache_stats()["apply_stem_sandhi"]
+        assert first.misses > 8 and first.evictions == first.misses - 8
+        assert first.currsize == 8
+
+        morphology.enable_cache(maxsize=64)
+        generate_noun_forms("राम", "m")
+        cold = morphology.cache_stats()["apply_stem_sandhi"]
+        generate_noun_forms("राम", "m")
+        warm = morphology.cache_stats()["apply_stem_sandhi"]
+        assert warm.misses == cold.misses
+        assert warm.hits == cold.hits + 24
+        assert warm.evictions == 0
+
+        generate_verb_forms("नी", "p", "lot")
+        generate_verb_forms("नी", "p", "lot")
+        assert morphology.cache_stats()["modify_verb_stem"].hits == 1
+    finally:
+        morphology.disable_cache()
+    assert morphology.cache_stats()["apply_stem_sandhi"].hits == 0
+
+def test_decline_many_matches_generate_noun_forms():
+    """Bulk declension yields the same paradigms as one stem at a time."""
+    stems = ["राम", "देव", "हरि", "गुरु", "वाक्", "नदी"]
+    for gender in ("m", "f", "n"):
+        table = morphology.decline_many(stems, gender)
+        assert len(table) == len(stems)
+        for index, stem in enumerate(stems):
+            assert table.paradigm(index) == generate_noun_forms(stem, gender)
+        assert table.form(0, 2, 0) == generate_noun_forms("राम", gender)["तृतीया"]["एकवचन"]
+
+    buffer = io.StringIO()
+    assert morphology.write_declensions(iter(stems), "m", buffer) == len(stems)
+    expected = io.StringIO()
+    morphology.decline_many(stems, "m").write_tsv(expected)
+    assert buffer.getvalue() == expected.getvalue()
+
+    with pytest.raises(ValueError):
+        morphology.decline_many(stems, "x")
+
+def test_generate_all_forms_is_deterministic():
+    """Every finite form is written once, in the same order for any worker count."""
+    dhatus = ["भू", "नी", "पठ", "seva"]
+    serial = io.StringIO()
+    count = morphology.generate_all_forms(dhatus, serial, workers=1, shard_size=1)
+    parallel = io.StringIO()
+    assert morphology.generate_all_forms(dhatus, parallel, workers=2, shard_size=1) == count
+    assert parallel.getvalue() == serial.getvalue()
+
+    rows = [line.split("\t") for line in serial.getvalue().splitlines()]
+    assert len(rows) == count == 4 * len(morphology.finite_forms("भू"))
+    assert rows[0] == ["भू", "0", "0", "0", "0", "भवति"]
+    assert ["सेव", "5", "1", "1", "1", "सेवेथाम्"] in rows
+
 if __name__ == "__main__":
     test_noun_declension()
     test_verb_conjugation()
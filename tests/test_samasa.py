@@ -1,4 +1,24 @@
-from sanskrit_grammar.samasa import form_samasa
+from sanskrit_grammar.samasa import DEFAULT_STEMS, apply_compound_sandhi, form_samasa, lexicon_trie, split_samasa
+from sanskrit_grammar.trie import Trie
+
+
+class CountingTrie(Trie):
+    """Lexicon that counts lookups of its root: split_samasa makes one per state it explores."""
+
+    def __init__(self, stems):
+        super().__init__()
+        self._root = lexicon_trie(stems).root
+        self.lookups = 0
+
+    @property
+    def root(self):
+        self.lookups += 1
+        return self._root
+
+    @root.setter
+    def root(self, node):
+        self._root = node
+
 
 def test_avyayibhava():
     """Test अव्ययीभाव compounds with edge cases."""
@@ -120,6 +140,49 @@ def test_bahuvrihi():
         result = form_samasa(first, second, "bahuvrihi")
         print(f"{first} + {second} = {result} # {description}")
 
+def test_split_samasa():
+    """Test compound splitting, including reversed compound sandhi."""
+    assert split_samasa("त्रिलोक") == [["त्रि", "लोक"]]
+    assert split_samasa("राजपुरुष")[:2] == [["राज", "पुरुष"], ["राजन्", "पुरुष"]]
+    assert split_samasa("महर्षि") == [["महत्", "ऋषि"], ["महा", "ऋषि"]]
+    assert split_samasa("प्रत्यग्नि") == [["प्रति", "अग्नि"]]
+    assert split_samasa("सप्तर्षिलोक") == [["सप्त", "ऋषि", "लोक"]]
+    assert split_samasa("राम") == []
+
+def test_split_samasa_roundtrip():
+    """Splitting a formed compound recovers its members."""
+    for first, second, samasa_type in [("त्रि", "लोक", "dvigu"), ("यथा", "शक्ति", "avyayibhava")]:
+        compound = form_samasa(first, second, samasa_type)
+        assert [first, second] in split_samasa(compound)
+
+def test_split_samasa_custom_lexicon():
+    """A caller-supplied lexicon replaces the default stems."""
+    assert split_samasa("कमलनयन", lexicon=["कमल", "नयन"]) == [["कमल", "नयन"]]
+    assert split_samasa("कमलनयन") == []
+
+def test_split_samasa_long_compound_is_bounded():
+    """40-character compounds are split within the state cap, which is never exceeded."""
+    compound = "राजपुरुषदेवदत्तरामलक्ष्मणशिवपार्वतीसूर्य"
+    assert len(compound) == 40
+    stems = CountingTrie(DEFAULT_STEMS)
+    splits = split_samasa(compound, lexicon=stems, max_states=200)
+    assert splits[0][:2] == ["राज", "पुरुष"]
+    assert 0 < stems.lookups <= 200
+    stems.lookups = 0
+    assert split_samasa(compound, lexicon=stems, max_states=5) == []
+    assert stems.lookups <= 5
+
+def test_t_before_palatal_sibilant():
+    """त् + श gives च्छ; त् stays before the other sibilants."""
+    assert apply_compound_sandhi("तत्", "शिव") == "तच्छिव"
+    assert apply_compound_sandhi("सत्", "सङ्ग") == "सत्सङ्ग"
+    assert split_samasa("तच्छिव", lexicon=["तत्", "शिव"]) == [["तत्", "शिव"]]
+
+def test_split_samasa_very_long_compound_does_not_recurse():
+    """Compounds far longer than the recursion limit are split iteratively."""
+    assert split_samasa("देव" * 600)[0] == ["देव"] * 600
+    assert split_samasa("देव" * 600, max_states=10) == []
+
 if __name__ == "__main__":
     test_avyayibhava()
     test_tatpurusa()
@@ -1,5 +1,8 @@
 import unittest
-from sanskrit_grammar.sandhi import sandhi_handler, apply_vowel_sandhi, apply_consonant_sandhi
+from sanskrit_grammar.sandhi import (
+    sandhi_handler, apply_vowel_sandhi, apply_consonant_sandhi, SandhiRuleTable,
+    apply_sandhi_many, iter_apply_sandhi
+)
 
 class TestSandhi(unittest.TestCase):
     def test_vowel_sandhi(self):
@@ -12,6 +15,12 @@ class TestSandhi(unittest.TestCase):
         self.assertEqual(apply_consonant_sandhi('वाक्', 'देवी'), 'वाग्देवी')
         self.assertEqual(apply_consonant_sandhi('तत्', 'कार'), 'तत्कार')
 
+    def test_rules_replace_phonemes(self):
+        self.assertEqual(sandhi_handler('वाक्', 'गच्छति'), 'वाग्गच्छति')
+        self.assertEqual(sandhi_handler('इति', 'आदि'), 'इत्यादि')
+        self.assertEqual(sandhi_handler('महा', 'उत्सव'), 'महोत्सव')
+        self.assertEqual(sandhi_handler('तत्', 'जल'), 'तज्जल')
+
     def test_sandhi_handler(self):
         # Test the main sandhi handler function
         self.assertEqual(sandhi_handler('राम', 'इति'), 'रामेति')
@@ -24,5 +33,36 @@ class TestSandhi(unittest.TestCase):
         with self.assertRaises(IndexError):
             sandhi_handler('word', '')
 
+class TestSandhiRuleTable(unittest.TestCase):
+    def test_single_probe_join(self):
+        table = SandhiRuleTable({('अ', 'इ'): 'ए'})
+        self.assertEqual(table.join('राम', 'इति'), 'रामेति')
+        self.assertEqual(table.join('वाक्', 'इति'), 'वाकिति')
+
+    def test_longest_context_wins(self):
+        table = SandhiRuleTable({('अत्', 'ऋ'): 'अर्', ('त्', 'ऋ'): 'X'})
+        self.assertEqual(table.lookup('महत्', 'ऋषि'), (2, 1, 'ar'))
+        self.assertEqual(table.join('महत्', 'ऋषि'), 'महर्षि')
+
+    def test_merged_precedence(self):
+        primary = SandhiRuleTable({('अ', 'अ'): 'अ'})
+        fallback = SandhiRuleTable({('अ', 'अ'): 'आ', ('अ', 'इ'): 'ए'})
+        merged = primary.merged(fallback)
+        self.assertEqual(merged.get('अ', 'अ'), 'अ')
+        self.assertEqual(merged.get('अ', 'इ'), 'ए')
+        self.assertEqual(len(merged), 2)
+
+class TestBatchSandhi(unittest.TestCase):
+    PAIRS = [('वाक्', 'देवी'), ('अ', 'इति'), ('क', 'ग'), ('राम', 'इति'), ('अ', 'इति')]
+
+    def test_matches_per_call_handler(self):
+        expected = [sandhi_handler(a, b) for a, b in self.PAIRS]
+        self.assertEqual(apply_sandhi_many(self.PAIRS), expected)
+        self.assertEqual(list(iter_apply_sandhi(iter(self.PAIRS))), expected)
+
+    def test_empty_word_in_batch(self):
+        with self.assertRaises(IndexError):
+            apply_sandhi_many([('राम', 'इति'), ('', 'इति')])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+from sanskrit_grammar.segmentation import CONSONANT, MATRA, MATRA_TO_VOWEL, VIRAMA, VOWEL, VOWEL_TO_MATRA, char_class
+from sanskrit_grammar.morphology import apply_stem_sandhi, generate_verb_forms
+
+
+class TestSegmentation(unittest.TestCase):
+    def test_char_classes(self):
+        self.assertEqual(char_class('अ'), VOWEL)
+        self.assertEqual(char_class('क'), CONSONANT)
+        self.assertEqual(char_class('ा'), MATRA)
+        self.assertEqual(char_class('्'), VIRAMA)
+
+    def test_matra_tables(self):
+        self.assertEqual(MATRA_TO_VOWEL['ि'], 'इ')
+        self.assertEqual(VOWEL_TO_MATRA['इ'], 'ि')
+        self.assertEqual(VOWEL_TO_MATRA['अ'], '')
+
+
+class TestPhonemeAwareJoins(unittest.TestCase):
+    def test_matra_ending_replaces_final_vowel(self):
+        self.assertEqual(apply_stem_sandhi('राम', 'ेन'), 'रामेन')
+        self.assertEqual(apply_stem_sandhi('राम', 'ौ'), 'रामौ')
+
+    def test_vowel_initial_ending(self):
+        forms = generate_verb_forms('भू', 'p', 'lot')
+        self.assertEqual(forms['उत्तम']['एकवचन'], 'भवानि')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import io
+import unittest
+
+from sanskrit_grammar import generate_samasa, conjugate_verb
+from sanskrit_grammar.samasa import form_samasa
+from sanskrit_grammar.transliteration import (
+    IAST, devanagari_to_iast, iast_to_devanagari, iter_transliterate, transliterate_file,
+)
+
+
+class TestTransliteration(unittest.TestCase):
+    def test_iast_to_devanagari(self):
+        self.assertEqual(iast_to_devanagari('rāma'), 'राम')
+        self.assertEqual(iast_to_devanagari('kṛṣṇa'), 'कृष्ण')
+        self.assertEqual(iast_to_devanagari('saṃskṛtam'), 'संस्कृतम्')
+        self.assertEqual(iast_to_devanagari('jñāna'), 'ज्ञान')
+        self.assertEqual(iast_to_devanagari('Aiśvarya'), 'ऐश्वर्य')
+
+    def test_variant_spellings(self):
+        self.assertEqual(iast_to_devanagari('kṛṣhṇa'), 'कृष्ण')
+        self.assertEqual(iast_to_devanagari('rāma'), 'राम')
+
+    def test_devanagari_to_iast(self):
+        for word in ['rāma', 'kṛṣṇa', 'saṃskṛtam', "so'ham", 'gacchati']:
+            self.assertEqual(devanagari_to_iast(iast_to_devanagari(word)), word)
+
+    def test_only_iast_runs_are_converted(self):
+        self.assertEqual(iast_to_devanagari('राम rāma'), 'राम राम')
+        self.assertEqual(iast_to_devanagari('example'), 'example')
+        self.assertEqual(devanagari_to_iast('Rama राम'), 'Rama rāma')
+
+    def test_stream_never_splits_words(self):
+        text = 'rāmaḥ vanaṃ gacchati kṛṣṇaś ca ' * 20
+        expected = iast_to_devanagari(text)
+        for size in (1, 2, 3, 7, 64):
+            chunks = [text[i:i + size] for i in range(0, len(text), size)]
+            self.assertEqual(''.join(iter_transliterate(chunks)), expected)
+
+    def test_transliterate_file(self):
+        source = io.StringIO('राम गच्छति\nकृष्णः\n' * 100)
+        destination = io.StringIO()
+        transliterate_file(source, destination, IAST, chunk_size=5)
+        self.assertEqual(destination.getvalue(), 'rāma gacchati\nkṛṣṇaḥ\n' * 100)
+
+
+class TestNormalizedInputs(unittest.TestCase):
+    def test_generate_samasa_accepts_iast(self):
+        self.assertEqual(generate_samasa('rāma', 'kṛṣhṇa', 'Dvandva'), 'रामकृष्ण')
+
+    def test_form_samasa_accepts_iast(self):
+        self.assertEqual(form_samasa('deva', 'ālaya', 'tatpurusa'), 'देवालय')
+
+    def test_conjugator_accepts_iast(self):
+        forms = conjugate_verb('gaccha', 'लट्', 'परस्मैपद')
+        self.assertEqual(forms['प्रथमपुरुषः (Third Person)'][0], 'गच्छति')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from sanskrit_grammar.trie import SuffixTrie, Trie
+
+
+class TestTrie(unittest.TestCase):
+    def setUp(self):
+        self.trie = Trie(["प्र", "प्रति", ("परि", "around")])
+
+    def test_membership_and_values(self):
+        self.assertIn("प्रति", self.trie)
+        self.assertNotIn("प्रत", self.trie)
+        self.assertEqual(self.trie.get("परि"), "around")
+        self.assertEqual(len(self.trie), 3)
+
+    def test_iter_prefixes_shortest_first(self):
+        ends = [end for end, _ in self.trie.iter_prefixes("प्रतिगच्छति")]
+        self.assertEqual(ends, [len("प्र"), len("प्रति")])
+
+    def test_longest_prefix(self):
+        self.assertEqual(self.trie.longest_prefix("प्रतिगच्छति"), (len("प्रति"), True))
+        self.assertIsNone(self.trie.longest_prefix("गच्छति"))
+
+
+class TestSuffixTrie(unittest.TestCase):
+    def setUp(self):
+        self.trie = SuffixTrie(["ति", ("ष्यति", "future")])
+
+    def test_membership_and_values(self):
+        self.assertIn("ष्यति", self.trie)
+        self.assertNotIn("यति", self.trie)
+        self.assertEqual(self.trie.get("ष्यति"), "future")
+
+    def test_iter_suffixes_shortest_first(self):
+        word = "गमिष्यति"
+        starts = [start for start, _ in self.trie.iter_suffixes(word)]
+        self.assertEqual(starts, [len(word) - len("ति"), len(word) - len("ष्यति")])
+        self.assertEqual(self.trie.longest_suffix(word), (len(word) - len("ष्यति"), "future"))
+        self.assertIsNone(self.trie.longest_suffix("गच्छतु"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -38,9 +38,14 @@ class TestUpasargaPratyaya(unittest.TestCase):
     def test_add_pratyaya_valid(self):
         """Test adding valid pratyayas."""
         test_cases = [
-            ("गम्", "अ", "गमअ", "कृत्"),     # Simple suffix
+            ("गम्", "अ", "गम", "कृत्"),      # Simple suffix
             ("कृ", "त", "कृत", "कृत्"),       # Past participle
-            ("नी", "तृ", "नीतृ", "कृत्")      # Agent noun
+            ("नी", "तृ", "नीतृ", "कृत्"),     # Agent noun
+            ("वेद", "इक", "वेदिक", "तद्धित"),  # Final अ replaced
+            ("गुरु", "त", "गुरुत", "कृत्"),    # Final vowel kept before a consonant
+            ("राम", "त", "रामत", "कृत्"),
+            ("कवि", "य", "कविय", "तद्धित"),
+            ("मधु", "त", "मधुत", "कृत्")
         ]
         
         for word, pratyaya, expected, pratyaya_type in test_cases:
@@ -0,0 +1,62 @@
+import unittest
+
+from sanskrit_grammar import detect_tense_and_pada_many
+from sanskrit_grammar.morphological_analyzer import PRATYAYA_LIST, identify_pratyaya
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if numpy is not None:
+    from sanskrit_grammar.sanskrit_hindi_accessor import GRAMMATICAL_ROLES, enhanced_dependency_resolution
+    from sanskrit_grammar.vectorized import (NOT_IDENTIFIED, EndingClassifier, case_role_flags, classify_pratyayas,
+                                             classify_tenses, pack_tokens)
+
+WORDS = ['गच्छति', 'गमिष्यति', 'गच्छताम्', 'गच्छते', 'अगच्छम्', 'रामः', 'रामेण', 'रामाय',
+         'रामात्', 'रामस्य', 'फलम्', 'राम', '', 'क', 'गच्छन्ति', 'भवन्तु', 'पठेयुः']
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestVectorizedEndings(unittest.TestCase):
+    def test_pack_tokens_right_aligns(self):
+        matrix = pack_tokens(['राम', '', 'गच्छति'], 4)
+        self.assertEqual(matrix.dtype, numpy.uint32)
+        self.assertEqual(matrix[0].tolist(), [0] + [ord(c) for c in 'राम'])
+        self.assertEqual(matrix[1].tolist(), [0, 0, 0, 0])
+        self.assertEqual(matrix[2].tolist(), [ord(c) for c in 'च्छति'[-4:]])
+        with self.assertRaises(ValueError):
+            pack_tokens(['राम'], 0)
+
+    def test_longest_or_first_match(self):
+        table = [('ति', 1), ('न्ति', 2), ('ति', 3)]
+        longest = EndingClassifier(table)
+        self.assertEqual(longest.classify_tokens(['गच्छन्ति', 'गच्छति', 'राम']).tolist(),
+                         [2, 1, NOT_IDENTIFIED])
+        first = EndingClassifier(table, longest_first=False)
+        self.assertEqual(first.classify_tokens(['गच्छन्ति'], chunk_size=1).tolist(), [1])
+        with self.assertRaises(ValueError):
+            longest.classify(pack_tokens(['ति'], 2))
+
+    def test_tenses_match_detect_tense_and_pada_many(self):
+        lakara, pada = classify_tenses(WORDS, chunk_size=4)
+        expected = detect_tense_and_pada_many(WORDS)
+        self.assertEqual(lakara.tolist(), expected.lakara.tolist())
+        self.assertEqual(pada.tolist(), expected.pada.tolist())
+
+    def test_pratyayas_match_identify_pratyaya(self):
+        codes = classify_pratyayas(WORDS)
+        found = [PRATYAYA_LIST[code] if code != NOT_IDENTIFIED else None for code in codes]
+        self.assertEqual(found, [identify_pratyaya(word) for word in WORDS])
+
+    def test_case_roles_match_enhanced_dependency_resolution(self):
+        flags = case_role_flags(WORDS, chunk_size=5)
+        roles = list(GRAMMATICAL_ROLES)
+        analysis = enhanced_dependency_resolution(WORDS)
+        for word, row in zip(WORDS, flags):
+            self.assertEqual([roles[i] for i in numpy.flatnonzero(row)], analysis[word]["grammatical_roles"])
+        self.assertEqual(case_role_flags([]).shape, (0, len(roles)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+
+from sanskrit_grammar.dhatu_db import get_dhatu_database
+from sanskrit_grammar.morphology import finite_forms
+from sanskrit_grammar.verb_index import VerbAnalysis, VerbFormIndex, build_verb_index
+
+
+class TestVerbFormIndex(unittest.TestCase):
+    DHATUS = ['भू', 'नी', 'गम्', 'paṭh']
+
+    @classmethod
+    def setUpClass(cls):
+        handle, cls.path = tempfile.mkstemp(suffix='.idx')
+        os.close(handle)
+        cls.count = build_verb_index(cls.DHATUS + ['भू'], cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.path)
+
+    def test_every_generated_form_is_indexed(self):
+        self.assertEqual(self.count, sum(len(finite_forms(d)) for d in ['भू', 'नी', 'गम्', 'पठ्']))
+        with VerbFormIndex(self.path) as index:
+            self.assertEqual(len(index), self.count)
+            for lakara, pada, purusha, vachana, form in finite_forms('नी'):
+                self.assertIn(form, index)
+
+    def test_exact_lookup_returns_all_analyses(self):
+        with VerbFormIndex(self.path) as index:
+            self.assertEqual(index.lookup('भवति'),
+                             (VerbAnalysis('भू', 'लट्', 'परस्मैपद', 'प्रथम', 'एकवचन'),))
+            self.assertEqual(index.lookup('नयति'),
+                             (VerbAnalysis('नी', 'लट्', 'परस्मैपद', 'प्रथम', 'एकवचन'),))
+            analyses = index.lookup('गच्छत')
+            self.assertIn(VerbAnalysis('गम्', 'लङ्', 'आत्मनेपद', 'प्रथम', 'एकवचन'), analyses)
+            self.assertIn(VerbAnalysis('गम्', 'लोट्', 'परस्मैपद', 'मध्यम', 'बहुवचन'), analyses)
+            self.assertEqual(index.lookup('paṭhati'), index.lookup('पठति'))
+            self.assertEqual(index.lookup('पठति')[0].dhatu, 'पठ्')
+            self.assertEqual(index.lookup('भव'), ())
+            self.assertEqual(index.lookup('गम्ति'), ())
+            self.assertNotIn('गच्छतितराम्', index)
+
+    def test_lexicon_index_resolves_attested_forms(self):
+        path = self.path + '.lexicon'
+        build_verb_index(get_dhatu_database().roots(), path)
+        try:
+            with VerbFormIndex(path) as index:
+                for form, root in [('गच्छति', 'गम्'), ('नयति', 'नी'), ('पठति', 'पठ्'), ('पिबति', 'पा'),
+                                   ('तिष्ठति', 'स्था')]:
+                    self.assertIn(VerbAnalysis(root, 'लट्', 'परस्मैपद', 'प्रथम', 'एकवचन'), index.lookup(form))
+                self.assertNotIn('गम्ति', index)
+                self.assertNotIn('नय्ति', index)
+        finally:
+            os.remove(path)
+
+    def test_rejects_other_files(self):
+        with open(self.path + '.bad', 'wb') as file:
+            file.write(b'not an index')
+        try:
+            with self.assertRaises(ValueError):
+                VerbFormIndex(self.path + '.bad')
+        finally:
+            os.remove(self.path + '.bad')
+
+
+if __name__ == '__main__':
+    unittest.main()
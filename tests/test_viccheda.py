@@ -0,0 +1,38 @@
+import unittest
+
+from sanskrit_grammar import sandhi_viched, iter_sandhi_viched, apply_sandhi
+from sanskrit_grammar.sandhi import SandhiRuleTable
+from sanskrit_grammar.viccheda import SandhiSplitter, iter_sandhi_splits
+
+
+class TestSandhiSplitter(unittest.TestCase):
+    def test_yields_every_candidate(self):
+        splitter = SandhiSplitter(SandhiRuleTable({('अ', 'इ'): 'ए', ('अ', 'ए'): 'ए', ('इ', 'इ'): 'ई'}))
+        splits = list(splitter.iter_splits('कएखई'))
+        self.assertEqual([(s.left, s.right) for s in splits], [
+            ('कअ', 'इखई'),
+            ('कअ', 'एखई'),
+            ('कएखइ', 'इ'),
+        ])
+        self.assertEqual(splits[0].rule, ('अ', 'इ', 'ए'))
+
+    def test_overlapping_outputs(self):
+        splitter = SandhiSplitter(SandhiRuleTable({('अ', 'ऋ'): 'अर्', ('ः', 'र'): 'र'}))
+        splits = [(s.left, s.right) for s in splitter.iter_splits('रामर्षि')]
+        self.assertIn(('राम', 'ऋषि'), splits)
+        self.assertIn(('रामः', 'र्षि'), splits)
+
+    def test_split_inverts_join(self):
+        joined = apply_sandhi('रामअ', 'उपरि')
+        self.assertIn(('रामअ', 'उपरि'), [(left, right) for left, right, _ in iter_sandhi_viched(joined)])
+
+    def test_is_lazy(self):
+        splits = iter_sandhi_splits('क' * 10000 + 'कग')
+        self.assertEqual(next(splits).rule, ('क्', 'अ', 'ग'))
+
+    def test_sandhi_viched_without_match(self):
+        self.assertEqual(sandhi_viched('कख'), ('कख', ''))
+
+
+if __name__ == '__main__':
+    unittest.main()